@@ -1,21 +1,58 @@
 import os
 import logging
+import threading
+import httplib2
+import google_auth_httplib2
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
 
 logger = logging.getLogger(__name__)
 
 
+class ThreadLocalRequestBuilder:
+    """스레드마다 인증된 HTTP 클라이언트를 하나씩 두고 요청에 사용하는 requestBuilder
+    
+    httplib2.Http는 스레드 간에 공유할 수 없으므로, 캐시된 서비스 객체를
+    여러 스레드에서 사용해도 각 스레드는 자신의 연결만 재사용합니다.
+    """
+    
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self.local = threading.local()
+    
+    def get_http(self):
+        http = getattr(self.local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self.local.http = http
+        return http
+    
+    def __call__(self, http, *args, **kwargs):
+        return HttpRequest(self.get_http(), *args, **kwargs)
+
+
 class GoogleAuthManager:
-    """Google API 인증을 관리하는 클래스"""
+    """Google API 인증을 관리하는 클래스
     
-    @staticmethod
-    def get_service(service_type, credentials_path, api_name, api_version,
+    생성한 서비스 객체는 (API, 버전, 스코프, 토큰 경로) 단위로 프로세스 안에 캐시하며,
+    인증 정보가 만료되면 서비스를 다시 만들지 않고 그 자리에서 갱신합니다.
+    """
+    
+    # (API, 버전, 스코프, 토큰 경로) -> (서비스 객체, 인증 정보)
+    _services = {}
+    # 같은 키의 토큰 갱신이 한 번만 일어나도록 키별로 두는 잠금
+    _refresh_locks = {}
+    # _services, _refresh_locks 조회/변경에만 사용 (네트워크 호출 중에는 잡지 않음)
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get_service(cls, service_type, credentials_path, api_name, api_version,
                     scopes=None):
         """
-        Google API 서비스 객체를 반환합니다.
+        Google API 서비스 객체를 반환합니다. (프로세스 단위 캐시)
         
         Args:
             service_type (str): 서비스 타입 ('youtube', 'gmail', 'forms')
@@ -50,6 +87,66 @@ class GoogleAuthManager:
         base_dir = os.path.dirname(credentials_path)
         token_path = os.path.join(base_dir, 'token.json')
         
+        cache_key = (api_name, api_version, tuple(sorted(scopes)), token_path)
+        with cls._lock:
+            cached = cls._services.get(cache_key)
+            refresh_lock = cls._refresh_locks.setdefault(cache_key, threading.Lock())
+        
+        if cached is not None:
+            service, creds = cached
+            if creds.valid:
+                return service
+            if creds.refresh_token:
+                # 갱신은 이 키의 잠금만 잡으므로 다른 서비스 조회는 기다리지 않음
+                with refresh_lock:
+                    if creds.valid:
+                        # 기다리는 동안 다른 스레드가 갱신함
+                        return service
+                    try:
+                        # 서비스와 스레드별 HTTP 클라이언트가 같은 인증 정보를 공유하므로 갱신만 하면 됨
+                        creds.refresh(Request())
+                        cls._save_token(token_path, creds)
+                        logger.info(f"{service_type} API 토큰 갱신 완료 (캐시된 서비스 재사용)")
+                        return service
+                    except Exception as e:
+                        logger.error(f"토큰 갱신 실패: {str(e)}")
+            # 갱신할 수 없으면 토큰 파일부터 다시 로드
+            with cls._lock:
+                if cls._services.get(cache_key) is cached:
+                    del cls._services[cache_key]
+        
+        # 토큰 로드와 브라우저 인증(run_local_server)은 잠금 없이 수행
+        creds = cls._load_credentials(credentials_path, token_path, scopes)
+        
+        # API 서비스 객체 생성 (패키지에 포함된 discovery 문서 사용)
+        service = build(
+            api_name, api_version, credentials=creds,
+            static_discovery=True,
+            requestBuilder=ThreadLocalRequestBuilder(creds)
+        )
+        with cls._lock:
+            # 그사이 다른 스레드가 만들어 둔 서비스가 있으면 그것을 사용
+            existing = cls._services.get(cache_key)
+            if existing is not None and existing[1].valid:
+                return existing[0]
+            cls._services[cache_key] = (service, creds)
+        logger.info(f"{service_type} API 서비스 객체 생성 완료")
+        return service
+    
+    @classmethod
+    def clear_cache(cls):
+        """캐시된 서비스 객체 삭제 (토큰 파일을 교체한 경우 등)"""
+        with cls._lock:
+            cls._services.clear()
+    
+    @staticmethod
+    def _save_token(token_path, creds):
+        with open(token_path, 'w') as token:
+            token.write(creds.to_json())
+    
+    @classmethod
+    def _load_credentials(cls, credentials_path, token_path, scopes):
+        """토큰 파일에서 인증 정보 로드 (만료 시 갱신, 없으면 로컬에서만 새로 인증)"""
         creds = None
         
         # 기존 토큰 파일이 있는지 확인
@@ -74,8 +171,7 @@ class GoogleAuthManager:
                     logger.info("토큰 갱신 성공")
                     
                     # 갱신된 토큰 저장
-                    with open(token_path, 'w') as token:
-                        token.write(creds.to_json())
+                    cls._save_token(token_path, creds)
                     logger.info("갱신된 토큰 저장 완료")
                     
                 except Exception as e:
@@ -97,11 +193,7 @@ class GoogleAuthManager:
                     creds = flow.run_local_server(port=0)
                     
                     # 토큰 저장
-                    with open(token_path, 'w') as token:
-                        token.write(creds.to_json())
+                    cls._save_token(token_path, creds)
                     logger.info("새 토큰 저장 완료")
         
-        # API 서비스 객체 생성
-        service = build(api_name, api_version, credentials=creds)
-        logger.info(f"{service_type} API 서비스 객체 생성 완료")
-        return service
\ No newline at end of file
+        return creds
\ No newline at end of file
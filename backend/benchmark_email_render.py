@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+이메일 렌더링 마이크로 벤치마크
+
+수신자별 이메일 HTML 생성 비용을 비교합니다.
+- 기존 방식: 수신자마다 CSS를 포함한 전체 문서를 f-string으로 다시 생성
+- 현재 방식: 미리 나눠 둔 고정 조각과 사용자별 값을 f-string 하나로 이어 붙임
+  (CSS 인라인과 틀 조립은 모듈을 불러올 때 한 번만 수행)
+- 참고: CSS 인라인을 메일마다 수행하는 경우
+
+사용법: python benchmark_email_render.py [수신자 수] (기본 10000)
+"""
+import os
+import sys
+import timeit
+import django
+from types import SimpleNamespace
+
+
+def legacy_render(service, user_name, current_date, content, subscriptions):
+    """기존 방식 재현 (CSS와 전체 문서를 매번 f-string으로 생성)"""
+    channel_list = []
+    for subscription in subscriptions:
+        channel_name = subscription.channel_name or subscription.youtube_channel_url
+        channel_list.append(f"• {channel_name}")
+    channels_text = "<br>".join(channel_list)
+    return f"""
+    <html>
+        <head>
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            {service._get_email_css()}
+        </head>
+        <body>
+            <div class="date-info" style="color: #666666; text-align: right; margin-bottom: 20px;">
+                발송일: {current_date}
+            </div>
+            
+            <div class="email-header" style="background-color: white; padding: 30px; border-bottom: 3px solid #d04a02; margin-bottom: 30px; text-align: center;">
+                <h1 style="margin: 0; color: #2d2d2d;">{user_name}님을 위한 오늘의 YouTube 콘텐츠 요약</h1>
+                <p style="margin: 10px 0 0 0; color: #666666;">구독하신 채널의 최신 콘텐츠를 AI가 요약했습니다</p>
+                <div style="margin-top: 15px; padding: 10px; background-color: #f8f9fa; border-radius: 5px;">
+                    <p style="margin: 0; color: #666666; font-size: 14px;"><strong>구독 채널 ({len(subscriptions)}개):</strong></p>
+                    <div style="margin-top: 5px; color: #888888; font-size: 13px;">{channels_text}</div>
+                </div>
+            </div>
+
+            <div class="content-section" style="margin: 20px 0;">
+                {content}
+            </div>
+            
+            <div class="email-footer" style="margin-top: 30px; padding: 20px; background-color: #f8f9fa; border-top: 3px solid #d04a02; text-align: center;">
+                <p style="color: #2d2d2d; margin: 5px 0;">이 메일은 자동으로 생성된 유튜브 콘텐츠 요약 서비스입니다.</p>
+                <p style="color: #2d2d2d; margin: 5px 0;">문의사항이 있으시면 답장해 주시기 바랍니다.</p>
+                <p style="color: #2d2d2d; margin: 5px 0;">감사합니다.</p>
+            </div>
+        </body>
+    </html>
+    """
+
+
+def run_benchmark(recipients: int = 10000):
+    """수신자 수만큼 렌더링하여 수신자당 평균 시간 출력"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE',
+                          'youtube_mail_project.settings')
+    django.setup()
+
+    from subscriptions.youtube_mail_service import YouTubeMailService
+    from subscriptions.email_templates import inline_email_css
+
+    # 외부 서비스 초기화 없이 렌더링 메서드만 사용
+    service = YouTubeMailService.__new__(YouTubeMailService)
+    subscriptions = [
+        SimpleNamespace(channel_name=f"채널 {index}", youtube_channel_url="")
+        for index in range(5)
+    ]
+    content = "<div class=\"channel-section\">요약 내용</div>" * 20
+    current_date = "2025-01-01"
+
+    renders = {
+        '기존 방식 (f-string 전체 생성)': lambda: legacy_render(
+            service, "사용자", current_date, content, subscriptions
+        ),
+        '미리 만든 틀 + 값 치환': lambda: service._create_summary_email_for_user(
+            "사용자", current_date, content, subscriptions
+        ),
+    }
+    # 두 방식을 번갈아 7회 측정해 각각 가장 빠른 값 사용 (첫 실행 지연, 다른 프로세스 등 잡음 제거)
+    results = {name: float('inf') for name in renders}
+    for _ in range(7):
+        for name, render in renders.items():
+            results[name] = min(results[name], timeit.timeit(render, number=recipients))
+    for name, elapsed in results.items():
+        print(f"{name}: 총 {elapsed * 1000:.1f}ms, 수신자당 {elapsed / recipients * 1e6:.2f}µs")
+
+    # 참고: CSS 인라인은 수신자당 수백 µs가 걸리므로 일부 수신자만 측정
+    reference_count = max(1, recipients // 100)
+    elapsed = min(timeit.repeat(lambda: inline_email_css(
+        service._create_summary_email_for_user("사용자", current_date, content, subscriptions)
+    ), number=reference_count, repeat=3))
+    print(f"(참고) 메일마다 CSS 인라인: 수신자당 {elapsed / reference_count * 1e6:.2f}µs")
+
+    baseline, current = results.values()
+    print(f"\n📊 수신자 {recipients:,}명 기준 기존 대비 {baseline / current:.2f}배")
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
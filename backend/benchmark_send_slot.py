@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+발송 시간대(슬롯) 실행 시간 벤치마크
+
+같은 구독 목록에 대해 발송 한 번에 걸리는 시간을 비교합니다.
+- 기존 방식 재현: EMAIL_LOG_BATCH_SIZE=1 (발송 로그 한 건마다 INSERT)
+- 현재 방식: 발송 로그를 모아 bulk_create (EMAIL_LOG_BATCH_SIZE, 기본 500)
+- 참고: 발송 대기열 경로 (대기열 추가 + 선점 + send_outbox_messages)
+
+메일은 locmem 백엔드로 보내고(Gmail API 사용 안 함),
+테스트 데이터베이스를 새로 만들어 측정한 뒤 삭제합니다.
+
+사용법: python benchmark_send_slot.py [구독 수] (기본 2000)
+"""
+import os
+import sys
+import time
+import django
+from datetime import datetime
+from unittest import mock
+
+
+def run_benchmark(subscription_count: int = 2000):
+    """구독 수만큼 메일을 발송하여 슬롯 실행 시간과 로그 저장 통계 출력"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE',
+                          'youtube_mail_project.settings')
+    django.setup()
+
+    import pytz
+    from django.db import connection
+    from django.test.utils import override_settings
+    from subscriptions.models import EmailLog, OutboxMessage, Subscription
+    from subscriptions.outbox import claim_messages, pending_message_ids
+    from subscriptions.youtube_mail_service import YouTubeMailService
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        Subscription.objects.bulk_create([
+            Subscription(
+                name=f"사용자 {index}",
+                email=f"user{index}@example.com",
+                youtube_channel_url='https://www.youtube.com/channel/UC0000000000000000000001',
+                notification_time='09:00',
+            )
+            for index in range(subscription_count)
+        ])
+        subscriptions = list(Subscription.objects.all())
+        content = "<div class=\"channel-section\">요약 내용</div>" * 20
+
+        # 외부 서비스 초기화 없이 발송 메서드만 사용
+        service = YouTubeMailService.__new__(YouTubeMailService)
+        service.last_send_stats = {}
+
+        def send_slot():
+            return service.send_summary_emails(subscriptions, content)
+
+        def send_outbox_slot():
+            scheduled_at = pytz.timezone('Asia/Seoul').localize(datetime(2026, 1, 1, 9, 0))
+            service.enqueue_summary_emails(subscriptions, scheduled_at)
+            service.send_outbox_messages(claim_messages(pending_message_ids(scheduled_at)))
+
+        results = {}
+        with override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'), \
+                mock.patch.object(YouTubeMailService, '_get_gmail_service', return_value=None):
+            for name, batch_size, run in [
+                ('기존 방식 (로그 한 건마다 INSERT)', 1, send_slot),
+                ('현재 방식 (로그 bulk_create)', None, send_slot),
+                ('(참고) 발송 대기열 경로', None, send_outbox_slot),
+            ]:
+                EmailLog.objects.all().delete()
+                OutboxMessage.objects.all().delete()
+                overrides = {'EMAIL_LOG_BATCH_SIZE': batch_size} if batch_size else {}
+                with override_settings(**overrides):
+                    started_at = time.perf_counter()
+                    run()
+                    elapsed = time.perf_counter() - started_at
+                results[name] = elapsed
+                stats = service.last_send_stats
+                print(
+                    f"{name}: {elapsed:.2f}초 "
+                    f"(로그 {stats.get('log_rows', 0)}건, {stats.get('log_flushes', 0)}회 저장 "
+                    f"{stats.get('log_write_seconds', 0)}초)"
+                )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    baseline, current = list(results.values())[:2]
+    print(f"\n📊 구독 {subscription_count:,}개 기준 기존 대비 {baseline / current:.2f}배")
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
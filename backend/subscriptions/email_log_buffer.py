@@ -0,0 +1,59 @@
+import logging
+import time
+from typing import Dict
+from .models import EmailLog
+
+logger = logging.getLogger(__name__)
+
+
+class EmailLogBuffer:
+    """발송 로그를 모아 bulk_create로 한 번에 저장하는 버퍼
+
+    batch_size개가 쌓일 때마다 저장하며, with 문으로 사용하면
+    발송 도중 예외가 나도 블록을 벗어날 때 남은 로그를 반드시 저장합니다.
+    """
+
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = max(1, batch_size)
+        self.pending = []
+        self.written = 0
+        self.flushes = 0
+        self.write_seconds = 0.0
+
+    def add(self, **fields) -> None:
+        """로그 한 건 추가 (EmailLog 필드)"""
+        self.pending.append(EmailLog(**fields))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """쌓인 로그 저장 (저장한 건수 반환)"""
+        if not self.pending:
+            return 0
+        rows, self.pending = self.pending, []
+        started_at = time.monotonic()
+        try:
+            EmailLog.objects.bulk_create(rows, batch_size=self.batch_size)
+        except Exception as e:
+            logger.error(f"이메일 로그 저장 실패 ({len(rows)}건): {str(e)}")
+            return 0
+        finally:
+            self.write_seconds += time.monotonic() - started_at
+        self.written += len(rows)
+        self.flushes += 1
+        return len(rows)
+
+    def stats(self) -> Dict:
+        """저장 건수, 저장 횟수, 저장에 걸린 시간"""
+        return {
+            'log_rows': self.written,
+            'log_flushes': self.flushes,
+            'log_write_seconds': round(self.write_seconds, 3),
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
@@ -0,0 +1,417 @@
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Tuple
+
+# 치환 위치 표시 ({{이름}})
+SLOT_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+# 인라인으로 옮길 수 있는 선택자 (태그, .클래스, #아이디 조합과 하위 선택자)
+SIMPLE_SELECTOR_PATTERN = re.compile(
+    r'^(?:[a-z][a-z0-9]*|\*)?(?:[.#][\w-]+)*$', re.IGNORECASE
+)
+SELECTOR_PART_PATTERN = re.compile(r'([.#]?)([\w*-]+)')
+
+# 기존 style 속성 (작은따옴표/큰따옴표/따옴표 없음)
+STYLE_ATTRIBUTE_PATTERN = re.compile(
+    r'''\sstyle\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+)''', re.IGNORECASE
+)
+
+# 닫는 태그가 없는 요소
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr',
+}
+
+
+def fill_slots(template: str, **fields) -> str:
+    """일부 치환 위치({{이름}})를 고정 값으로 채운 템플릿 (미리 렌더링용)"""
+    return SLOT_PATTERN.sub(
+        lambda match: str(fields.get(match.group(1), match.group(0))),
+        template
+    )
+
+
+def split_slots(template: str, slots: Tuple[str, ...]) -> List[str]:
+    """치환 위치 사이의 고정 조각 목록 (len(slots) + 1개)
+
+    렌더링 함수의 f-string이 조각과 값을 순서대로 이어 붙이므로,
+    템플릿의 치환 위치 순서가 slots와 다르면 빌드 단계에서 바로 실패시킵니다.
+    """
+    # 짝수 번째는 고정 조각, 홀수 번째는 치환 이름
+    pieces = SLOT_PATTERN.split(template)
+    if tuple(pieces[1::2]) != slots:
+        raise ValueError(f"템플릿 치환 위치가 예상과 다릅니다: {pieces[1::2]} != {list(slots)}")
+    return pieces[0::2]
+
+
+def _parse_compound(selector: str) -> Dict:
+    """'div.video-card' 같은 단순 선택자를 태그/클래스/아이디로 분해"""
+    compound = {'tag': None, 'classes': set(), 'id': None}
+    for prefix, name in SELECTOR_PART_PATTERN.findall(selector):
+        if prefix == '.':
+            compound['classes'].add(name)
+        elif prefix == '#':
+            compound['id'] = name
+        elif name != '*':
+            compound['tag'] = name.lower()
+    return compound
+
+
+def parse_css(css: str) -> Tuple[List[Dict], str]:
+    """CSS를 인라인할 수 있는 규칙과 남겨 둘 CSS(@media 등)로 분리
+
+    Returns:
+        ([{'parts': [...], 'specificity': (아이디, 클래스, 태그), 'order': int,
+           'declarations': [(속성, 값), ...]}, ...], 남은 CSS)
+    """
+    css = re.sub(r'</?style[^>]*>', '', css)
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    rules = []
+    remaining = []
+    position = 0
+    while True:
+        open_index = css.find('{', position)
+        if open_index < 0:
+            break
+        prelude = css[position:open_index].strip()
+        # 중첩된 중괄호까지 포함한 블록 끝 찾기
+        depth = 0
+        close_index = open_index
+        for close_index in range(open_index, len(css)):
+            if css[close_index] == '{':
+                depth += 1
+            elif css[close_index] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+        block = css[open_index + 1:close_index]
+        position = close_index + 1
+
+        if prelude.startswith('@'):
+            # @media 등은 인라인할 수 없으므로 남기되, 인라인 style보다 우선하도록 !important 추가
+            block = re.sub(r'(:[^;{}]*?)(?:\s*!important)?\s*;', r'\1 !important;', block)
+            remaining.append(f"{prelude} {{{block}}}")
+            continue
+
+        declarations = [
+            tuple(part.strip() for part in declaration.split(':', 1))
+            for declaration in block.split(';') if ':' in declaration
+        ]
+        for selector in prelude.split(','):
+            parts = selector.split()
+            if not parts or not all(SIMPLE_SELECTOR_PATTERN.match(part) for part in parts):
+                remaining.append(f"{selector.strip()} {{{block}}}")
+                continue
+            compounds = [_parse_compound(part) for part in parts]
+            rules.append({
+                'parts': compounds,
+                'specificity': (
+                    sum(1 for compound in compounds if compound['id']),
+                    sum(len(compound['classes']) for compound in compounds),
+                    sum(1 for compound in compounds if compound['tag']),
+                ),
+                'order': len(rules),
+                'declarations': declarations,
+            })
+    return rules, '\n'.join(remaining)
+
+
+def _matches(compound: Dict, element: Dict) -> bool:
+    return ((compound['tag'] is None or compound['tag'] == element['tag']) and
+            compound['classes'] <= element['classes'] and
+            (compound['id'] is None or compound['id'] == element['id']))
+
+
+class _StyleInliner(HTMLParser):
+    """시작 태그마다 일치하는 CSS 규칙을 style 속성으로 옮기는 파서
+
+    시작 태그만 바꿔 쓰고 나머지 내용(텍스트, 엔티티, 치환 위치)은 그대로 둡니다.
+    """
+
+    def __init__(self, rules: List[Dict]):
+        super().__init__(convert_charrefs=False)
+        self.rules = rules
+        self.stack = []
+        self.edits = []
+        self.line_offsets = [0]
+
+    def inline(self, html: str) -> str:
+        # getpos()의 (줄, 열)을 문자열 위치로 바꾸기 위한 줄 시작 위치
+        self.line_offsets.extend(match.end() for match in re.finditer('\n', html))
+        self.feed(html)
+        self.close()
+
+        result = []
+        position = 0
+        for start, end, text in self.edits:
+            result.append(html[position:start])
+            result.append(text)
+            position = end
+        result.append(html[position:])
+        return ''.join(result)
+
+    def handle_starttag(self, tag, attrs):
+        element = self._inline_tag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self._inline_tag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index]['tag'] == tag:
+                del self.stack[index:]
+                break
+
+    def _inline_tag(self, tag, attrs) -> Dict:
+        attributes = dict(attrs)
+        element = {
+            'tag': tag,
+            'classes': set((attributes.get('class') or '').split()),
+            'id': attributes.get('id'),
+        }
+        matched = sorted(
+            (rule for rule in self.rules if self._rule_matches(rule, element)),
+            key=lambda rule: (rule['specificity'], rule['order'])
+        )
+        if not matched:
+            return element
+
+        # 우선순위가 낮은 규칙부터 적용하고, 원래 있던 style 속성이 가장 우선
+        styles = {}
+        for rule in matched:
+            styles.update(rule['declarations'])
+        for declaration in (attributes.get('style') or '').split(';'):
+            if ':' in declaration:
+                name, value = declaration.split(':', 1)
+                styles[name.strip()] = value.strip()
+        # 큰따옴표는 style 속성을 끊으므로 작은따옴표로 변환 (font-family 등)
+        style = ' '.join(
+            f"{name}: {value};" for name, value in styles.items()
+        ).replace('"', "'")
+
+        tag_text = self.get_starttag_text()
+        if attributes.get('style') is not None:
+            new_text = STYLE_ATTRIBUTE_PATTERN.sub(
+                lambda match: f' style="{style}"', tag_text, count=1
+            )
+        else:
+            closing = '/>' if tag_text.endswith('/>') else '>'
+            new_text = f'{tag_text[:-len(closing)].rstrip()} style="{style}"{closing}'
+
+        line, column = self.getpos()
+        start = self.line_offsets[line - 1] + column
+        self.edits.append((start, start + len(tag_text), new_text))
+        return element
+
+    def _rule_matches(self, rule: Dict, element: Dict) -> bool:
+        parts = rule['parts']
+        if not _matches(parts[-1], element):
+            return False
+        # 하위 선택자: 나머지 부분을 가까운 조상부터 바깥쪽으로 찾음
+        ancestor_index = len(self.stack) - 1
+        for compound in reversed(parts[:-1]):
+            while ancestor_index >= 0 and not _matches(compound, self.stack[ancestor_index]):
+                ancestor_index -= 1
+            if ancestor_index < 0:
+                return False
+            ancestor_index -= 1
+        return True
+
+
+def inline_css(html: str, rules: List[Dict]) -> str:
+    """parse_css()로 만든 규칙을 요소의 style 속성으로 옮긴 HTML 반환
+
+    style 블록을 지우는 메일 클라이언트에서도 같은 모양이 되도록 하며,
+    @media 같은 규칙은 parse_css()가 돌려주는 남은 CSS로 따로 넣어야 합니다.
+    """
+    return _StyleInliner(rules).inline(html)
+
+
+# 이메일 공통 CSS
+EMAIL_CSS = """
+        <style>
+            .channel-section {
+                margin: 20px 0;
+                padding: 20px;
+                background-color: #f8f9fa;
+                border-radius: 8px;
+            }
+            
+            .channel-title {
+                color: #d04a02;
+                border-bottom: 2px solid #d04a02;
+                padding-bottom: 10px;
+                margin-bottom: 20px;
+            }
+            
+            .video-card {
+                margin: 15px 0;
+                padding: 15px;
+                background-color: white;
+                border-left: 4px solid #d04a02;
+                border-radius: 4px;
+            }
+            
+            .video-title {
+                color: #2d2d2d;
+                margin-bottom: 15px;
+            }
+            
+            .video-content {
+                margin: 10px 0;
+            }
+            
+            .content-block {
+                margin: 15px 0;
+            }
+            
+            .content-block h4 {
+                color: #d04a02;
+                margin-bottom: 10px;
+            }
+            
+            .content-block p,
+            .content-block ul {
+                color: #2d2d2d;
+                margin: 8px 0;
+            }
+            
+            .content-block ul {
+                padding-left: 20px;
+            }
+            
+            .content-block li {
+                margin: 5px 0;
+            }
+            
+            .video-link {
+                margin-top: 15px;
+            }
+            
+            .video-link a {
+                color: #d04a02;
+                text-decoration: none;
+                padding: 8px 0;
+                display: inline-block;
+            }
+            
+            @media screen and (max-width: 600px) {
+                .channel-section {
+                    padding: 15px;
+                    margin: 15px 0;
+                }
+                
+                .video-card {
+                    padding: 12px;
+                    margin: 12px 0;
+                }
+                
+                .video-title {
+                    font-size: 1.2em;
+                }
+                
+                .content-block h4 {
+                    font-size: 1.1em;
+                }
+                
+                .content-block ul {
+                    padding-left: 15px;
+                }
+                
+                .content-block p,
+                .content-block li {
+                    font-size: 0.95em;
+                }
+            }
+        </style>
+        """
+
+# 이메일 공통 틀 (head, CSS, 헤더, 푸터)
+EMAIL_SHELL_TEMPLATE = """
+        <html>
+            <head>
+                <meta name="viewport" content="width=device-width, initial-scale=1.0">
+                {{css}}
+            </head>
+            <body>
+                <div class="date-info" style="color: #666666; text-align: right; margin-bottom: 20px;">
+                    발송일: {{current_date}}
+                </div>
+                
+                <div class="email-header" style="background-color: white; padding: 30px; border-bottom: 3px solid #d04a02; margin-bottom: 30px; text-align: center;">
+                    <h1 style="margin: 0; color: #2d2d2d;">{{user_name}}님을 위한 오늘의 YouTube 콘텐츠 요약</h1>
+                    <p style="margin: 10px 0 0 0; color: #666666;">{{subtitle}}</p>
+                    <div style="margin-top: 15px; padding: 10px; background-color: #f8f9fa; border-radius: 5px;">
+                        <p style="margin: 0; color: #666666; font-size: 14px;"><strong>구독 채널 ({{channel_count}}개):</strong></p>
+                        <div style="margin-top: 5px; color: #888888; font-size: 13px;">{{channels_text}}</div>
+                    </div>
+                </div>
+
+                <div class="content-section" style="margin: 20px 0;">
+                    {{content}}
+                </div>
+                
+                <div class="email-footer" style="margin-top: 30px; padding: 20px; background-color: #f8f9fa; border-top: 3px solid #d04a02; text-align: center;">
+                    <p style="color: #2d2d2d; margin: 5px 0;">이 메일은 자동으로 생성된 유튜브 콘텐츠 요약 서비스입니다.</p>
+                    <p style="color: #2d2d2d; margin: 5px 0;">문의사항이 있으시면 답장해 주시기 바랍니다.</p>
+                    <p style="color: #2d2d2d; margin: 5px 0;">감사합니다.</p>
+                </div>
+            </body>
+        </html>
+        """
+
+# 새 콘텐츠가 없을 때 본문
+NO_CONTENT_MESSAGE = """<div class="no-content-message" style="text-align: center; padding: 30px; background-color: #f8f9fa; border-radius: 8px;">
+                        <h2 style="color: #666666;">새로운 업데이트가 없습니다</h2>
+                        <p style="color: #888888;">구독하신 채널에 어제 오전 7시 이후 업로드된 새로운 콘텐츠가 없습니다.</p>
+                        <p style="color: #888888;">다음 업데이트를 기다려주세요!</p>
+                    </div>"""
+
+# 빌드 단계 (모듈을 불러올 때 한 번만 실행): CSS 규칙을 인라인하고
+# 인라인할 수 없는 반응형(@media) 규칙만 style 블록으로 남김
+EMAIL_CSS_RULES, EMAIL_RESPONSIVE_CSS = parse_css(EMAIL_CSS)
+
+
+def inline_email_css(html: str) -> str:
+    """이메일 공통 CSS를 HTML 조각에 인라인 (채널 조각처럼 여러 메일에 재사용되는 HTML용)"""
+    return inline_css(html, EMAIL_CSS_RULES)
+
+
+EMAIL_SHELL = fill_slots(
+    inline_email_css(EMAIL_SHELL_TEMPLATE),
+    css=f"<style>\n{EMAIL_RESPONSIVE_CSS}\n</style>"
+)
+
+# 요약 이메일 고정 조각 (사용자 이름, 날짜, 구독 채널, 본문만 치환)
+SUMMARY_EMAIL_PARTS = split_slots(
+    fill_slots(EMAIL_SHELL, subtitle="구독하신 채널의 최신 콘텐츠를 AI가 요약했습니다"),
+    ('current_date', 'user_name', 'channel_count', 'channels_text', 'content')
+)
+
+# 콘텐츠 없음 이메일 고정 조각 (사용자 이름, 날짜, 구독 채널만 치환)
+NO_CONTENT_EMAIL_PARTS = split_slots(
+    fill_slots(
+        EMAIL_SHELL,
+        subtitle="구독하신 채널의 최신 콘텐츠를 확인했습니다",
+        content=inline_email_css(NO_CONTENT_MESSAGE)
+    ),
+    ('current_date', 'user_name', 'channel_count', 'channels_text')
+)
+
+
+def render_summary_email(user_name: str, current_date: str, channel_count: int,
+                         channels_text: str, content: str) -> str:
+    """미리 만들어 둔 요약 이메일 조각에 사용자별 값만 넣어 HTML 생성"""
+    head, after_date, after_name, after_count, after_channels, tail = SUMMARY_EMAIL_PARTS
+    return (f"{head}{current_date}{after_date}{user_name}{after_name}{channel_count}"
+            f"{after_count}{channels_text}{after_channels}{content}{tail}")
+
+
+def render_no_content_email(user_name: str, current_date: str, channel_count: int,
+                            channels_text: str) -> str:
+    """미리 만들어 둔 콘텐츠 없음 이메일 조각에 사용자별 값만 넣어 HTML 생성"""
+    head, after_date, after_name, after_count, tail = NO_CONTENT_EMAIL_PARTS
+    return (f"{head}{current_date}{after_date}{user_name}{after_name}{channel_count}"
+            f"{after_count}{channels_text}{tail}")
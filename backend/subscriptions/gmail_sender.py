@@ -0,0 +1,199 @@
+import base64
+import json
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Dict, List
+
+# Google API 클라이언트
+try:
+    import httplib2
+    from googleapiclient.errors import HttpError
+    GOOGLE_API_AVAILABLE = True
+except ImportError:
+    GOOGLE_API_AVAILABLE = False
+    logging.warning("Google API 클라이언트 라이브러리가 설치되지 않았습니다.")
+
+logger = logging.getLogger(__name__)
+
+# 발신자 주소
+GMAIL_SENDER_ADDRESS = 'admin@pwc-edge.com'
+
+# 재시도할 HTTP 상태 코드 (요청 제한: Gmail이 메일을 받기 전에 거절한 경우)
+RETRYABLE_STATUS_CODES = {429}
+
+# 403 응답 중 재시도할 오류 사유 (그 외 403은 권한 문제이므로 재시도하지 않음)
+RETRYABLE_403_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+
+def build_mime_message(to_email: str, subject: str, html_content: str,
+                       sender: str = None, headers: Dict[str, str] = None) -> bytes:
+    """HTML 메일 MIME 메시지 생성 (줄바꿈은 CRLF, sender가 없으면 From 헤더 생략)"""
+    message = MIMEMultipart('alternative')
+    if sender:
+        message['from'] = sender
+    message['to'] = to_email
+    message['subject'] = subject
+    for name, value in (headers or {}).items():
+        message[name] = value
+    message.attach(MIMEText(html_content, 'html', 'utf-8'))
+    return message.as_bytes(policy=message.policy.clone(linesep='\r\n'))
+
+
+def encode_raw_message(mime_message: bytes) -> str:
+    """MIME 메시지를 Gmail API 전송용 base64url 문자열로 변환"""
+    return base64.urlsafe_b64encode(mime_message).decode('ascii')
+
+
+def build_raw_message(to_email: str, subject: str, html_content: str) -> str:
+    """Gmail API 전송용 base64url 인코딩 메시지 생성"""
+    return encode_raw_message(
+        build_mime_message(to_email, subject, html_content, sender=GMAIL_SENDER_ADDRESS)
+    )
+
+
+class GmailSender:
+    """Gmail API로 여러 메일을 동시에 보내는 발송기
+
+    googleapiclient의 HTTP 객체(httplib2)는 스레드 간에 공유할 수 없으므로
+    GoogleAuthManager.get_service()로 만든 서비스를 사용해야 합니다. 이 서비스는
+    요청마다 현재 스레드 전용 인증 HTTP 클라이언트를 쓰므로(ThreadLocalRequestBuilder)
+    워커 스레드마다 연결을 재사용합니다.
+    요청 제한(429, 403 rateLimitExceeded/userRateLimitExceeded)과 요청을 보내기 전의
+    연결 실패만 메일 단위로 지터를 섞은 지수 백오프 후 재시도합니다.
+    5xx 응답과 요청 도중 끊긴 연결, 시간 초과는 Gmail이 이미 메일을 받았을 수 있으므로
+    재시도하지 않고 실패로 돌려줍니다 (중복 발송 방지, 대기열의 발송 중 → 실패 처리와 같은 기준).
+    """
+
+    def __init__(self, gmail_service, max_workers: int = 8, max_retries: int = 5,
+                 base_delay: float = 1.0, max_delay: float = 30.0,
+                 rate_limiter=None):
+        self.gmail_service = gmail_service
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max(1, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # 초당 발송 수 제한 (acquire()를 가진 객체, 예: TokenBucket)
+        self.rate_limiter = rate_limiter
+        self.last_run_stats = {}
+
+    def send_many(self, messages: List[Dict]) -> List[Dict]:
+        """메일 목록 발송
+
+        Args:
+            messages: [{'to': str, 'subject': str, 'html': str}, ...]
+                      미리 인코딩한 메시지는 {'to': str, 'raw': bytes(MIME)}
+
+        Returns:
+            list: 요청 순서대로의 결과
+                  [{'success': bool, 'message_id': str, 'attempts': int, 'error': str}, ...]
+        """
+        if not messages:
+            return []
+
+        started_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(messages))) as executor:
+            results = list(executor.map(self._send_one, messages))
+
+        succeeded = sum(1 for result in results if result['success'])
+        self.last_run_stats = {
+            'messages': len(messages),
+            'succeeded': succeeded,
+            'failed': len(messages) - succeeded,
+            'retries': sum(result['attempts'] - 1 for result in results),
+            'elapsed_seconds': round(time.monotonic() - started_at, 2),
+        }
+        logger.info(
+            f"Gmail API 발송 완료: {succeeded}/{len(messages)}개 성공, "
+            f"재시도 {self.last_run_stats['retries']}회, "
+            f"{self.last_run_stats['elapsed_seconds']}초 (동시 발송 {self.max_workers}개)"
+        )
+        return results
+
+    def _send_one(self, message: Dict) -> Dict:
+        """메일 한 통 발송 (일시적 오류는 재시도)"""
+        result = {'success': False, 'message_id': '', 'attempts': 0, 'error': ''}
+        try:
+            if 'raw' in message:
+                raw_message = encode_raw_message(message['raw'])
+            else:
+                raw_message = build_raw_message(message['to'], message['subject'], message['html'])
+        except Exception as e:
+            result['error'] = f"메시지 생성 실패: {str(e)}"
+            return result
+
+        for attempt in range(self.max_retries):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            result['attempts'] = attempt + 1
+            try:
+                response = self.gmail_service.users().messages().send(
+                    userId='me',
+                    body={'raw': raw_message}
+                ).execute()
+                result['success'] = True
+                result['message_id'] = response.get('id', '')
+                result['error'] = ''
+                return result
+
+            except HttpError as e:
+                result['error'] = str(e)
+                if not self._is_retryable(e):
+                    logger.error(f"Gmail API 이메일 발송 실패 ({message['to']}): {str(e)}")
+                    return result
+                wait_time = self._get_retry_delay(e, attempt)
+
+            except (ConnectionRefusedError, httplib2.ServerNotFoundError) as e:
+                # 연결 전에 실패해 요청이 전송되지 않았으므로 다시 보내도 중복되지 않음
+                result['error'] = str(e)
+                wait_time = self._get_retry_delay(None, attempt)
+
+            except Exception as e:
+                result['error'] = str(e)
+                logger.error(f"Gmail API 이메일 발송 실패 ({message['to']}): {str(e)}")
+                return result
+
+            if attempt + 1 < self.max_retries:
+                logger.warning(
+                    f"Gmail API 일시적 오류, {wait_time:.1f}초 후 재시도합니다. "
+                    f"({attempt + 1}/{self.max_retries}, {message['to']}): {result['error']}"
+                )
+                time.sleep(wait_time)
+
+        logger.error(f"Gmail API 이메일 발송 실패 (재시도 초과, {message['to']}): {result['error']}")
+        return result
+
+    @staticmethod
+    def _get_error_reasons(error) -> set:
+        """Gmail API 오류 응답 본문의 오류 사유 목록 (error.errors[].reason, error.details[].reason)"""
+        try:
+            data = json.loads(error.content.decode('utf-8'))['error']
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return set()
+        return {
+            item['reason']
+            for item in (data.get('errors') or []) + (data.get('details') or [])
+            if isinstance(item, dict) and item.get('reason')
+        }
+
+    def _is_retryable(self, error) -> bool:
+        """요청 제한처럼 Gmail이 메일을 받지 않은 것이 확실한 오류인지 확인"""
+        status = getattr(error.resp, 'status', None)
+        if status in RETRYABLE_STATUS_CODES:
+            return True
+        return status == 403 and bool(self._get_error_reasons(error) & RETRYABLE_403_REASONS)
+
+    def _get_retry_delay(self, error, attempt: int) -> float:
+        """Retry-After 헤더가 있으면 따르고, 없으면 지터를 섞은 지수 백오프"""
+        response = getattr(error, 'resp', None)
+        retry_after = response.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_delay) + random.uniform(0, 1)
+            except ValueError:
+                pass
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
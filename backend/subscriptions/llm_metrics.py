@@ -0,0 +1,131 @@
+import logging
+import pytz
+from datetime import timedelta
+from typing import Dict, List
+from django.conf import settings
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from .models import LLMCall
+
+logger = logging.getLogger(__name__)
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력) - settings.LLM_PRICING으로 변경 가능
+DEFAULT_LLM_PRICING = {
+    'gpt-4o': {'prompt': 2.5, 'completion': 10.0},
+    'gpt-4o-mini': {'prompt': 0.15, 'completion': 0.6},
+}
+
+# Batch API 요청은 동기 요청의 절반 가격
+BATCH_PRICE_RATIO = 0.5
+
+
+def record_llm_calls(calls: List[Dict], slot: str = "") -> int:
+    """AsyncSummarizer 호출 기록을 LLMCall로 저장"""
+    if not calls:
+        return 0
+    LLMCall.objects.bulk_create([
+        LLMCall(
+            purpose=call['purpose'],
+            provider=call.get('provider', ''),
+            model=call['model'],
+            video_id=call['video_id'] or "",
+            slot=slot or "",
+            prompt_tokens=call['prompt_tokens'],
+            completion_tokens=call['completion_tokens'],
+            latency_ms=call['latency_ms'],
+            attempts=call['attempts'],
+            is_successful=call['success'],
+            error_message=call['error_message'],
+        )
+        for call in calls
+    ])
+    return len(calls)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int,
+                  purpose: str = "") -> float:
+    """토큰 사용량으로 예상 비용 계산 (USD, 가격을 모르는 모델은 0)"""
+    pricing = getattr(settings, 'LLM_PRICING', DEFAULT_LLM_PRICING)
+    # 'gpt-4o-2024-08-06'처럼 날짜가 붙은 모델 이름은 가장 긴 접두사로 찾음
+    matches = [name for name in pricing if model.startswith(name)]
+    if not matches:
+        return 0.0
+    price = pricing[max(matches, key=len)]
+    cost = (prompt_tokens * price['prompt'] +
+            completion_tokens * price['completion']) / 1_000_000
+    if purpose == 'batch':
+        cost *= BATCH_PRICE_RATIO
+    return cost
+
+
+def _aggregate(queryset, *fields) -> List[Dict]:
+    """필드별 그룹 집계 (비용 계산을 위해 모델별로도 나눔)"""
+    rows = queryset.values(*fields, 'model', 'purpose').annotate(
+        calls=Count('id'),
+        failed=Count('id', filter=Q(is_successful=False)),
+        prompt_tokens=Sum('prompt_tokens'),
+        completion_tokens=Sum('completion_tokens'),
+        total_latency_ms=Sum('latency_ms'),
+    ).order_by(*fields, 'model')
+
+    # 용도별 가격(배치 할인)을 반영한 뒤 요청한 필드와 모델 기준으로 합침
+    results = {}
+    for row in rows:
+        key = tuple(row[field] for field in fields) + (row['model'],)
+        result = results.setdefault(key, {
+            **{field: row[field] for field in fields},
+            'model': row['model'],
+            'calls': 0,
+            'failed': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'total_latency_ms': 0,
+            'timed_calls': 0,
+            'estimated_cost_usd': 0.0,
+        })
+        for name in ('calls', 'failed', 'prompt_tokens', 'completion_tokens', 'total_latency_ms'):
+            result[name] += row[name] or 0
+        # 배치 요청은 요청별 지연 시간이 없으므로 평균에서 제외
+        if row['purpose'] != 'batch':
+            result['timed_calls'] += row['calls']
+        result['estimated_cost_usd'] += estimate_cost(
+            row['model'], row['prompt_tokens'] or 0, row['completion_tokens'] or 0,
+            row['purpose']
+        )
+
+    for result in results.values():
+        timed_calls = result.pop('timed_calls')
+        total_latency_ms = result.pop('total_latency_ms')
+        result['avg_latency_ms'] = int(total_latency_ms / timed_calls) if timed_calls else 0
+        result['estimated_cost_usd'] = round(result['estimated_cost_usd'], 4)
+    return list(results.values())
+
+
+def get_llm_usage_stats(days: int = 7) -> Dict:
+    """최근 days일간의 LLM 사용량 (일별, 발송 시간대별, 용도별, 제공자별)"""
+    since = timezone.now() - timedelta(days=days)
+    queryset = LLMCall.objects.filter(created_at__gte=since)
+    kst = pytz.timezone('Asia/Seoul')
+
+    by_day = _aggregate(
+        queryset.annotate(day=TruncDate('created_at', tzinfo=kst)), 'day'
+    )
+    for row in by_day:
+        row['day'] = row['day'].isoformat()
+
+    by_model = _aggregate(queryset)
+    return {
+        'days': days,
+        'total_calls': sum(row['calls'] for row in by_model),
+        'total_prompt_tokens': sum(row['prompt_tokens'] or 0 for row in by_model),
+        'total_completion_tokens': sum(row['completion_tokens'] or 0 for row in by_model),
+        'total_estimated_cost_usd': round(
+            sum(row['estimated_cost_usd'] for row in by_model), 4
+        ),
+        'by_model': by_model,
+        'by_day': by_day,
+        'by_slot': _aggregate(queryset.exclude(slot=''), 'slot'),
+        'by_purpose': _aggregate(queryset, 'purpose'),
+        'by_provider': _aggregate(queryset.exclude(provider=''), 'provider'),
+    }
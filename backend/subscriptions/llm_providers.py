@@ -0,0 +1,106 @@
+import logging
+from typing import Dict, List
+from django.conf import settings
+
+# OpenAI 설정
+try:
+    from openai import AsyncOpenAI, AsyncAzureOpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    logging.warning("OpenAI 라이브러리가 설치되지 않았습니다.")
+
+logger = logging.getLogger(__name__)
+
+
+class LLMProvider:
+    """OpenAI 호환 채팅 API 제공자 (OpenAI, Azure OpenAI, 로컬 서버)
+
+    models는 요청 모델 이름을 제공자 쪽 이름으로 바꾸는 표입니다
+    (Azure는 배포 이름, 로컬 서버는 로컬 모델 이름). 표에 없는 모델은
+    default_model이 있으면 그 이름을, 없으면 요청한 이름을 그대로 사용합니다.
+    """
+
+    def __init__(self, name: str, api_key: str, base_url: str = None,
+                 azure_endpoint: str = None, api_version: str = None,
+                 models: Dict[str, str] = None, default_model: str = None,
+                 timeout: float = 60.0):
+        self.name = name
+        self.api_key = api_key
+        self.base_url = base_url or None
+        self.azure_endpoint = azure_endpoint or None
+        self.api_version = api_version
+        self.models = models or {}
+        self.default_model = default_model
+        self.timeout = timeout
+
+    def create_async_client(self):
+        """비동기 클라이언트 생성 (재시도는 호출하는 쪽에서 처리)"""
+        if self.azure_endpoint:
+            return AsyncAzureOpenAI(
+                api_key=self.api_key,
+                azure_endpoint=self.azure_endpoint,
+                api_version=self.api_version,
+                timeout=self.timeout,
+                max_retries=0
+            )
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            max_retries=0
+        )
+
+    def resolve_model(self, model: str) -> str:
+        """요청 모델 이름을 이 제공자의 모델(배포) 이름으로 변환"""
+        return self.models.get(model) or self.default_model or model
+
+    def __repr__(self):
+        return f"LLMProvider({self.name})"
+
+
+def get_llm_providers() -> List[LLMProvider]:
+    """설정된 LLM 제공자 목록 (LLM_PROVIDER_ORDER 순서, 앞쪽이 우선)"""
+    if not OPENAI_AVAILABLE:
+        return []
+
+    timeout = getattr(settings, 'LLM_REQUEST_TIMEOUT', 60.0)
+    available = {}
+
+    if getattr(settings, 'OPENAI_API_KEY', ''):
+        available['openai'] = LLMProvider(
+            'openai',
+            api_key=settings.OPENAI_API_KEY,
+            base_url=getattr(settings, 'OPENAI_BASE_URL', ''),
+            timeout=timeout
+        )
+
+    if (getattr(settings, 'AZURE_OPENAI_API_KEY', '') and
+            getattr(settings, 'AZURE_OPENAI_ENDPOINT', '')):
+        deployment = getattr(settings, 'AZURE_OPENAI_DEPLOYMENT', 'gpt-4o')
+        available['azure'] = LLMProvider(
+            'azure',
+            api_key=settings.AZURE_OPENAI_API_KEY,
+            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+            api_version=getattr(settings, 'AZURE_OPENAI_API_VERSION', '2024-08-01-preview'),
+            models={
+                'gpt-4o': deployment,
+                'gpt-4o-mini': getattr(settings, 'AZURE_OPENAI_MINI_DEPLOYMENT', '') or deployment,
+            },
+            timeout=timeout
+        )
+
+    if getattr(settings, 'LOCAL_LLM_BASE_URL', ''):
+        available['local'] = LLMProvider(
+            'local',
+            api_key=getattr(settings, 'LOCAL_LLM_API_KEY', '') or 'local',
+            base_url=settings.LOCAL_LLM_BASE_URL,
+            default_model=getattr(settings, 'LOCAL_LLM_MODEL', ''),
+            timeout=timeout
+        )
+
+    order = getattr(settings, 'LLM_PROVIDER_ORDER', ['openai', 'azure', 'local'])
+    providers = [available[name] for name in order if name in available]
+    if not providers:
+        logger.error("사용할 수 있는 LLM 제공자가 없습니다. (OPENAI_API_KEY 등 확인)")
+    return providers
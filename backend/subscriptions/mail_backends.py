@@ -0,0 +1,139 @@
+import logging
+import queue
+import smtplib
+import threading
+import time
+from django.conf import settings
+from django.core.mail.backends.smtp import EmailBackend
+
+logger = logging.getLogger(__name__)
+
+
+class PooledSMTPEmailBackend(EmailBackend):
+    """인증된 SMTP 연결을 프로세스 안에서 재사용하는 메일 백엔드
+
+    close()는 연결을 끊지 않고 풀에 돌려주며, open()은 풀에 남은 연결을
+    먼저 사용합니다. 따라서 send_mail()을 여러 번 호출해도 TLS 연결과 로그인은
+    풀 크기만큼만 일어납니다. 오래 쉬었던 연결은 NOOP으로 확인하고,
+    발송 중 연결이 끊기면 새로 연결해 한 번 더 보냅니다.
+    """
+
+    # (호스트, 포트, 사용자, TLS, SSL) -> 쉬고 있는 연결 [(연결, 반납 시각), ...]
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, *args, pool_size=None, idle_timeout=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_size = pool_size or getattr(settings, 'EMAIL_POOL_SIZE', 4)
+        self.idle_timeout = idle_timeout or getattr(settings, 'EMAIL_POOL_IDLE_TIMEOUT', 60)
+
+    def _get_pool(self) -> queue.LifoQueue:
+        key = (self.host, self.port, self.username, self.use_tls, self.use_ssl)
+        with self._pools_lock:
+            if key not in self._pools:
+                self._pools[key] = queue.LifoQueue(maxsize=self.pool_size)
+            return self._pools[key]
+
+    @staticmethod
+    def _quit(connection):
+        try:
+            connection.quit()
+        except Exception:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def open(self):
+        """풀에 쉬고 있는 연결이 있으면 사용하고, 없으면 새로 연결"""
+        if self.connection:
+            return False
+
+        pool = self._get_pool()
+        while True:
+            try:
+                connection, returned_at = pool.get_nowait()
+            except queue.Empty:
+                break
+            idle_seconds = time.monotonic() - returned_at
+            if idle_seconds > self.idle_timeout:
+                # 서버가 이미 끊었을 가능성이 높은 연결은 버림
+                self._quit(connection)
+                continue
+            if idle_seconds > 5:
+                try:
+                    if connection.noop()[0] != 250:
+                        raise smtplib.SMTPServerDisconnected("NOOP 실패")
+                except Exception:
+                    self._quit(connection)
+                    continue
+            self.connection = connection
+            return True
+
+        return super().open()
+
+    def close(self):
+        """연결을 끊지 않고 풀에 반납 (풀이 가득 차면 종료)"""
+        if self.connection is None:
+            return
+        connection, self.connection = self.connection, None
+        try:
+            self._get_pool().put_nowait((connection, time.monotonic()))
+        except queue.Full:
+            self._quit(connection)
+
+    def _reconnect(self):
+        """끊긴 연결을 버리고 새로 연결"""
+        if self.connection is not None:
+            self._quit(self.connection)
+            self.connection = None
+        super().open()
+
+    def _send(self, email_message):
+        """메일 한 통 발송 (연결이 끊겨 있으면 재연결 후 한 번 더 시도)"""
+        fail_silently, self.fail_silently = self.fail_silently, False
+        try:
+            try:
+                return super()._send(email_message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError) as e:
+                logger.warning(f"SMTP 연결이 끊겨 다시 연결합니다: {str(e)}")
+                self._reconnect()
+                return super()._send(email_message)
+        except (smtplib.SMTPException, OSError):
+            if not fail_silently:
+                raise
+            return False
+        finally:
+            self.fail_silently = fail_silently
+
+    def send_raw(self, from_email: str, recipients, raw_message: bytes) -> bool:
+        """미리 인코딩한 MIME 메시지를 그대로 발송 (연결이 끊겨 있으면 재연결 후 한 번 더 시도)"""
+        with self._lock:
+            new_conn_created = self.open()
+            if not self.connection or new_conn_created is None:
+                return False
+            try:
+                try:
+                    self.connection.sendmail(from_email, recipients, raw_message)
+                except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError) as e:
+                    logger.warning(f"SMTP 연결이 끊겨 다시 연결합니다: {str(e)}")
+                    self._reconnect()
+                    self.connection.sendmail(from_email, recipients, raw_message)
+            finally:
+                if new_conn_created:
+                    self.close()
+        return True
+
+    @classmethod
+    def close_all(cls):
+        """풀의 모든 연결 종료 (프로세스 종료, 설정 변경 시)"""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            while True:
+                try:
+                    connection, _ = pool.get_nowait()
+                except queue.Empty:
+                    break
+                cls._quit(connection)
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0005_user_subscription_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('video_id', models.CharField(db_index=True, max_length=32, verbose_name='영상 ID')),
+                ('transcript_hash', models.CharField(max_length=64, verbose_name='자막 해시')),
+                ('prompt_version', models.CharField(db_index=True, max_length=100, verbose_name='프롬프트 버전')),
+                ('model', models.CharField(max_length=100, verbose_name='모델')),
+                ('summary', models.TextField(verbose_name='요약 내용')),
+                ('hit_count', models.PositiveIntegerField(default=0, verbose_name='재사용 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('last_hit_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 재사용 시간')),
+            ],
+            options={
+                'verbose_name': '영상 요약',
+                'verbose_name_plural': '영상 요약 목록',
+                'ordering': ['-created_at'],
+                'unique_together': {('video_id', 'transcript_hash', 'prompt_version', 'model')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0006_videosummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subscription',
+            name='channel_id_resolved_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='채널 ID 확인 시간'),
+        ),
+        migrations.AddField(
+            model_name='subscription',
+            name='youtube_channel_id',
+            field=models.CharField(blank=True, db_index=True, help_text='채널 URL에서 확인한 UC... 형식의 채널 ID (캐시)', max_length=64, null=True, verbose_name='YouTube 채널 ID'),
+        ),
+    ]
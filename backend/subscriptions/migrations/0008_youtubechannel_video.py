@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0007_subscription_channel_id_resolved_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='YouTubeChannel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel_id', models.CharField(max_length=64, unique=True, verbose_name='채널 ID')),
+                ('title', models.CharField(blank=True, default='', max_length=200, verbose_name='채널 이름')),
+                ('uploads_playlist_id', models.CharField(blank=True, default='', max_length=64, verbose_name='업로드 플레이리스트 ID')),
+                ('last_crawled_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 수집 시간')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': 'YouTube 채널',
+                'verbose_name_plural': 'YouTube 채널 목록',
+                'ordering': ['title'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Video',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('video_id', models.CharField(max_length=32, unique=True, verbose_name='영상 ID')),
+                ('title', models.CharField(max_length=300, verbose_name='제목')),
+                ('published_at', models.DateTimeField(verbose_name='업로드 시간')),
+                ('duration', models.PositiveIntegerField(default=0, verbose_name='길이(초)')),
+                ('is_shorts', models.BooleanField(default=False, verbose_name='쇼츠 여부')),
+                ('is_stream', models.BooleanField(default=False, verbose_name='스트리밍 여부')),
+                ('is_too_long', models.BooleanField(default=False, verbose_name='1시간 초과 여부')),
+                ('discovered_at', models.DateTimeField(auto_now_add=True, verbose_name='발견 시간')),
+                ('channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='videos', to='subscriptions.youtubechannel', verbose_name='채널')),
+            ],
+            options={
+                'verbose_name': '영상',
+                'verbose_name_plural': '영상 목록',
+                'ordering': ['-published_at'],
+                'indexes': [models.Index(fields=['channel', 'published_at'], name='subscriptio_channel_286884_idx')],
+            },
+        ),
+    ]
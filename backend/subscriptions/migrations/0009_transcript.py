@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0008_youtubechannel_video'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Transcript',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('video_id', models.CharField(db_index=True, max_length=32, verbose_name='영상 ID')),
+                ('language', models.CharField(max_length=20, verbose_name='자막 언어')),
+                ('compressed_text', models.BinaryField(verbose_name='압축된 자막')),
+                ('text_length', models.PositiveIntegerField(default=0, verbose_name='자막 길이(글자)')),
+                ('fetched_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='수집 시간')),
+            ],
+            options={
+                'verbose_name': '자막',
+                'verbose_name_plural': '자막 목록',
+                'ordering': ['-fetched_at'],
+                'unique_together': {('video_id', 'language')},
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0009_transcript'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMCall',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('purpose', models.CharField(db_index=True, help_text='digest, chunk, transcript 등', max_length=30, verbose_name='용도')),
+                ('model', models.CharField(max_length=100, verbose_name='모델')),
+                ('video_id', models.CharField(blank=True, default='', max_length=32, verbose_name='영상 ID')),
+                ('slot', models.CharField(blank=True, db_index=True, default='', help_text='HH:MM 형식 (발송 준비 작업에서 호출한 경우)', max_length=5, verbose_name='발송 시간대')),
+                ('prompt_tokens', models.PositiveIntegerField(default=0, verbose_name='입력 토큰 수')),
+                ('completion_tokens', models.PositiveIntegerField(default=0, verbose_name='출력 토큰 수')),
+                ('latency_ms', models.PositiveIntegerField(default=0, verbose_name='지연 시간(ms)')),
+                ('attempts', models.PositiveSmallIntegerField(default=1, verbose_name='시도 횟수')),
+                ('is_successful', models.BooleanField(default=True, verbose_name='성공 여부')),
+                ('error_message', models.TextField(blank=True, default='', verbose_name='오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='호출 시간')),
+            ],
+            options={
+                'verbose_name': 'LLM 호출',
+                'verbose_name_plural': 'LLM 호출 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0010_llmcall'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SummaryBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch_id', models.CharField(max_length=100, unique=True, verbose_name='배치 ID')),
+                ('status', models.CharField(db_index=True, default='validating', max_length=20, verbose_name='상태')),
+                ('prompt_version', models.CharField(max_length=100, verbose_name='프롬프트 버전')),
+                ('model', models.CharField(max_length=100, verbose_name='모델')),
+                ('requests', models.JSONField(default=dict, help_text='{custom_id: {video_id, transcript_hash}}', verbose_name='요청 목록')),
+                ('request_count', models.PositiveIntegerField(default=0, verbose_name='요청 수')),
+                ('completed_count', models.PositiveIntegerField(default=0, verbose_name='완료 수')),
+                ('failed_count', models.PositiveIntegerField(default=0, verbose_name='실패 수')),
+                ('input_file_id', models.CharField(blank=True, default='', max_length=100, verbose_name='입력 파일 ID')),
+                ('output_file_id', models.CharField(blank=True, default='', max_length=100, verbose_name='결과 파일 ID')),
+                ('error_message', models.TextField(blank=True, default='', verbose_name='오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='제출 시간')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='완료 시간')),
+            ],
+            options={
+                'verbose_name': '요약 배치',
+                'verbose_name_plural': '요약 배치 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0011_summarybatch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='llmcall',
+            name='provider',
+            field=models.CharField(blank=True, db_index=True, default='', help_text='openai, azure, local', max_length=20, verbose_name='제공자'),
+        ),
+    ]
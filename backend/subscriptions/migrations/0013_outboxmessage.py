@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0012_llmcall_provider'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(help_text='발송 예정 시각 + 수신자 기준 해시', max_length=64, unique=True, verbose_name='중복 방지 키')),
+                ('scheduled_at', models.DateTimeField(db_index=True, verbose_name='발송 예정 시각')),
+                ('slot', models.CharField(help_text='HH:MM 형식', max_length=5, verbose_name='발송 시간대')),
+                ('recipient_email', models.EmailField(max_length=254, verbose_name='수신자 이메일')),
+                ('subject', models.CharField(max_length=200, verbose_name='제목')),
+                ('html_content', models.TextField(verbose_name='HTML 내용')),
+                ('subscription_ids', models.JSONField(default=list, help_text='발송 로그를 남길 구독', verbose_name='구독 ID 목록')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('claimed', '선점'), ('sending', '발송 중'), ('sent', '발송 완료'), ('failed', '발송 실패')], db_index=True, default='pending', max_length=10, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='선점 횟수')),
+                ('claim_token', models.CharField(blank=True, db_index=True, default='', max_length=32, verbose_name='선점 토큰')),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 작업 등록 시간')),
+                ('claimed_at', models.DateTimeField(blank=True, null=True, verbose_name='선점 시간')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 시간')),
+                ('message_id', models.CharField(blank=True, default='', max_length=200, verbose_name='메시지 ID')),
+                ('error_message', models.TextField(blank=True, default='', verbose_name='오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '발송 대기 메일',
+                'verbose_name_plural': '발송 대기열',
+                'ordering': ['scheduled_at', 'id'],
+                'indexes': [models.Index(fields=['status', 'scheduled_at'], name='subscriptio_status_8cf23e_idx')],
+            },
+        ),
+    ]
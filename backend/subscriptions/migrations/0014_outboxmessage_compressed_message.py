@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0013_outboxmessage'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='outboxmessage',
+            name='html_content',
+        ),
+        migrations.AddField(
+            model_name='outboxmessage',
+            name='compressed_message',
+            field=models.BinaryField(default=b'', help_text='From 헤더를 제외하고 인코딩한 MIME 메시지 (zlib)', verbose_name='압축된 메시지'),
+        ),
+        migrations.AddField(
+            model_name='outboxmessage',
+            name='content_preview',
+            field=models.TextField(blank=True, default='', help_text='발송 로그에 남길 HTML 앞부분', verbose_name='내용 미리보기'),
+        ),
+        migrations.AddField(
+            model_name='outboxmessage',
+            name='message_size',
+            field=models.PositiveIntegerField(default=0, help_text='압축 전 바이트 수', verbose_name='메시지 크기'),
+        ),
+    ]
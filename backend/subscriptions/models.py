@@ -102,6 +102,19 @@ class Subscription(models.Model):
         default="기본 채널",
         verbose_name="채널 이름"
     )
+    youtube_channel_id = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        verbose_name="YouTube 채널 ID",
+        help_text="채널 URL에서 확인한 UC... 형식의 채널 ID (캐시)"
+    )
+    channel_id_resolved_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="채널 ID 확인 시간"
+    )
     is_active = models.BooleanField(
         default=True,
         verbose_name="활성 상태"
@@ -184,3 +197,432 @@ class EmailLog(models.Model):
     
     def __str__(self):
         return f"Email to {self.subscription.email} at {self.sent_at}"
+
+
+class VideoSummary(models.Model):
+    """영상별 요약 저장소 (영상 ID + 자막 해시 + 프롬프트 버전 + 모델 단위)"""
+    
+    video_id = models.CharField(
+        max_length=32,
+        db_index=True,
+        verbose_name="영상 ID"
+    )
+    transcript_hash = models.CharField(
+        max_length=64,
+        verbose_name="자막 해시"
+    )
+    prompt_version = models.CharField(
+        max_length=100,
+        db_index=True,
+        verbose_name="프롬프트 버전"
+    )
+    model = models.CharField(
+        max_length=100,
+        verbose_name="모델"
+    )
+    summary = models.TextField(verbose_name="요약 내용")
+    hit_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="재사용 횟수"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성일"
+    )
+    last_hit_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="마지막 재사용 시간"
+    )
+    
+    class Meta:
+        verbose_name = "영상 요약"
+        verbose_name_plural = "영상 요약 목록"
+        ordering = ['-created_at']
+        unique_together = [
+            'video_id', 'transcript_hash', 'prompt_version', 'model'
+        ]
+    
+    def __str__(self):
+        return f"{self.video_id} ({self.model}, {self.prompt_version})"
+
+
+class YouTubeChannel(models.Model):
+    """영상 수집 대상 YouTube 채널 (증분 수집 상태 관리)"""
+    
+    channel_id = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name="채널 ID"
+    )
+    title = models.CharField(
+        max_length=200,
+        blank=True,
+        default="",
+        verbose_name="채널 이름"
+    )
+    uploads_playlist_id = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        verbose_name="업로드 플레이리스트 ID"
+    )
+    last_crawled_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="마지막 수집 시간"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성일"
+    )
+    
+    class Meta:
+        verbose_name = "YouTube 채널"
+        verbose_name_plural = "YouTube 채널 목록"
+        ordering = ['title']
+    
+    def __str__(self):
+        return f"{self.title or self.channel_id}"
+
+
+class Video(models.Model):
+    """수집된 업로드 영상 (발송 준비 시 네트워크 대신 이 테이블을 조회)"""
+    
+    channel = models.ForeignKey(
+        YouTubeChannel,
+        on_delete=models.CASCADE,
+        verbose_name="채널",
+        related_name='videos'
+    )
+    video_id = models.CharField(
+        max_length=32,
+        unique=True,
+        verbose_name="영상 ID"
+    )
+    title = models.CharField(max_length=300, verbose_name="제목")
+    published_at = models.DateTimeField(verbose_name="업로드 시간")
+    duration = models.PositiveIntegerField(
+        default=0,
+        verbose_name="길이(초)"
+    )
+    is_shorts = models.BooleanField(default=False, verbose_name="쇼츠 여부")
+    is_stream = models.BooleanField(default=False, verbose_name="스트리밍 여부")
+    is_too_long = models.BooleanField(
+        default=False,
+        verbose_name="1시간 초과 여부"
+    )
+    discovered_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="발견 시간"
+    )
+    
+    class Meta:
+        verbose_name = "영상"
+        verbose_name_plural = "영상 목록"
+        ordering = ['-published_at']
+        indexes = [
+            models.Index(fields=['channel', 'published_at']),
+        ]
+    
+    @property
+    def url(self):
+        return f"https://www.youtube.com/watch?v={self.video_id}"
+    
+    def __str__(self):
+        return f"{self.title} ({self.video_id})"
+
+
+class Transcript(models.Model):
+    """영상 자막 저장소 (zlib 압축 저장, 보관 기간 이후 삭제)"""
+    
+    video_id = models.CharField(
+        max_length=32,
+        db_index=True,
+        verbose_name="영상 ID"
+    )
+    language = models.CharField(
+        max_length=20,
+        verbose_name="자막 언어"
+    )
+    compressed_text = models.BinaryField(verbose_name="압축된 자막")
+    text_length = models.PositiveIntegerField(
+        default=0,
+        verbose_name="자막 길이(글자)"
+    )
+    fetched_at = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+        verbose_name="수집 시간"
+    )
+    
+    class Meta:
+        verbose_name = "자막"
+        verbose_name_plural = "자막 목록"
+        ordering = ['-fetched_at']
+        unique_together = ['video_id', 'language']
+    
+    def __str__(self):
+        return f"{self.video_id} ({self.language})"
+
+
+class LLMCall(models.Model):
+    """LLM 호출 기록 (토큰 사용량, 지연 시간, 발송 시간대별 집계용)"""
+    
+    purpose = models.CharField(
+        max_length=30,
+        db_index=True,
+        verbose_name="용도",
+        help_text="digest, chunk, transcript 등"
+    )
+    provider = models.CharField(
+        max_length=20,
+        blank=True,
+        default="",
+        db_index=True,
+        verbose_name="제공자",
+        help_text="openai, azure, local"
+    )
+    model = models.CharField(max_length=100, verbose_name="모델")
+    video_id = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        verbose_name="영상 ID"
+    )
+    slot = models.CharField(
+        max_length=5,
+        blank=True,
+        default="",
+        db_index=True,
+        verbose_name="발송 시간대",
+        help_text="HH:MM 형식 (발송 준비 작업에서 호출한 경우)"
+    )
+    prompt_tokens = models.PositiveIntegerField(
+        default=0,
+        verbose_name="입력 토큰 수"
+    )
+    completion_tokens = models.PositiveIntegerField(
+        default=0,
+        verbose_name="출력 토큰 수"
+    )
+    latency_ms = models.PositiveIntegerField(
+        default=0,
+        verbose_name="지연 시간(ms)"
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=1,
+        verbose_name="시도 횟수"
+    )
+    is_successful = models.BooleanField(default=True, verbose_name="성공 여부")
+    error_message = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="오류 메시지"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+        verbose_name="호출 시간"
+    )
+    
+    class Meta:
+        verbose_name = "LLM 호출"
+        verbose_name_plural = "LLM 호출 목록"
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.purpose} ({self.model}, {self.prompt_tokens}+{self.completion_tokens} tokens)"
+
+
+class SummaryBatch(models.Model):
+    """OpenAI Batch API로 제출한 요약 작업 (완료되면 요약 저장소를 채움)"""
+    
+    batch_id = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name="배치 ID"
+    )
+    status = models.CharField(
+        max_length=20,
+        default="validating",
+        db_index=True,
+        verbose_name="상태"
+    )
+    prompt_version = models.CharField(
+        max_length=100,
+        verbose_name="프롬프트 버전"
+    )
+    model = models.CharField(max_length=100, verbose_name="모델")
+    requests = models.JSONField(
+        default=dict,
+        verbose_name="요청 목록",
+        help_text="{custom_id: {video_id, transcript_hash}}"
+    )
+    request_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="요청 수"
+    )
+    completed_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="완료 수"
+    )
+    failed_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="실패 수"
+    )
+    input_file_id = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        verbose_name="입력 파일 ID"
+    )
+    output_file_id = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        verbose_name="결과 파일 ID"
+    )
+    error_message = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="오류 메시지"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="제출 시간"
+    )
+    completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="완료 시간"
+    )
+    
+    class Meta:
+        verbose_name = "요약 배치"
+        verbose_name_plural = "요약 배치 목록"
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.batch_id} ({self.status}, {self.request_count}건)"
+
+
+class OutboxMessage(models.Model):
+    """발송 대기열 (준비 작업이 렌더링하고 인코딩한 메일 한 통 = 한 행)
+    
+    발송 작업은 행을 선점(claimed)한 뒤 발송 직전에 sending으로 바꾸고,
+    결과에 따라 sent 또는 failed로 기록합니다. idempotency_key가 같은 메일은
+    한 번만 대기열에 들어갑니다.
+    """
+    
+    STATUS_PENDING = 'pending'
+    STATUS_CLAIMED = 'claimed'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_CLAIMED, '선점'),
+        (STATUS_SENDING, '발송 중'),
+        (STATUS_SENT, '발송 완료'),
+        (STATUS_FAILED, '발송 실패'),
+    ]
+    
+    idempotency_key = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name="중복 방지 키",
+        help_text="발송 예정 시각 + 수신자 기준 해시"
+    )
+    scheduled_at = models.DateTimeField(
+        db_index=True,
+        verbose_name="발송 예정 시각"
+    )
+    slot = models.CharField(
+        max_length=5,
+        verbose_name="발송 시간대",
+        help_text="HH:MM 형식"
+    )
+    recipient_email = models.EmailField(verbose_name="수신자 이메일")
+    subject = models.CharField(max_length=200, verbose_name="제목")
+    compressed_message = models.BinaryField(
+        default=b"",
+        verbose_name="압축된 메시지",
+        help_text="From 헤더를 제외하고 인코딩한 MIME 메시지 (zlib)"
+    )
+    message_size = models.PositiveIntegerField(
+        default=0,
+        verbose_name="메시지 크기",
+        help_text="압축 전 바이트 수"
+    )
+    content_preview = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="내용 미리보기",
+        help_text="발송 로그에 남길 HTML 앞부분"
+    )
+    subscription_ids = models.JSONField(
+        default=list,
+        verbose_name="구독 ID 목록",
+        help_text="발송 로그를 남길 구독"
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        db_index=True,
+        verbose_name="상태"
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="선점 횟수"
+    )
+    claim_token = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        db_index=True,
+        verbose_name="선점 토큰"
+    )
+    dispatched_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="발송 작업 등록 시간"
+    )
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="선점 시간"
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="발송 시간"
+    )
+    message_id = models.CharField(
+        max_length=200,
+        blank=True,
+        default="",
+        verbose_name="메시지 ID"
+    )
+    error_message = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="오류 메시지"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성일"
+    )
+    
+    class Meta:
+        verbose_name = "발송 대기 메일"
+        verbose_name_plural = "발송 대기열"
+        ordering = ['scheduled_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'scheduled_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.recipient_email} ({self.slot}, {self.status})"
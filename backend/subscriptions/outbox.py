@@ -0,0 +1,262 @@
+import email
+import hashlib
+import logging
+import uuid
+import zlib
+from datetime import datetime, timedelta
+from email.policy import SMTP
+from email.utils import formatdate
+from typing import Dict, Iterable, List
+from django.core.mail.utils import DNS_NAME
+from django.db.models import F, Q
+from django.utils import timezone
+from .gmail_sender import build_mime_message
+from .models import OutboxMessage, Subscription
+
+logger = logging.getLogger(__name__)
+
+
+def make_idempotency_key(scheduled_at: datetime, recipient_email: str) -> str:
+    """발송 예정 시각 + 수신자 기준 중복 방지 키 (같은 시간대에 같은 수신자는 한 통만)"""
+    value = f"{scheduled_at.isoformat()}|{recipient_email.strip().lower()}"
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+def stage_message(idempotency_key: str, scheduled_at: datetime, recipient_email: str,
+                  subject: str, html_content: str) -> OutboxMessage:
+    """메일을 MIME으로 인코딩하고 압축해 대기열 행 생성 (저장은 enqueue_messages)
+
+    From 헤더는 발송 경로(Gmail API/SMTP)에 따라 달라지므로 발송 시 덧붙입니다.
+    Message-ID는 중복 방지 키로 만들어 재시도해도 같은 메일로 식별됩니다.
+    """
+    mime_message = build_mime_message(
+        recipient_email, subject, html_content,
+        headers={'Message-ID': f"<{idempotency_key}@{DNS_NAME}>"}
+    )
+    return OutboxMessage(
+        idempotency_key=idempotency_key,
+        scheduled_at=scheduled_at,
+        slot=scheduled_at.strftime('%H:%M'),
+        recipient_email=recipient_email,
+        subject=subject,
+        compressed_message=zlib.compress(mime_message, 6),
+        message_size=len(mime_message),
+        content_preview=html_content[:1000],
+    )
+
+
+def build_sender_headers(sender: str) -> bytes:
+    """발송 시 메시지 앞에 붙일 From, Date 헤더 (묶음마다 한 번 생성)"""
+    return b''.join(
+        SMTP.header_factory(name, value).fold(policy=SMTP).encode('ascii')
+        for name, value in [('From', sender), ('Date', formatdate(localtime=True))]
+    )
+
+
+def load_message(message: OutboxMessage, sender_headers: bytes) -> bytes:
+    """저장된 메시지 압축 해제 후 From, Date 헤더를 붙인 전송용 MIME 메시지"""
+    return sender_headers + zlib.decompress(bytes(message.compressed_message))
+
+
+def extract_html(mime_message: bytes) -> str:
+    """MIME 메시지에서 HTML 본문 추출 (원문 전송을 지원하지 않는 메일 백엔드용)"""
+    parsed = email.message_from_bytes(mime_message)
+    for part in parsed.walk():
+        if part.get_content_type() == 'text/html':
+            return part.get_payload(decode=True).decode(part.get_content_charset() or 'utf-8')
+    return ''
+
+
+def queued_recipients(scheduled_at: datetime) -> set:
+    """해당 시간대 대기열에 이미 들어간 수신자 이메일"""
+    return set(
+        OutboxMessage.objects.filter(scheduled_at=scheduled_at)
+        .values_list('recipient_email', flat=True)
+    )
+
+
+def enqueue_messages(messages: List[OutboxMessage], batch_size: int = 500) -> int:
+    """메일을 대기열에 추가 (중복 방지 키가 이미 있는 메일은 무시)
+
+    Returns:
+        int: 새로 추가한 메일 수
+    """
+    if not messages:
+        return 0
+    keys = [message.idempotency_key for message in messages]
+    existing = set()
+    for start in range(0, len(keys), batch_size):
+        existing.update(
+            OutboxMessage.objects.filter(idempotency_key__in=keys[start:start + batch_size])
+            .values_list('idempotency_key', flat=True)
+        )
+    new_messages = [message for message in messages if message.idempotency_key not in existing]
+    # 다른 작업이 동시에 같은 메일을 추가해도 unique 제약으로 한 행만 남음
+    OutboxMessage.objects.bulk_create(new_messages, batch_size=batch_size, ignore_conflicts=True)
+    return len(new_messages)
+
+
+def pending_message_ids(scheduled_before: datetime = None,
+                        redispatch_after: int = None) -> List[int]:
+    """발송할 차례가 된 대기 메일 ID
+
+    Args:
+        scheduled_before: 이 시각까지 발송 예정인 메일만 (기본: 현재 시각)
+        redispatch_after: 지정하면 발송 작업 등록 후 이 시간(초)이 지나도
+                          선점되지 않은 메일만 다시 고름 (중복 등록 방지)
+    """
+    now = timezone.now()
+    queryset = OutboxMessage.objects.filter(
+        status=OutboxMessage.STATUS_PENDING,
+        scheduled_at__lte=scheduled_before or now
+    )
+    if redispatch_after is not None:
+        queryset = queryset.filter(
+            Q(dispatched_at__isnull=True) |
+            Q(dispatched_at__lt=now - timedelta(seconds=redispatch_after))
+        )
+    return list(queryset.order_by('scheduled_at', 'id').values_list('id', flat=True))
+
+
+def mark_dispatched(message_ids: Iterable[int]) -> None:
+    """발송 작업에 넘긴 시각 기록"""
+    OutboxMessage.objects.filter(id__in=list(message_ids)).update(dispatched_at=timezone.now())
+
+
+def claim_messages(message_ids: Iterable[int]) -> List[OutboxMessage]:
+    """대기 중인 메일을 선점
+
+    대기(pending) 상태인 행만 한 번의 UPDATE로 선점 토큰을 기록하므로,
+    여러 워커가 같은 ID를 받아도 각 메일은 한 워커만 가져갑니다.
+    """
+    token = uuid.uuid4().hex
+    OutboxMessage.objects.filter(
+        id__in=list(message_ids),
+        status=OutboxMessage.STATUS_PENDING
+    ).update(
+        status=OutboxMessage.STATUS_CLAIMED,
+        claim_token=token,
+        claimed_at=timezone.now(),
+        attempts=F('attempts') + 1
+    )
+    return list(OutboxMessage.objects.filter(
+        claim_token=token, status=OutboxMessage.STATUS_CLAIMED
+    ))
+
+
+def cancel_inactive_messages(messages: List[OutboxMessage]) -> List[OutboxMessage]:
+    """선점한 메일 중 수신자의 활성 구독이 남아 있는 메일만 반환
+
+    대기열에 넣은 뒤 구독이 해지(비활성화/삭제)되었거나 사용자가 비활성화되어
+    활성 구독이 하나도 없는 메일은 보내지 않고 실패 처리합니다.
+    """
+    subscription_ids = {
+        subscription_id for message in messages for subscription_id in message.subscription_ids
+    }
+    active_ids = set(
+        Subscription.objects.filter(id__in=subscription_ids, is_active=True)
+        .filter(Q(user__isnull=True) | Q(user__is_active=True))
+        .values_list('id', flat=True)
+    )
+    sendable = []
+    cancelled = []
+    for message in messages:
+        if any(subscription_id in active_ids for subscription_id in message.subscription_ids):
+            sendable.append(message)
+        else:
+            cancelled.append(message)
+
+    if cancelled:
+        error_message = '구독이 해지되어 발송하지 않았습니다.'
+        OutboxMessage.objects.filter(
+            id__in=[message.id for message in cancelled]
+        ).update(status=OutboxMessage.STATUS_FAILED, error_message=error_message)
+        for message in cancelled:
+            message.status = OutboxMessage.STATUS_FAILED
+            message.error_message = error_message
+        logger.info(f"구독이 해지된 수신자 {len(cancelled)}명의 메일은 발송하지 않습니다.")
+    return sendable
+
+
+def mark_sending(messages: List[OutboxMessage]) -> None:
+    """발송 직전 상태 기록 (이후 작업이 중단되면 발송 여부를 알 수 없는 메일)"""
+    now = timezone.now()
+    OutboxMessage.objects.filter(
+        id__in=[message.id for message in messages]
+    ).update(status=OutboxMessage.STATUS_SENDING, claimed_at=now)
+    for message in messages:
+        message.status = OutboxMessage.STATUS_SENDING
+        message.claimed_at = now
+
+
+def record_results(messages: List[OutboxMessage], results: List[Dict]) -> None:
+    """발송 결과 저장
+
+    Args:
+        results: messages와 같은 순서의 [{'success': bool, 'message_id': str, 'error': str}, ...]
+    """
+    now = timezone.now()
+    for message, result in zip(messages, results):
+        if result['success']:
+            message.status = OutboxMessage.STATUS_SENT
+            message.sent_at = now
+            message.message_id = result.get('message_id', '') or ''
+            message.error_message = ''
+        else:
+            message.status = OutboxMessage.STATUS_FAILED
+            message.error_message = result.get('error', '') or ''
+    OutboxMessage.objects.bulk_update(
+        messages, ['status', 'sent_at', 'message_id', 'error_message']
+    )
+
+
+def recover_stale_messages(claim_timeout: int, max_delay_minutes: int) -> Dict[str, int]:
+    """중단된 발송 작업이 남긴 메일 정리
+
+    - 선점만 하고 보내지 않은 메일: 대기 상태로 되돌려 다시 발송
+    - 발송 중 상태로 남은 메일: 이미 나갔을 수 있으므로 중복 발송을 막기 위해 실패 처리
+    - 발송 예정 시각에서 max_delay_minutes 이상 지난 대기 메일: 실패 처리
+    """
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=claim_timeout)
+
+    released = OutboxMessage.objects.filter(
+        status=OutboxMessage.STATUS_CLAIMED, claimed_at__lt=cutoff
+    ).update(status=OutboxMessage.STATUS_PENDING, claim_token='', dispatched_at=None)
+
+    in_doubt = OutboxMessage.objects.filter(
+        status=OutboxMessage.STATUS_SENDING, claimed_at__lt=cutoff
+    ).update(
+        status=OutboxMessage.STATUS_FAILED,
+        error_message='발송 도중 작업이 중단되었습니다. 중복 발송을 막기 위해 다시 보내지 않습니다.'
+    )
+
+    expired = OutboxMessage.objects.filter(
+        status=OutboxMessage.STATUS_PENDING,
+        scheduled_at__lt=now - timedelta(minutes=max_delay_minutes)
+    ).update(
+        status=OutboxMessage.STATUS_FAILED,
+        error_message='발송 가능 시간이 지났습니다.'
+    )
+
+    if released or in_doubt or expired:
+        logger.warning(
+            f"발송 대기열 정리: 재발송 {released}개, 발송 여부 불명 {in_doubt}개, "
+            f"시간 초과 {expired}개"
+        )
+    return {'released': released, 'in_doubt': in_doubt, 'expired': expired}
+
+
+def prune_messages(retention_days: int) -> int:
+    """보관 기간이 지난 발송 완료/실패 메일 삭제"""
+    deleted, _ = OutboxMessage.objects.filter(
+        status__in=[OutboxMessage.STATUS_SENT, OutboxMessage.STATUS_FAILED],
+        scheduled_at__lt=timezone.now() - timedelta(days=retention_days)
+    ).delete()
+    return deleted
+
+
+def chunked(items: List, size: int) -> List[List]:
+    """목록을 size개씩 나눔"""
+    size = max(1, size)
+    return [items[start:start + size] for start in range(0, len(items), size)]
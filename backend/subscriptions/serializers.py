@@ -1,7 +1,11 @@
+import logging
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.db import transaction
 from .models import Subscription, EmailLog, User
 
+logger = logging.getLogger(__name__)
+
 
 class UserSerializer(serializers.ModelSerializer):
     password = serializers.CharField(
@@ -58,10 +62,13 @@ class SubscriptionSerializer(serializers.ModelSerializer):
         model = Subscription
         fields = [
             'id', 'name', 'email', 'notification_time', 'youtube_channel_url', 
-            'channel_name', 'is_active', 'created_at', 'updated_at',
-            'user_name', 'user_email', 'password', 'user_notification_time'
+            'youtube_channel_id', 'channel_name', 'is_active', 'created_at',
+            'updated_at', 'user_name', 'user_email', 'password',
+            'user_notification_time'
+        ]
+        read_only_fields = [
+            'id', 'youtube_channel_id', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
 
     def validate_youtube_channel_url(self, value):
         """YouTube URL 유효성 검사"""
@@ -106,6 +113,19 @@ class SubscriptionSerializer(serializers.ModelSerializer):
             user=user,
             **validated_data
         )
+        
+        # 채널 ID는 백그라운드에서 미리 확인 (API 응답은 YouTube 조회를 기다리지 않음,
+        # 실패해도 발송 준비 시점에 다시 해석)
+        from .tasks import resolve_subscription_channel_task
+        subscription_id = subscription.id
+        
+        def queue_resolve():
+            try:
+                resolve_subscription_channel_task.delay(subscription_id)
+            except Exception as e:
+                logger.warning(f"채널 ID 확인 작업 등록 실패: {str(e)}")
+        
+        transaction.on_commit(queue_resolve)
         return subscription
     
     def update(self, instance, validated_data):
@@ -116,6 +136,12 @@ class SubscriptionSerializer(serializers.ModelSerializer):
         validated_data.pop('password', None)
         validated_data.pop('user_notification_time', None)
         
+        # 채널 URL이 바뀌면 캐시된 채널 ID는 더 이상 유효하지 않음
+        channel_url = validated_data.get('youtube_channel_url')
+        if channel_url and channel_url != instance.youtube_channel_url:
+            instance.youtube_channel_id = None
+            instance.channel_id_resolved_at = None
+        
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         instance.save()
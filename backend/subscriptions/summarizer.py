@@ -0,0 +1,420 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Callable, Dict, List, Optional
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connections
+
+# OpenAI 설정
+try:
+    from openai import (
+        RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+    )
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    logging.warning("OpenAI 라이브러리가 설치되지 않았습니다.")
+
+# 토큰 수 계산 (없으면 글자 수 기반 추정)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_encodings = {}
+
+
+def estimate_tokens(text: str, model: str = "gpt-4o") -> int:
+    """텍스트의 토큰 수 (tiktoken이 없으면 보수적으로 추정)"""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # 한글 등 비ASCII 문자는 글자당 1토큰, ASCII는 4글자당 1토큰으로 추정
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return non_ascii + (len(text) - non_ascii) // 4 + 1
+
+
+def _get_encoding(model: str):
+    """모델의 tiktoken 인코딩 (불러올 수 없으면 None)"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    if model not in _encodings:
+        # 인코딩 파일을 받을 수 없는 환경이면 한 번만 시도하고 추정으로 대체
+        try:
+            _encodings[model] = tiktoken.encoding_for_model(model)
+        except Exception as e:
+            logger.warning(f"토큰 인코딩을 불러올 수 없어 글자 수로 추정합니다: {str(e)}")
+            _encodings[model] = None
+    return _encodings[model]
+
+
+def split_into_chunks(text: str, chunk_tokens: int, overlap_tokens: int = 0,
+                      model: str = "gpt-4o") -> List[str]:
+    """텍스트를 토큰 수 기준으로 나눔 (앞 조각과 overlap_tokens만큼 겹침)"""
+    if not text:
+        return []
+    chunk_tokens = max(1, chunk_tokens)
+    overlap_tokens = min(max(0, overlap_tokens), chunk_tokens // 2)
+    step = chunk_tokens - overlap_tokens
+
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        return [
+            encoding.decode(tokens[start:start + chunk_tokens])
+            for start in range(0, max(len(tokens) - overlap_tokens, 1), step)
+        ]
+
+    # 인코딩이 없으면 단어 단위로 추정 토큰 수를 누적하여 나눔
+    words = text.split()
+    word_tokens = [estimate_tokens(word, model) for word in words]
+    chunks = []
+    start = 0
+    while start < len(words):
+        end = start
+        used = 0
+        while end < len(words) and (end == start or used + word_tokens[end] <= chunk_tokens):
+            used += word_tokens[end]
+            end += 1
+        chunks.append(' '.join(words[start:end]))
+        if end >= len(words):
+            break
+        # 겹치는 부분만큼 되돌아가서 다음 조각 시작
+        back = end
+        overlap = 0
+        while back > start + 1 and overlap + word_tokens[back - 1] <= overlap_tokens:
+            back -= 1
+            overlap += word_tokens[back]
+        start = back
+    return chunks
+
+
+class RateBudget:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM) 예산 (최근 60초 기준)
+
+    acquire()는 예상 토큰 수로 자리를 예약하고,
+    응답을 받은 뒤 settle()로 실제 사용량을 반영합니다.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int,
+                 window: float = 60.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self.entries = []  # [[시각, 토큰 수], ...]
+        self.lock = asyncio.Lock()
+
+    def _expire(self, now: float):
+        while self.entries and now - self.entries[0][0] >= self.window:
+            self.entries.pop(0)
+
+    async def acquire(self, tokens: int) -> List:
+        """예산이 생길 때까지 대기한 후 예약 (반환값은 settle()에 전달)"""
+        # 한 요청이 TPM 전체보다 크면 단독으로 보낼 수 있도록 제한
+        tokens = min(tokens, self.tokens_per_minute) if self.tokens_per_minute else tokens
+        while True:
+            async with self.lock:
+                now = time.monotonic()
+                self._expire(now)
+                used_tokens = sum(entry[1] for entry in self.entries)
+                requests_ok = (not self.requests_per_minute or
+                               len(self.entries) < self.requests_per_minute)
+                tokens_ok = (not self.tokens_per_minute or
+                             used_tokens + tokens <= self.tokens_per_minute)
+                if requests_ok and tokens_ok:
+                    entry = [now, tokens]
+                    self.entries.append(entry)
+                    return entry
+                # 가장 오래된 예약이 만료될 때까지 대기
+                wait_time = self.window - (now - self.entries[0][0]) if self.entries else 0.1
+            await asyncio.sleep(max(wait_time, 0.05))
+
+    def settle(self, entry: List, tokens: int):
+        """예약한 토큰 수를 실제 사용량으로 교체"""
+        entry[1] = tokens
+
+
+class AsyncSummarizer:
+    """여러 요약 요청을 동시에 보내는 비동기 요약 엔진
+
+    동시 요청 수는 세마포어로, 분당 요청/토큰 수는 제공자별 RateBudget으로 제한하며
+    429(요청 제한)와 일시적 오류는 지터를 섞은 지수 백오프로 재시도합니다.
+    한 제공자에서 failover_after번 연속 실패하거나 응답이 제한 시간을 넘기면
+    다음 제공자로 넘어가고, 실행 중 연속 실패가 쌓인 제공자는 뒤로 미룹니다.
+    결과는 요청 순서 그대로 반환됩니다 (실패한 요청은 None).
+    """
+
+    def __init__(self, providers: List, model: str, max_concurrency: int = 8,
+                 requests_per_minute: int = 500, tokens_per_minute: int = 300000,
+                 max_retries: int = 5, failover_after: int = 2,
+                 base_delay: float = 1.0, max_delay: float = 30.0):
+        self.providers = list(providers)
+        self.model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.failover_after = max(1, failover_after)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.last_run_stats = {}
+        # 요청별 호출 기록 (제공자, 토큰 사용량, 지연 시간, 재시도 횟수)
+        self.last_run_calls = []
+        # 실행이 끝난 뒤 호출 기록 목록을 받는 함수 (예: DB 저장)
+        self.call_recorder = None
+
+    def run(self, jobs: List[Dict],
+            on_result: Optional[Callable[[int, str], None]] = None) -> List[Optional[str]]:
+        """요약 요청 목록 실행 (동기 코드에서 호출)
+
+        Args:
+            jobs: [{'messages': [...], 'max_tokens': int,
+                    'model': str, 'purpose': str, 'video_id': str (선택)}, ...]
+            on_result: 요청 하나가 성공할 때마다 (요청 순번, 응답 내용)으로 바로 호출되는 함수
+                       (예: 요약 저장). 별도 스레드에서 실행되므로 DB를 사용해도 되며,
+                       그 스레드의 DB 연결은 실행이 끝나면 닫힙니다.
+
+        Returns:
+            list: 요청 순서대로의 응답 내용 (실패 시 None)
+        """
+        if not jobs:
+            return []
+        if not OPENAI_AVAILABLE or not self.providers:
+            logger.error("사용할 수 있는 LLM 제공자가 없습니다.")
+            return [None] * len(jobs)
+
+        # 토큰 수 계산은 이벤트 루프를 막지 않도록 미리 수행
+        estimated_tokens = [
+            sum(estimate_tokens(message['content'], self.model)
+                for message in job['messages']) + job['max_tokens']
+            for job in jobs
+        ]
+        self.last_run_calls = []
+        results = asyncio.run(self._run(jobs, estimated_tokens, on_result))
+
+        # 호출 기록 저장은 이벤트 루프가 끝난 뒤 호출한 스레드에서 수행
+        if self.call_recorder is not None:
+            try:
+                self.call_recorder(self.last_run_calls)
+            except Exception as e:
+                logger.warning(f"LLM 호출 기록 저장 실패: {str(e)}")
+        return results
+
+    async def _run(self, jobs: List[Dict], estimated_tokens: List[int],
+                   on_result: Optional[Callable] = None) -> List[Optional[str]]:
+        stats = {
+            'requests': len(jobs),
+            'succeeded': 0,
+            'failed': 0,
+            'retries': 0,
+            'failovers': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'providers': {
+                provider.name: {'calls': 0, 'failures': 0, 'total_latency_ms': 0}
+                for provider in self.providers
+            },
+        }
+        started_at = time.monotonic()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        clients = {
+            provider.name: provider.create_async_client()
+            for provider in self.providers
+        }
+        budgets = {
+            provider.name: RateBudget(self.requests_per_minute, self.tokens_per_minute)
+            for provider in self.providers
+        }
+        # 제공자별 연속 실패 횟수 (실행 중 장애 제공자를 뒤로 미루는 데 사용)
+        consecutive_failures = {provider.name: 0 for provider in self.providers}
+
+        # 완료 콜백은 이벤트 루프 밖의 한 스레드에서 순서대로 실행 (Django ORM 사용 가능)
+        def handle_result(index: int, content: str):
+            try:
+                on_result(index, content)
+            finally:
+                # 요청/작업 경계가 없는 스레드이므로 끊기거나 오래된 DB 연결은 직접 정리
+                close_old_connections()
+
+        result_handler = sync_to_async(handle_result, thread_sensitive=True) if on_result else None
+
+        async def complete(index: int, job: Dict, tokens: int) -> Optional[str]:
+            content = await self._complete(clients, budgets, consecutive_failures,
+                                           semaphore, job, tokens, stats)
+            if content is not None and result_handler is not None:
+                try:
+                    await result_handler(index, content)
+                except Exception as e:
+                    logger.warning(f"요약 결과 저장 실패 ({job.get('video_id', '')}): {str(e)}")
+            return content
+
+        try:
+            results = await asyncio.gather(*[
+                complete(index, job, tokens)
+                for index, (job, tokens) in enumerate(zip(jobs, estimated_tokens))
+            ])
+        finally:
+            for client in clients.values():
+                await client.close()
+            # 콜백 스레드는 실행이 끝나도 남아 있으므로 그 스레드의 DB 연결을 닫음
+            if result_handler is not None:
+                await sync_to_async(connections.close_all, thread_sensitive=True)()
+
+        for provider_stats in stats['providers'].values():
+            calls = provider_stats['calls']
+            provider_stats['avg_latency_ms'] = (
+                int(provider_stats.pop('total_latency_ms') / calls) if calls
+                else provider_stats.pop('total_latency_ms')
+            )
+        stats['elapsed_seconds'] = round(time.monotonic() - started_at, 2)
+        self.last_run_stats = stats
+        logger.info(
+            f"요약 완료: {stats['succeeded']}/{stats['requests']}개 성공, "
+            f"재시도 {stats['retries']}회, 제공자 전환 {stats['failovers']}회, "
+            f"{stats['elapsed_seconds']}초 (동시 요청 {self.max_concurrency}개)"
+        )
+        return results
+
+    def _order_providers(self, consecutive_failures: Dict) -> List:
+        """연속 실패가 적은 제공자를 앞으로 (같으면 설정 순서)"""
+        return sorted(
+            self.providers,
+            key=lambda provider: consecutive_failures[provider.name] >= self.failover_after
+        )
+
+    async def _complete(self, clients: Dict, budgets: Dict, consecutive_failures: Dict,
+                        semaphore, job: Dict, estimated_tokens: int,
+                        stats: Dict) -> Optional[str]:
+        model = job.get('model') or self.model
+        call = {
+            'purpose': job.get('purpose', ''),
+            'video_id': job.get('video_id', ''),
+            'provider': '',
+            'model': model,
+            'attempts': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'latency_ms': 0,
+            'success': False,
+            'error_message': '',
+        }
+        self.last_run_calls.append(call)
+
+        async with semaphore:
+            started_at = time.monotonic()
+            attempt = 0
+            providers = self._order_providers(consecutive_failures)
+            provider_index = 0
+            provider_attempts = 0
+            # 재시도해도 소용없는 오류(인증 실패, 잘못된 요청 등)로 제외된 제공자
+            failed_providers = set()
+            while attempt < self.max_retries:
+                provider = providers[provider_index]
+                provider_stats = stats['providers'][provider.name]
+                reservation = await budgets[provider.name].acquire(estimated_tokens)
+                attempt += 1
+                provider_attempts += 1
+                call['attempts'] = attempt
+                call['provider'] = provider.name
+                request_started_at = time.monotonic()
+                try:
+                    response = await clients[provider.name].chat.completions.create(
+                        model=provider.resolve_model(model),
+                        messages=job['messages'],
+                        max_tokens=job['max_tokens'],
+                        temperature=job.get('temperature', 0.3)
+                    )
+                    latency_ms = int((time.monotonic() - request_started_at) * 1000)
+                    provider_stats['calls'] += 1
+                    provider_stats['total_latency_ms'] += latency_ms
+                    consecutive_failures[provider.name] = 0
+
+                    call['latency_ms'] = int((time.monotonic() - started_at) * 1000)
+                    call['model'] = response.model or model
+                    if response.usage:
+                        budgets[provider.name].settle(reservation, response.usage.total_tokens)
+                        stats['prompt_tokens'] += response.usage.prompt_tokens
+                        stats['completion_tokens'] += response.usage.completion_tokens
+                        call['prompt_tokens'] = response.usage.prompt_tokens
+                        call['completion_tokens'] = response.usage.completion_tokens
+                    call['success'] = True
+                    stats['succeeded'] += 1
+                    return response.choices[0].message.content
+
+                except (RateLimitError, APIConnectionError, APITimeoutError,
+                        InternalServerError) as e:
+                    provider_stats['failures'] += 1
+                    consecutive_failures[provider.name] += 1
+                    call['error_message'] = f"{provider.name}: {str(e)}"
+                    if attempt >= self.max_retries:
+                        logger.error(f"LLM 호출 실패 (재시도 초과, {provider.name}): {str(e)}")
+                        break
+
+                    # 같은 제공자에서 연속으로 실패하면 다음 제공자로 전환
+                    next_index = self._next_provider_index(providers, provider_index, failed_providers)
+                    if provider_attempts >= self.failover_after and next_index is not None:
+                        provider_index = next_index
+                        provider_attempts = 0
+                        stats['failovers'] += 1
+                        logger.warning(
+                            f"{provider.name} 호출 실패, {providers[provider_index].name}(으)로 전환합니다: {str(e)}"
+                        )
+                        continue
+
+                    wait_time = self._get_retry_delay(e, provider_attempts - 1)
+                    stats['retries'] += 1
+                    logger.warning(
+                        f"LLM 일시적 오류({provider.name}), {wait_time:.1f}초 후 재시도합니다. "
+                        f"({attempt}/{self.max_retries}): {str(e)}"
+                    )
+                    await asyncio.sleep(wait_time)
+
+                except Exception as e:
+                    provider_stats['failures'] += 1
+                    consecutive_failures[provider.name] += 1
+                    call['error_message'] = f"{provider.name}: {str(e)}"
+                    failed_providers.add(provider.name)
+
+                    # 인증 오류, 배포 없음(404), 잘못된 요청 등은 같은 제공자에서 재시도하지 않고
+                    # 아직 실패하지 않은 다음 제공자로 전환
+                    next_index = self._next_provider_index(providers, provider_index, failed_providers)
+                    if next_index is None:
+                        logger.error(f"LLM 호출 실패 (모든 제공자 실패, {provider.name}): {str(e)}")
+                        break
+                    provider_index = next_index
+                    provider_attempts = 0
+                    stats['failovers'] += 1
+                    logger.warning(
+                        f"{provider.name} 호출 실패, {providers[provider_index].name}(으)로 전환합니다: {str(e)}"
+                    )
+            call['latency_ms'] = int((time.monotonic() - started_at) * 1000)
+
+        stats['failed'] += 1
+        return None
+
+    @staticmethod
+    def _next_provider_index(providers: List, provider_index: int, failed_providers: set) -> Optional[int]:
+        """현재 제공자 다음 순서의, 재시도할 수 없는 오류로 실패하지 않은 제공자 위치 (없으면 None)"""
+        for offset in range(1, len(providers)):
+            index = (provider_index + offset) % len(providers)
+            if providers[index].name not in failed_providers:
+                return index
+        return None
+
+    def _get_retry_delay(self, error, attempt: int) -> float:
+        """Retry-After 헤더가 있으면 따르고, 없으면 지터를 섞은 지수 백오프"""
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_delay) + random.uniform(0, 1)
+            except ValueError:
+                pass
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
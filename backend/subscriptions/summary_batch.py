@@ -0,0 +1,234 @@
+import json
+import logging
+from typing import Dict
+from django.conf import settings
+from django.utils import timezone
+from .models import SummaryBatch
+from .llm_metrics import record_llm_calls
+from .summarizer import estimate_tokens
+
+# OpenAI 설정
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    logging.warning("OpenAI 라이브러리가 설치되지 않았습니다.")
+
+logger = logging.getLogger(__name__)
+
+# 아직 결과가 나오지 않은 배치 상태
+PENDING_BATCH_STATUSES = ['validating', 'in_progress', 'finalizing']
+
+# 결과 없이 끝난 배치 상태
+FAILED_BATCH_STATUSES = ['failed', 'expired', 'cancelled']
+
+
+def get_batch_client():
+    """Batch API용 OpenAI 클라이언트 (OPENAI_BASE_URL로 대체 서버 지정 가능)"""
+    if not OPENAI_AVAILABLE:
+        return None
+    api_key = getattr(settings, 'OPENAI_API_KEY', '')
+    if not api_key:
+        logger.error("OPENAI_API_KEY가 설정되지 않았습니다.")
+        return None
+    return OpenAI(
+        api_key=api_key,
+        base_url=getattr(settings, 'OPENAI_BASE_URL', '') or None
+    )
+
+
+def get_pending_batch_keys() -> set:
+    """처리 중인 배치에 포함된 (video_id, transcript_hash) 목록"""
+    keys = set()
+    for requests in SummaryBatch.objects.filter(
+        status__in=PENDING_BATCH_STATUSES
+    ).values_list('requests', flat=True):
+        keys.update(
+            (request['video_id'], request['transcript_hash'])
+            for request in requests.values()
+        )
+    return keys
+
+
+def submit_summary_batch(mail_service, video_transcripts: Dict) -> Dict:
+    """아직 요약되지 않은 영상들을 하나의 JSONL 배치로 제출
+
+    요약 저장소에 이미 있거나 처리 중인 배치에 포함된 영상, 그리고
+    조각별 요약이 필요한 긴 자막은 제외합니다 (긴 자막은 발송 준비 시 동기 요약).
+    """
+    stats = {'submitted': 0, 'skipped_cached': 0, 'skipped_pending': 0,
+             'skipped_long': 0, 'batch_id': None}
+    if not video_transcripts:
+        return stats
+
+    client = get_batch_client()
+    if client is None:
+        return stats
+
+    # 동기 요약과 같은 요약 저장소 키가 되도록 같은 전처리를 적용
+    mail_service.preprocess_transcripts(video_transcripts)
+    summary_store = mail_service.summary_store
+    pending_keys = get_pending_batch_keys()
+    threshold = getattr(settings, 'SUMMARY_CHUNK_THRESHOLD_TOKENS', 12000)
+
+    lines = []
+    requests = {}
+    for videos in video_transcripts.values():
+        for video in videos:
+            video_id = summary_store.get_video_id(video)
+            if not video_id:
+                continue
+            transcript_hash = summary_store.hash_transcript(video['transcript'])
+            custom_id = f"{video_id}:{transcript_hash[:16]}"
+            if custom_id in requests:
+                continue
+            model = mail_service.select_summary_model(video)
+            if summary_store.contains(video, model):
+                stats['skipped_cached'] += 1
+                continue
+            if (video_id, transcript_hash) in pending_keys:
+                stats['skipped_pending'] += 1
+                continue
+            if estimate_tokens(video['transcript'], summary_store.model) > threshold:
+                stats['skipped_long'] += 1
+                continue
+
+            job = mail_service._build_summary_job(video)
+            lines.append(json.dumps({
+                'custom_id': custom_id,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': {
+                    'model': model,
+                    'messages': job['messages'],
+                    'max_tokens': job['max_tokens'],
+                    'temperature': 0.3,
+                },
+            }, ensure_ascii=False))
+            requests[custom_id] = {
+                'video_id': video_id,
+                'transcript_hash': transcript_hash,
+                'model': model,
+            }
+
+    if not lines:
+        logger.info("배치로 제출할 새 요약 요청이 없습니다.")
+        return stats
+
+    input_file = client.files.create(
+        file=('summaries.jsonl', '\n'.join(lines).encode('utf-8')),
+        purpose='batch'
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint='/v1/chat/completions',
+        completion_window='24h'
+    )
+    SummaryBatch.objects.create(
+        batch_id=batch.id,
+        status=batch.status,
+        prompt_version=summary_store.prompt_version,
+        model=summary_store.model,
+        requests=requests,
+        request_count=len(requests),
+        input_file_id=input_file.id,
+    )
+
+    stats['submitted'] = len(requests)
+    stats['batch_id'] = batch.id
+    logger.info(f"요약 배치 제출: {batch.id} ({len(requests)}건)")
+    return stats
+
+
+def poll_summary_batches(summary_store) -> Dict:
+    """처리 중인 배치 상태를 확인하고 완료된 결과로 요약 저장소를 채움"""
+    stats = {'checked': 0, 'completed': 0, 'failed': 0, 'summaries_stored': 0}
+    batches = list(SummaryBatch.objects.filter(status__in=PENDING_BATCH_STATUSES))
+    if not batches:
+        return stats
+
+    client = get_batch_client()
+    if client is None:
+        return stats
+
+    for row in batches:
+        stats['checked'] += 1
+        try:
+            batch = client.batches.retrieve(row.batch_id)
+        except Exception as e:
+            logger.warning(f"배치 상태 확인 실패 ({row.batch_id}): {str(e)}")
+            continue
+
+        row.status = batch.status
+        if batch.status == 'completed':
+            row.output_file_id = batch.output_file_id or ""
+            if row.prompt_version != summary_store.prompt_version:
+                # 제출 후 프롬프트가 바뀐 경우 결과를 저장하지 않음
+                row.error_message = "프롬프트 버전이 바뀌어 결과를 사용하지 않았습니다."
+            elif batch.output_file_id:
+                stored = _store_batch_results(client, row, summary_store)
+                stats['summaries_stored'] += stored
+            row.completed_at = timezone.now()
+            stats['completed'] += 1
+        elif batch.status in FAILED_BATCH_STATUSES:
+            errors = getattr(batch, 'errors', None)
+            row.error_message = str(errors.data if errors else batch.status)
+            row.completed_at = timezone.now()
+            stats['failed'] += 1
+            logger.error(f"요약 배치 실패 ({row.batch_id}): {row.error_message}")
+        row.save()
+
+    logger.info(
+        f"요약 배치 확인: {stats['checked']}개 확인, {stats['completed']}개 완료, "
+        f"요약 {stats['summaries_stored']}개 저장"
+    )
+    return stats
+
+
+def _store_batch_results(client, row: SummaryBatch, summary_store) -> int:
+    """배치 결과 파일을 읽어 요약 저장소와 LLM 호출 기록에 반영"""
+    content = client.files.content(row.output_file_id).text
+    calls = []
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        request = row.requests.get(item.get('custom_id'))
+        response = item.get('response') or {}
+        if request is None:
+            continue
+
+        body = response.get('body') or {}
+        if response.get('status_code') != 200 or not body.get('choices'):
+            row.failed_count += 1
+            calls.append(_batch_call(row, request, {}, item.get('error') or body))
+            continue
+
+        summary_store.set_for_hash(
+            request['video_id'],
+            request['transcript_hash'],
+            body['choices'][0]['message']['content'],
+            request.get('model')
+        )
+        row.completed_count += 1
+        calls.append(_batch_call(row, request, body.get('usage') or {}))
+
+    record_llm_calls(calls)
+    return row.completed_count
+
+
+def _batch_call(row: SummaryBatch, request: Dict, usage: Dict, error=None) -> Dict:
+    """배치 결과 한 건의 LLM 호출 기록"""
+    return {
+        'purpose': 'batch',
+        'provider': 'openai',
+        'model': request.get('model') or row.model,
+        'video_id': request['video_id'],
+        'attempts': 1,
+        'prompt_tokens': usage.get('prompt_tokens', 0),
+        'completion_tokens': usage.get('completion_tokens', 0),
+        'latency_ms': 0,
+        'success': error is None,
+        'error_message': str(error) if error else '',
+    }
@@ -0,0 +1,172 @@
+import hashlib
+import logging
+import re
+from typing import Dict, Optional
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+from .models import VideoSummary
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryStore:
+    """영상별 요약 결과를 DB에 저장하여 같은 영상을 한 번만 요약하도록 하는 저장소
+
+    키는 (video_id, 자막 해시, 프롬프트 버전, 모델) 조합입니다.
+    프롬프트 버전은 프롬프트 템플릿 내용의 해시로 만들어지므로
+    템플릿이 바뀌면 기존 요약은 자동으로 미스 처리되고,
+    invalidate_stale()로 이전 버전 요약을 정리할 수 있습니다.
+    """
+
+    def __init__(self, name: str, prompt_template: str, model: str):
+        self.name = name
+        self.model = model
+        self.prompt_version = self.compute_prompt_version(
+            name, prompt_template
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def compute_prompt_version(name: str, prompt_template: str) -> str:
+        """프롬프트 템플릿 내용으로 버전 문자열 생성 (예: digest:1a2b3c4d5e6f)"""
+        digest = hashlib.sha256(
+            prompt_template.encode('utf-8')
+        ).hexdigest()[:12]
+        return f"{name}:{digest}"
+
+    @staticmethod
+    def hash_transcript(transcript: str) -> str:
+        """자막 내용 해시"""
+        return hashlib.sha256(transcript.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_video_id(video: Dict) -> Optional[str]:
+        """영상 정보에서 video_id 추출 (없으면 URL에서 파싱)"""
+        video_id = video.get('video_id')
+        if video_id:
+            return video_id
+        match = re.search(r'[?&]v=([\w-]+)', video.get('url', ''))
+        return match.group(1) if match else None
+
+    def _lookup(self, video: Dict, model: Optional[str] = None):
+        video_id = self.get_video_id(video)
+        if not video_id:
+            return None
+        return {
+            'video_id': video_id,
+            'transcript_hash': self.hash_transcript(video['transcript']),
+            'prompt_version': self.prompt_version,
+            'model': model or self.model,
+        }
+
+    def get(self, video: Dict, model: Optional[str] = None) -> Optional[str]:
+        """저장된 요약 조회 (없으면 None, model을 주면 기본 모델 대신 사용)"""
+        lookup = self._lookup(video, model)
+        if lookup is None:
+            self.misses += 1
+            return None
+
+        entry = None
+        try:
+            entry = VideoSummary.objects.filter(**lookup).first()
+            if entry is not None:
+                VideoSummary.objects.filter(pk=entry.pk).update(
+                    hit_count=F('hit_count') + 1,
+                    last_hit_at=timezone.now()
+                )
+        except Exception as e:
+            # 재사용 횟수 갱신에 실패해도 조회한 요약은 그대로 사용
+            logger.warning(f"요약 저장소 조회 실패: {str(e)}")
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.info(f"요약 저장소 히트: {lookup['video_id']}")
+        return entry.summary
+
+    def contains(self, video: Dict, model: Optional[str] = None) -> bool:
+        """저장된 요약이 있는지 확인 (히트 카운터에 반영하지 않음)"""
+        lookup = self._lookup(video, model)
+        return lookup is not None and VideoSummary.objects.filter(**lookup).exists()
+
+    def set(self, video: Dict, summary: str, model: Optional[str] = None) -> None:
+        """요약 결과 저장"""
+        lookup = self._lookup(video, model)
+        if lookup is None:
+            return
+        self.set_for_hash(
+            lookup['video_id'], lookup['transcript_hash'], summary, lookup['model']
+        )
+
+    def set_for_hash(self, video_id: str, transcript_hash: str, summary: str,
+                     model: Optional[str] = None) -> None:
+        """자막 해시로 요약 결과 저장 (자막 원문 없이 배치 결과를 채울 때 사용)"""
+        if not summary:
+            return
+
+        lookup = {
+            'video_id': video_id,
+            'transcript_hash': transcript_hash,
+            'prompt_version': self.prompt_version,
+            'model': model or self.model,
+        }
+        try:
+            VideoSummary.objects.update_or_create(
+                defaults={'summary': summary},
+                **lookup
+            )
+        except Exception as e:
+            logger.warning(f"요약 저장소 저장 실패: {str(e)}")
+
+    def invalidate_stale(self) -> int:
+        """현재 프롬프트 버전이 아닌 같은 이름의 요약들을 삭제"""
+        deleted, _ = VideoSummary.objects.filter(
+            prompt_version__startswith=f"{self.name}:"
+        ).exclude(
+            prompt_version=self.prompt_version
+        ).delete()
+        if deleted:
+            logger.info(
+                f"이전 프롬프트 버전 요약 {deleted}개 삭제 ({self.name})"
+            )
+        return deleted
+
+    def invalidate(self, video_id: Optional[str] = None, model: Optional[str] = None) -> int:
+        """현재 프롬프트 버전의 요약 삭제 (video_id, model 지정 시 해당 영상/모델만)"""
+        queryset = VideoSummary.objects.filter(prompt_version=self.prompt_version)
+        if video_id:
+            queryset = queryset.filter(video_id=video_id)
+        if model:
+            queryset = queryset.filter(model=model)
+        deleted, _ = queryset.delete()
+        return deleted
+
+    def stats(self, model: Optional[str] = None) -> Dict:
+        """히트/미스 카운터 및 현재 프롬프트 버전의 저장소 현황 (model 지정 시 해당 모델만, 모델별 집계 포함)"""
+        lookups = self.hits + self.misses
+        entries = VideoSummary.objects.filter(prompt_version=self.prompt_version)
+        if model:
+            entries = entries.filter(model=model)
+        by_model = {
+            row['model']: {
+                'entries': row['entries'],
+                'total_reuses': row['total_reuses'] or 0,
+            }
+            for row in entries.values('model').annotate(
+                entries=Count('id'),
+                total_reuses=Sum('hit_count')
+            ).order_by('model')
+        }
+        return {
+            'prompt_version': self.prompt_version,
+            'model': model,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'entries': sum(row['entries'] for row in by_model.values()),
+            'total_reuses': sum(row['total_reuses'] for row in by_model.values()),
+            'by_model': by_model,
+        }
@@ -1,14 +1,28 @@
-from celery import shared_task
+from celery import shared_task, group
 from django.conf import settings
 from .models import Subscription, EmailLog
-from .youtube_mail_service import YouTubeMailService
-from openai import OpenAI
+from .youtube_mail_service import (
+    YouTubeMailService, SUMMARY_MODEL, PROXY_HEALTH_CACHE_KEY,
+    get_summary_store, get_chunk_store, get_proxy_pool
+)
+from .summary_store import SummaryStore
+from .transcript_store import TranscriptStore
+from .llm_metrics import record_llm_calls
+from .llm_providers import get_llm_providers
+from .summarizer import AsyncSummarizer
+from .summary_batch import submit_summary_batch, poll_summary_batches
+from .outbox import (
+    chunked, claim_messages, mark_dispatched, pending_message_ids, prune_messages,
+    recover_stale_messages
+)
+from .video_discovery import (
+    discover_channel_videos, get_active_channel_ids, get_channel_videos,
+    prune_old_videos
+)
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 import base64
 import os
 import pytz
@@ -58,6 +72,12 @@ def prepare_scheduled_emails():
         from datetime import time
         rounded_target_time = time(target_hour, rounded_minute, 0)
         
+        # 23시 45분 이후에 준비하는 0시 발송분은 다음 날 발송
+        send_date = (current_time + timedelta(minutes=10)).date()
+        if target_hour < target_time.hour:
+            send_date += timedelta(days=1)
+        scheduled_at = kst.localize(datetime.combine(send_date, rounded_target_time))
+        
         # 캐시 키 생성
         cache_key = f"prepared_content_{rounded_target_time.strftime('%H_%M')}"
         
@@ -110,22 +130,27 @@ def prepare_scheduled_emails():
         
         # YouTube 메일 서비스 초기화
         mail_service = YouTubeMailService()
+        mail_service.slot_label = rounded_target_time.strftime('%H:%M')
         
         # 자막 수집 (시간이 오래 걸리는 작업)
         logger.info("YouTube 자막 수집 시작...")
-        video_transcripts = mail_service.get_video_transcripts(
+        subscription_channels = mail_service.resolve_subscription_channels(
             list(subscriptions)
         )
+        video_transcripts = mail_service.get_video_transcripts(
+            list(subscriptions), subscription_channels
+        )
         
-        # 콘텐츠 요약 (OpenAI API 호출)
+        # 채널별 콘텐츠 요약 (OpenAI API 호출) - 사용자별 조립은 발송 시점에 수행
         logger.info("콘텐츠 요약 시작...")
-        summarized_content = mail_service.summarize_content(video_transcripts)
+        channel_fragments = mail_service.summarize_channels(video_transcripts)
         
         # 준비된 콘텐츠를 캐시에 저장 (더미 캐시 대응)
         try:
             from django.core.cache import cache
             cache_data = {
-                'content': summarized_content,
+                'fragments': channel_fragments,
+                'subscription_channels': subscription_channels,
                 'subscriptions': [sub.id for sub in subscriptions],
                 'prepared_at': current_time.isoformat()
             }
@@ -134,6 +159,14 @@ def prepare_scheduled_emails():
         except Exception as cache_error:
             logger.warning(f"캐시 저장 실패 (더미 캐시 사용 중): {str(cache_error)}")
         
+        # 사용자별 메일을 미리 렌더링해 발송 대기열에 저장 (발송 작업은 대기열만 처리)
+        enqueued = mail_service.enqueue_summary_emails(
+            list(subscriptions),
+            scheduled_at,
+            channel_fragments=channel_fragments,
+            subscription_channels=subscription_channels
+        )
+        
         return {
             'success': True,
             'message': f'{subscriptions.count()}개 구독에 대한 콘텐츠 준비 완료',
@@ -141,6 +174,10 @@ def prepare_scheduled_emails():
             'cache_key': cache_key,
             'subscription_count': subscriptions.count(),
             'channels_found': len(video_transcripts),
+            'channel_dedup': mail_service.last_fetch_stats,
+            'summary_store': mail_service.summary_store.stats(),
+            'summarizer': mail_service.last_summary_stats,
+            'outbox_enqueued': enqueued,
             'already_prepared': False
         }
         
@@ -154,7 +191,11 @@ def prepare_scheduled_emails():
 
 @shared_task
 def send_scheduled_emails():
-    """정시에 이메일을 발송하는 태스크 (30분 단위 시간 대응)"""
+    """정시에 이메일을 발송하는 태스크 (30분 단위 시간 대응)
+    
+    실제 발송은 send_outbox_chunk 작업들이 나눠 처리하므로, 이 태스크는 대기열 추가와
+    작업 등록 결과만 반환합니다. 발송 결과(send_stats)는 send_outbox_chunk 결과에 있습니다.
+    """
     try:
         kst = pytz.timezone('Asia/Seoul')
         current_time = datetime.now(kst)
@@ -199,8 +240,9 @@ def send_scheduled_emails():
             f"구독에 대한 이메일 발송 시작"
         )
         
-        # 캐시에서 준비된 콘텐츠 확인 (더미 캐시 대응)
-        summarized_content = None
+        # 캐시에서 준비된 채널별 요약 조각 확인 (더미 캐시 대응)
+        channel_fragments = {}
+        subscription_channels = {}
         cached_data = None
         
         try:
@@ -210,40 +252,50 @@ def send_scheduled_emails():
             
             if cached_data:
                 logger.info(f"캐시된 콘텐츠 발견: {cache_key}")
-                summarized_content = cached_data['content']
+                channel_fragments = cached_data['fragments']
+                subscription_channels = cached_data['subscription_channels']
                 
-                # 캐시된 구독 ID와 현재 구독 ID가 일치하는지 확인
+                # 준비 이후 추가된 구독은 요약 조각이 없으므로 빈 콘텐츠로 발송
                 cached_subscription_ids = set(cached_data['subscriptions'])
                 current_subscription_ids = set(sub.id for sub in subscriptions)
                 
                 if cached_subscription_ids == current_subscription_ids:
                     logger.info("캐시된 콘텐츠를 사용하여 이메일 발송")
                 else:
-                    logger.warning("구독 정보가 변경되어 캐시된 콘텐츠를 사용할 수 없습니다.")
-                    summarized_content = None
+                    logger.warning(
+                        f"준비 이후 변경된 구독 "
+                        f"{len(current_subscription_ids - cached_subscription_ids)}개는 "
+                        f"빈 콘텐츠로 발송됩니다."
+                    )
             else:
                 logger.warning("캐시된 콘텐츠가 없습니다. 10분 전 준비 작업이 실행되지 않았을 수 있습니다.")
         except Exception as cache_error:
             logger.warning(f"캐시 조회 실패 (더미 캐시 사용 중): {str(cache_error)}")
         
-        # 캐시된 콘텐츠가 없으면 빈 콘텐츠로 이메일 발송
-        if summarized_content is None:
+        if not channel_fragments:
             logger.warning("준비된 콘텐츠가 없어 빈 콘텐츠로 이메일을 발송합니다.")
-            summarized_content = ""
         
-        # 이메일 발송
+        # 준비 작업에서 대기열에 넣지 못한 수신자(준비 이후 추가된 구독 등)만 추가
         mail_service = YouTubeMailService()
-        success = mail_service.send_summary_emails(
-            list(subscriptions), 
-            summarized_content
+        scheduled_at = kst.localize(datetime.combine(current_time.date(), exact_time))
+        enqueued = mail_service.enqueue_summary_emails(
+            list(subscriptions),
+            scheduled_at,
+            channel_fragments=channel_fragments,
+            subscription_channels=subscription_channels
         )
         
+        # 대기열의 메일을 묶음 단위 발송 작업으로 나눠 여러 워커가 동시에 처리
+        dispatch = dispatch_outbox()
+        
         return {
-            'success': success,
-            'message': f'{subscriptions.count()}개 구독에 대한 이메일 발송 완료',
+            'success': True,
+            'message': f'{subscriptions.count()}개 구독에 대한 이메일 발송 작업 등록 완료',
             'sent_time': exact_time.strftime('%H:%M'),
             'used_cache': cached_data is not None,
-            'subscription_count': subscriptions.count()
+            'subscription_count': subscriptions.count(),
+            'outbox_enqueued': enqueued,
+            **dispatch
         }
         
     except Exception as e:
@@ -254,6 +306,207 @@ def send_scheduled_emails():
         }
 
 
+def dispatch_outbox(redispatch_after: int = None) -> dict:
+    """발송할 차례가 된 대기 메일을 묶음으로 나눠 send_outbox_chunk 작업으로 등록"""
+    message_ids = pending_message_ids(redispatch_after=redispatch_after)
+    chunks = chunked(message_ids, getattr(settings, 'OUTBOX_CHUNK_SIZE', 20))
+    if chunks:
+        mark_dispatched(message_ids)
+        group(send_outbox_chunk.s(chunk) for chunk in chunks).apply_async()
+        logger.info(f"발송 대기열 {len(message_ids)}개를 {len(chunks)}개 작업으로 등록")
+    return {'outbox_dispatched': len(message_ids), 'outbox_chunks': len(chunks)}
+
+
+# 발송 작업마다 서비스를 다시 초기화하지 않도록 워커 프로세스당 하나만 생성
+_outbox_mail_service = None
+
+
+def get_outbox_mail_service() -> YouTubeMailService:
+    """대기열 발송용 메일 서비스 (워커 프로세스 단위 재사용)"""
+    global _outbox_mail_service
+    if _outbox_mail_service is None:
+        _outbox_mail_service = YouTubeMailService()
+    return _outbox_mail_service
+
+
+@shared_task(acks_late=True)
+def send_outbox_chunk(message_ids):
+    """대기열 메일 묶음 발송 (이미 다른 워커가 선점한 메일은 건너뜀)
+    
+    작업이 다시 전달되어도 대기 상태인 메일만 선점하므로 중복 발송되지 않습니다.
+    """
+    try:
+        messages = claim_messages(message_ids)
+        if not messages:
+            return {'success': True, 'message': '발송할 메일이 없습니다.', 'recipients': 0}
+        
+        stats = get_outbox_mail_service().send_outbox_messages(messages)
+        return {
+            'success': stats['succeeded'] == stats['recipients'],
+            'message': f"{stats['succeeded']}/{stats['recipients']}개 메일 발송",
+            'send_stats': stats
+        }
+    
+    except Exception as e:
+        logger.error(f"대기열 메일 발송 실패: {str(e)}")
+        return {'success': False, 'message': f'대기열 메일 발송 실패: {str(e)}'}
+
+
+@shared_task
+def drain_outbox():
+    """중단된 발송 작업 정리 후 남은 대기 메일 재등록"""
+    try:
+        claim_timeout = getattr(settings, 'OUTBOX_CLAIM_TIMEOUT', 600)
+        recovered = recover_stale_messages(
+            claim_timeout,
+            getattr(settings, 'OUTBOX_MAX_DELAY_MINUTES', 180)
+        )
+        # 등록된 지 claim_timeout이 지나도 선점되지 않은 메일만 다시 등록
+        dispatch = dispatch_outbox(redispatch_after=claim_timeout)
+        return {
+            'success': True,
+            'message': '발송 대기열 점검 완료',
+            **recovered,
+            **dispatch
+        }
+    
+    except Exception as e:
+        logger.error(f"발송 대기열 점검 실패: {str(e)}")
+        return {'success': False, 'message': f'발송 대기열 점검 실패: {str(e)}'}
+
+
+@shared_task
+def discover_new_videos():
+    """활성 채널의 새 업로드 영상을 Video 테이블에 수집하는 정기 태스크 (매시간)"""
+    try:
+        mail_service = YouTubeMailService()
+        if not mail_service.downloader or not mail_service.downloader.youtube:
+            logger.warning("YouTube API 인증이 되지 않아 영상 수집을 건너뜁니다.")
+            return {
+                'success': False,
+                'message': 'YouTube API 인증이 되지 않았습니다.'
+            }
+        
+        # 채널 ID가 아직 없는 활성 구독은 먼저 해석
+        unresolved = Subscription.objects.filter(
+            is_active=True,
+            youtube_channel_id__isnull=True
+        )
+        if unresolved.exists():
+            mail_service.resolve_subscription_channels(list(unresolved))
+        
+        channel_ids = get_active_channel_ids()
+        stats = discover_channel_videos(mail_service.downloader, channel_ids)
+        mail_service.invalidate_channel_ids(stats['invalid_channel_ids'])
+        stats['pruned_videos'] = prune_old_videos()
+        
+        # 배치 모드: 새 영상의 자막을 미리 수집하고 요약 요청을 Batch API로 제출
+        if getattr(settings, 'SUMMARY_BATCH_MODE', False):
+            try:
+                transcripts = mail_service.downloader.get_transcripts_for_videos(
+                    get_channel_videos(channel_ids)
+                )
+                stats['batch'] = submit_summary_batch(mail_service, transcripts)
+            except Exception as batch_error:
+                logger.error(f"요약 배치 제출 실패: {str(batch_error)}")
+                stats['batch'] = {'error': str(batch_error)}
+        
+        return {
+            'success': True,
+            'message': f'{len(channel_ids)}개 채널 영상 수집 완료',
+            **stats
+        }
+        
+    except Exception as e:
+        logger.error(f"영상 수집 작업 실패: {str(e)}")
+        return {
+            'success': False,
+            'message': f'영상 수집 실패: {str(e)}'
+        }
+
+
+@shared_task
+def resolve_subscription_channel_task(subscription_id):
+    """새 구독의 채널 ID를 미리 해석 (구독 생성 API에서 등록)
+    
+    발송 준비 작업과 같은 인증된 다운로더로 해석하므로 채널명만 입력한 구독도 해석되며,
+    실패하면 발송 준비 시점에 다시 해석합니다.
+    """
+    try:
+        subscription = Subscription.objects.get(id=subscription_id)
+        channel_id = YouTubeMailService().resolve_channel_id(subscription)
+        return {
+            'success': channel_id is not None,
+            'message': '채널 ID 확인 완료' if channel_id else '채널 ID를 확인하지 못했습니다.',
+            'channel_id': channel_id
+        }
+    
+    except Subscription.DoesNotExist:
+        return {'success': False, 'message': '구독 정보를 찾을 수 없습니다.'}
+    except Exception as e:
+        logger.error(f"채널 ID 확인 실패: {str(e)}")
+        return {'success': False, 'message': f'채널 ID 확인 실패: {str(e)}'}
+
+
+@shared_task
+def check_summary_batches():
+    """제출한 요약 배치의 완료 여부를 확인하고 결과를 요약 저장소에 저장"""
+    try:
+        stats = poll_summary_batches(get_summary_store())
+        return {
+            'success': True,
+            'message': f"배치 {stats['completed']}개 완료, 요약 {stats['summaries_stored']}개 저장",
+            **stats
+        }
+    
+    except Exception as e:
+        logger.error(f"요약 배치 확인 실패: {str(e)}")
+        return {'success': False, 'message': f'요약 배치 확인 실패: {str(e)}'}
+
+
+@shared_task
+def check_transcript_proxies():
+    """자막 프록시 상태 확인 후 정상 목록을 캐시에 저장 (발송 경로에서는 확인하지 않음)"""
+    try:
+        from django.core.cache import cache
+        
+        pool = get_proxy_pool()
+        if pool is None:
+            return {'success': True, 'message': '설정된 프록시 없음', 'healthy': []}
+        
+        healthy = pool.check_health()
+        # 다음 확인이 조금 늦어져도 목록이 만료되어 직접 연결로 바뀌지 않도록
+        # 확인 주기보다 길게 유지 (주기 + 절반, 최소 5분 여유)
+        interval = max(1, getattr(settings, 'TRANSCRIPT_PROXY_CHECK_INTERVAL_MINUTES', 10)) * 60
+        cache.set(PROXY_HEALTH_CACHE_KEY, healthy, timeout=interval + max(interval // 2, 300))
+        
+        return {
+            'success': True,
+            'message': f'프록시 {len(healthy)}/{len(pool.proxy_urls)}개 정상',
+            'healthy': healthy
+        }
+    
+    except Exception as e:
+        logger.error(f"프록시 상태 확인 실패: {str(e)}")
+        return {'success': False, 'message': f'프록시 상태 확인 실패: {str(e)}'}
+
+
+@shared_task
+def cleanup_old_transcripts():
+    """보관 기간이 지난 자막 삭제"""
+    try:
+        store = TranscriptStore(
+            retention_days=getattr(settings, 'TRANSCRIPT_RETENTION_DAYS', 14)
+        )
+        deleted = store.prune()
+        logger.info(f"오래된 자막 {deleted}개 삭제")
+        return {'success': True, 'message': '자막 정리 완료', 'deleted': deleted}
+    
+    except Exception as e:
+        logger.error(f"자막 정리 실패: {str(e)}")
+        return {'success': False, 'message': f'자막 정리 실패: {str(e)}'}
+
+
 @shared_task
 def send_test_email_task(subscription_id):
     """테스트 이메일 발송을 위한 별칭 함수"""
@@ -271,15 +524,21 @@ def test_email_task(subscription_id):
         mail_service = YouTubeMailService()
         
         # 자막 수집
-        video_transcripts = mail_service.get_video_transcripts([subscription])
+        subscription_channels = mail_service.resolve_subscription_channels(
+            [subscription]
+        )
+        video_transcripts = mail_service.get_video_transcripts(
+            [subscription], subscription_channels
+        )
         
         # 콘텐츠 요약
-        summarized_content = mail_service.summarize_content(video_transcripts)
+        channel_fragments = mail_service.summarize_channels(video_transcripts)
         
         # 이메일 발송
         success = mail_service.send_summary_emails(
-            [subscription], 
-            summarized_content
+            [subscription],
+            channel_fragments=channel_fragments,
+            subscription_channels=subscription_channels
         )
         
         if success:
@@ -287,7 +546,8 @@ def test_email_task(subscription_id):
             return {
                 'success': True,
                 'message': '테스트 이메일 발송 성공',
-                'email': subscription.email
+                'email': subscription.email,
+                'summary_store': mail_service.summary_store.stats()
             }
         else:
             logger.error(f"테스트 이메일 발송 실패: {subscription.email}")
@@ -337,34 +597,36 @@ def cleanup_old_cache():
                         cache.delete(cache_key)
                         logger.info(f"오래된 캐시 삭제: {cache_key}")
         
+        # 프롬프트 템플릿이 변경된 이전 버전 요약 정리
+        stale_summaries = get_summary_store().invalidate_stale()
+        stale_summaries += get_chunk_store().invalidate_stale()
+        stale_summaries += get_transcript_summary_store().invalidate_stale()
+        
+        # 보관 기간이 지난 발송 대기열 정리
+        outbox_deleted = prune_messages(getattr(settings, 'OUTBOX_RETENTION_DAYS', 7))
+        
         logger.info("캐시 정리 완료")
-        return {'success': True, 'message': '캐시 정리 완료'}
+        return {
+            'success': True,
+            'message': '캐시 정리 완료',
+            'stale_summaries_deleted': stale_summaries,
+            'outbox_deleted': outbox_deleted
+        }
         
     except Exception as e:
         logger.error(f"캐시 정리 실패: {str(e)}")
         return {'success': False, 'message': f'캐시 정리 실패: {str(e)}'}
 
 
-def summarize_transcripts(transcripts):
-    """자막을 요약합니다."""
-    if not transcripts:
-        return ""
-    
-    try:
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
-        summaries = []
-        for channel_name, videos in transcripts.items():
-            channel_summary = f"<h2>{channel_name}</h2>\n"
-            
-            for video in videos:
-                prompt = f"""
+TRANSCRIPT_SUMMARY_SYSTEM_PROMPT = "당신은 유튜브 영상 내용을 분석하고 요약하는 전문가입니다."
+
+TRANSCRIPT_SUMMARY_PROMPT_TEMPLATE = """
                 다음 유튜브 영상의 자막을 분석하고 정리해주세요.
-                제목: {video['title']}
-                내용: {video['transcript']}
+                제목: {title}
+                내용: {transcript}
                 
                 다음 형식으로 작성해주세요:
-                <h3>{video['title']}</h3>
+                <h3>{title}</h3>
                 <p>영상 개요: [전체적인 내용 한 문장으로]</p>
                 <ul>
                 <li>주요 논점 1</li>
@@ -372,22 +634,77 @@ def summarize_transcripts(transcripts):
                 <li>주요 논점 3</li>
                 </ul>
                 <p>총평: [내용에 대한 총평]</p>
-                <a href="{video['url']}" target="_blank">영상 보기</a>
+                <a href="{url}" target="_blank">영상 보기</a>
                 """
-                
-                response = client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": "당신은 유튜브 영상 내용을 분석하고 요약하는 전문가입니다."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=2048,
-                    temperature=0.3
-                )
-                
-                summary = response.choices[0].message.content
-                channel_summary += summary + "\n"
-            
+
+
+def get_transcript_summary_store():
+    """summarize_transcripts용 요약 저장소"""
+    return SummaryStore(
+        'transcript',
+        TRANSCRIPT_SUMMARY_SYSTEM_PROMPT + TRANSCRIPT_SUMMARY_PROMPT_TEMPLATE,
+        SUMMARY_MODEL
+    )
+
+
+def summarize_transcripts(transcripts):
+    """자막을 요약합니다."""
+    if not transcripts:
+        return ""
+    
+    try:
+        summary_store = get_transcript_summary_store()
+        summarizer = AsyncSummarizer(
+            get_llm_providers(),
+            SUMMARY_MODEL,
+            max_concurrency=getattr(settings, 'SUMMARY_CONCURRENCY', 8),
+            requests_per_minute=getattr(settings, 'OPENAI_REQUESTS_PER_MINUTE', 500),
+            tokens_per_minute=getattr(settings, 'OPENAI_TOKENS_PER_MINUTE', 300000)
+        )
+        summarizer.call_recorder = record_llm_calls
+        
+        # 저장소에 없는 영상만 모아 한 번에 요약
+        channel_parts = []
+        jobs = []
+        job_slots = []
+        for channel_name, videos in transcripts.items():
+            parts = []
+            for video in videos:
+                cached_summary = summary_store.get(video)
+                if cached_summary is None:
+                    prompt = TRANSCRIPT_SUMMARY_PROMPT_TEMPLATE.format(
+                        title=video['title'],
+                        transcript=video['transcript'],
+                        url=video['url']
+                    )
+                    jobs.append({
+                        'messages': [
+                            {"role": "system", "content": TRANSCRIPT_SUMMARY_SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt}
+                        ],
+                        'max_tokens': 2048,
+                        'purpose': 'transcript',
+                        'video_id': SummaryStore.get_video_id(video),
+                    })
+                    job_slots.append((len(channel_parts), len(parts), video))
+                parts.append(cached_summary)
+            channel_parts.append((channel_name, parts))
+        
+        # 완료된 요약은 즉시 저장 (중단되어도 다음 실행에서 재사용)
+        def store_summary(job_index: int, summary: str):
+            summary_store.set(job_slots[job_index][2], summary)
+        
+        results = summarizer.run(jobs, on_result=store_summary)
+        for (channel_index, video_index, video), summary in zip(job_slots, results):
+            if summary is None:
+                logger.error(f"영상 요약 실패: {video['title']}")
+                continue
+            channel_parts[channel_index][1][video_index] = summary
+        
+        summaries = []
+        for channel_name, parts in channel_parts:
+            channel_summary = f"<h2>{channel_name}</h2>\n"
+            channel_summary += ''.join(part + "\n" for part in parts if part is not None)
             summaries.append(channel_summary)
         
         return '\n'.join(summaries)
@@ -597,29 +914,15 @@ def send_no_content_email(subscription, email_log):
 
 
 def get_gmail_service():
-    """Gmail API 서비스 가져오기"""
-    creds = None
-    
-    if os.path.exists(settings.YOUTUBE_API_TOKEN_PATH):
-        creds = Credentials.from_authorized_user_file(
-            settings.YOUTUBE_API_TOKEN_PATH, 
-            SCOPES
-        )
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                settings.YOUTUBE_API_CREDENTIALS_PATH, 
-                SCOPES
-            )
-            creds = flow.run_local_server(port=0)
-        
-        with open(settings.YOUTUBE_API_TOKEN_PATH, 'w') as token:
-            token.write(creds.to_json())
-    
-    return build('gmail', 'v1', credentials=creds)
+    """Gmail API 서비스 가져오기 (프로세스 단위로 캐시된 서비스 객체 재사용)"""
+    from auth_manager import GoogleAuthManager
+    return GoogleAuthManager.get_service(
+        service_type='gmail',
+        credentials_path=settings.YOUTUBE_API_CREDENTIALS_PATH,
+        api_name='gmail',
+        api_version='v1',
+        scopes=SCOPES
+    )
 
 
 @shared_task
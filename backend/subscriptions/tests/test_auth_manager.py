@@ -0,0 +1,101 @@
+import os
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from auth_manager import GoogleAuthManager
+
+CREDENTIALS_PATH = '/tmp/ysms-auth-test/credentials.json'
+TOKEN_PATH = os.path.join(os.path.dirname(CREDENTIALS_PATH), 'token.json')
+
+
+class FakeCredentials:
+    """refresh()가 release 이벤트까지 멈추는 인증 정보"""
+
+    def __init__(self, valid=True):
+        self.valid = valid
+        self.refresh_token = 'refresh-token'
+        self.refresh_calls = 0
+        self.refreshing = threading.Event()
+        self.release = threading.Event()
+
+    def refresh(self, request):
+        self.refresh_calls += 1
+        self.refreshing.set()
+        self.release.wait(5)
+        self.valid = True
+
+
+def cache_key(api_name, scopes):
+    return (api_name, 'v1', tuple(sorted(scopes)), TOKEN_PATH)
+
+
+class GoogleAuthManagerLockTests(SimpleTestCase):
+    def setUp(self):
+        GoogleAuthManager.clear_cache()
+        self.addCleanup(GoogleAuthManager.clear_cache)
+        patcher = mock.patch.object(GoogleAuthManager, '_save_token')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_service(self, api_name, scopes, results=None):
+        service = GoogleAuthManager.get_service(
+            api_name, CREDENTIALS_PATH, api_name, 'v1', scopes=scopes
+        )
+        if results is not None:
+            results.append(service)
+        return service
+
+    def test_refresh_does_not_block_other_services(self):
+        gmail_creds = FakeCredentials(valid=False)
+        youtube_creds = FakeCredentials()
+        GoogleAuthManager._services[cache_key('gmail', ['gmail'])] = ('gmail-service', gmail_creds)
+        GoogleAuthManager._services[cache_key('youtube', ['youtube'])] = ('youtube-service', youtube_creds)
+
+        results = []
+        refreshing = threading.Thread(target=self.get_service, args=('gmail', ['gmail'], results))
+        refreshing.start()
+        self.assertTrue(gmail_creds.refreshing.wait(5))
+
+        # gmail 토큰을 갱신하는 동안에도 다른 서비스는 바로 반환
+        lookup = threading.Thread(target=self.get_service, args=('youtube', ['youtube'], results))
+        lookup.start()
+        lookup.join(1)
+        self.assertFalse(lookup.is_alive())
+        self.assertEqual(results, ['youtube-service'])
+
+        gmail_creds.release.set()
+        refreshing.join(5)
+        self.assertEqual(results, ['youtube-service', 'gmail-service'])
+
+    def test_concurrent_callers_refresh_once(self):
+        creds = FakeCredentials(valid=False)
+        GoogleAuthManager._services[cache_key('gmail', ['gmail'])] = ('gmail-service', creds)
+
+        results = []
+        threads = [
+            threading.Thread(target=self.get_service, args=('gmail', ['gmail'], results))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(creds.refreshing.wait(5))
+        creds.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(creds.refresh_calls, 1)
+        self.assertEqual(results, ['gmail-service'] * 4)
+
+    def test_new_credentials_are_loaded_without_holding_the_lock(self):
+        def load_credentials(credentials_path, token_path, scopes):
+            # 브라우저 인증(run_local_server) 중에도 잠금을 잡고 있지 않아야 함
+            self.assertFalse(GoogleAuthManager._lock.locked())
+            return FakeCredentials()
+
+        with mock.patch.object(GoogleAuthManager, '_load_credentials', side_effect=load_credentials), \
+                mock.patch('auth_manager.build', return_value='built-service'):
+            self.assertEqual(self.get_service('gmail', ['gmail']), 'built-service')
+            # 두 번째 호출은 캐시된 서비스 사용
+            self.assertEqual(self.get_service('gmail', ['gmail']), 'built-service')
@@ -0,0 +1,98 @@
+from datetime import datetime
+from unittest import mock
+
+import pytz
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils.module_loading import import_string
+
+from subscriptions import tasks
+from subscriptions.models import Subscription
+from subscriptions.views import check_cache_health
+
+# settings.py에서 REDIS_CONNECTION_CLASS=fakeredis.FakeConnection을 지정했을 때와 같은 설정
+FAKEREDIS_CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://localhost:6379/15',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+            'CONNECTION_POOL_KWARGS': {
+                'connection_class': import_string('fakeredis.FakeConnection'),
+            },
+        },
+        'KEY_PREFIX': 'youtube_mail_test',
+        'TIMEOUT': 3600,
+    }
+}
+
+KST = pytz.timezone('Asia/Seoul')
+
+
+def frozen_datetime(frozen):
+    """tasks 모듈의 datetime.now()만 고정한 datetime 대체 클래스"""
+    class FrozenDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return frozen.astimezone(tz) if tz else frozen
+    return FrozenDateTime
+
+
+@override_settings(CACHES=FAKEREDIS_CACHES)
+class FakeRedisCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.subscription = Subscription.objects.create(
+            name='테스트',
+            email='cache@example.com',
+            youtube_channel_url='https://www.youtube.com/channel/UC0000000000000000000001',
+            notification_time='09:00',
+        )
+
+    def test_check_cache_health_uses_shared_redis_cache(self):
+        health = check_cache_health()
+
+        self.assertTrue(health['healthy'])
+        self.assertTrue(health['shared'])
+        self.assertEqual(health['backend'], 'django_redis.cache.RedisCache')
+        self.assertIsNone(health['error'])
+
+    def test_prepared_fragments_round_trip_from_prepare_to_send(self):
+        fragments = {'UC0000000000000000000001': '<div class="channel-section">요약</div>'}
+        subscription_channels = {self.subscription.id: 'UC0000000000000000000001'}
+
+        service = mock.MagicMock()
+        service.resolve_subscription_channels.return_value = subscription_channels
+        service.get_video_transcripts.return_value = {'채널': []}
+        service.summarize_channels.return_value = fragments
+        service.enqueue_summary_emails.return_value = 1
+        service.last_fetch_stats = {}
+        service.last_summary_stats = {}
+        service.summary_store.stats.return_value = {}
+
+        # 08:50 준비 작업 -> 09:00 발송분
+        with mock.patch.object(tasks, 'YouTubeMailService', return_value=service), \
+                mock.patch.object(tasks, 'datetime',
+                                  frozen_datetime(KST.localize(datetime(2026, 10, 17, 8, 50)))):
+            result = tasks.prepare_scheduled_emails()
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['cache_key'], 'prepared_content_09_00')
+        cached = cache.get('prepared_content_09_00')
+        self.assertEqual(cached['fragments'], fragments)
+        self.assertEqual(cached['subscription_channels'], subscription_channels)
+        self.assertEqual(cached['subscriptions'], [self.subscription.id])
+
+        # 09:00 발송 작업은 같은 캐시에서 요약 조각을 읽음
+        with mock.patch.object(tasks, 'YouTubeMailService', return_value=service), \
+                mock.patch.object(tasks, 'dispatch_outbox', return_value={}), \
+                mock.patch.object(tasks, 'datetime',
+                                  frozen_datetime(KST.localize(datetime(2026, 10, 17, 9, 0)))):
+            result = tasks.send_scheduled_emails()
+
+        self.assertTrue(result['success'])
+        self.assertTrue(result['used_cache'])
+        _, kwargs = service.enqueue_summary_emails.call_args
+        self.assertEqual(kwargs['channel_fragments'], fragments)
+        self.assertEqual(kwargs['subscription_channels'], subscription_channels)
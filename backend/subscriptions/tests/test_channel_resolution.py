@@ -0,0 +1,47 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from subscriptions import tasks
+from subscriptions.models import Subscription
+from subscriptions.youtube_mail_service import YouTubeMailService
+
+
+class ResolveSubscriptionChannelTaskTests(TestCase):
+    def setUp(self):
+        self.subscription = Subscription.objects.create(
+            name='테스트',
+            email='channel@example.com',
+            youtube_channel_url='테스트 채널',
+            notification_time='09:00',
+        )
+        self.downloader = mock.MagicMock()
+        patcher = mock.patch.object(YouTubeMailService, '_initialize_services', autospec=True,
+                                    side_effect=self.initialize_services)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def initialize_services(self, service):
+        # 인증된 다운로더가 있는 서비스 (채널명 검색 가능)
+        service.downloader = self.downloader
+
+    def test_resolves_channel_name_with_service_downloader(self):
+        self.downloader.get_channel_id_by_name.return_value = 'UC0000000000000000000002'
+
+        result = tasks.resolve_subscription_channel_task(self.subscription.id)
+
+        self.assertTrue(result['success'])
+        self.downloader.get_channel_id_by_name.assert_called_once_with('테스트 채널')
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.youtube_channel_id, 'UC0000000000000000000002')
+        self.assertIsNotNone(self.subscription.channel_id_resolved_at)
+
+    def test_unresolved_channel_is_left_for_prepare_time(self):
+        self.downloader.get_channel_id_by_name.return_value = None
+
+        result = tasks.resolve_subscription_channel_task(self.subscription.id)
+
+        self.assertFalse(result['success'])
+        self.subscription.refresh_from_db()
+        self.assertIsNone(self.subscription.youtube_channel_id)
+        self.assertIsNone(self.subscription.channel_id_resolved_at)
@@ -0,0 +1,70 @@
+import json
+import socket
+from unittest import mock
+
+import httplib2
+from django.test import SimpleTestCase
+from googleapiclient.errors import HttpError
+
+from subscriptions import gmail_sender
+from subscriptions.gmail_sender import GmailSender
+
+MESSAGE = {'to': 'user@example.com', 'subject': '제목', 'html': '<p>본문</p>'}
+
+
+def http_error(status: int, reason: str = '') -> HttpError:
+    """Gmail API 형식의 오류 응답"""
+    content = {'error': {'code': status, 'message': f"status {status}"}}
+    if reason:
+        content['error']['errors'] = [{'domain': 'usageLimits', 'reason': reason, 'message': reason}]
+    return HttpError(httplib2.Response({'status': status}), json.dumps(content).encode('utf-8'))
+
+
+class GmailSenderRetryTests(SimpleTestCase):
+    def setUp(self):
+        self.service = mock.Mock()
+        self.execute = self.service.users.return_value.messages.return_value.send.return_value.execute
+        patcher = mock.patch.object(gmail_sender.time, 'sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def send(self, *outcomes) -> dict:
+        self.execute.side_effect = list(outcomes) + [{'id': 'sent-id'}]
+        return GmailSender(self.service, max_workers=1, max_retries=3).send_many([MESSAGE])[0]
+
+    def test_retries_rate_limit_responses(self):
+        for error in [
+            http_error(429),
+            http_error(403, 'rateLimitExceeded'),
+            http_error(403, 'userRateLimitExceeded'),
+        ]:
+            with self.subTest(status=error.resp.status, reason=error.reason):
+                result = self.send(error)
+
+                self.assertTrue(result['success'])
+                self.assertEqual(result['message_id'], 'sent-id')
+                self.assertEqual(result['attempts'], 2)
+
+    def test_retries_connection_that_never_reached_gmail(self):
+        result = self.send(ConnectionRefusedError('refused'))
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['attempts'], 2)
+
+    def test_does_not_resend_when_gmail_may_have_accepted_the_message(self):
+        for error in [
+            http_error(500),
+            http_error(503),
+            socket.timeout('timed out'),
+            ConnectionResetError('reset'),
+            http_error(403, 'insufficientPermissions'),
+        ]:
+            with self.subTest(error=repr(error)):
+                self.execute.reset_mock()
+
+                result = self.send(error)
+
+                self.assertFalse(result['success'])
+                self.assertEqual(result['attempts'], 1)
+                self.assertEqual(self.execute.call_count, 1)
+                self.assertTrue(result['error'])
@@ -0,0 +1,133 @@
+import socket
+import time
+from unittest import mock
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP, AuthResult
+from django.core.mail import send_mail
+from django.test import SimpleTestCase, override_settings
+
+from subscriptions.mail_backends import PooledSMTPEmailBackend
+
+
+class RecordingSMTP(SMTP):
+    """연결마다 transport를 기록하는 SMTP 서버 (테스트에서 서버 쪽 연결 종료용)"""
+
+    def connection_made(self, transport):
+        super().connection_made(transport)
+        self.event_handler.transports.append(transport)
+
+
+class RecordingHandler:
+    """받은 메일과 로그인 횟수를 기록하는 aiosmtpd 핸들러"""
+
+    def __init__(self):
+        self.messages = []
+        self.logins = 0
+        self.transports = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return '250 OK'
+
+    def authenticate(self, server, session, envelope, mechanism, auth_data):
+        self.logins += 1
+        return AuthResult(success=True)
+
+
+class RecordingController(Controller):
+    def factory(self):
+        return RecordingSMTP(
+            self.handler,
+            authenticator=self.handler.authenticate,
+            auth_require_tls=False,
+        )
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class PooledSMTPEmailBackendTests(SimpleTestCase):
+    def setUp(self):
+        self.handler = RecordingHandler()
+        self.controller = RecordingController(self.handler, hostname='127.0.0.1', port=free_port())
+        self.controller.start()
+        # start()가 서버 확인용으로 맺은 연결은 제외
+        self.handler.transports.clear()
+        self.addCleanup(self.controller.stop)
+        self.addCleanup(PooledSMTPEmailBackend.close_all)
+
+        settings_override = override_settings(
+            EMAIL_BACKEND='subscriptions.mail_backends.PooledSMTPEmailBackend',
+            EMAIL_HOST='127.0.0.1',
+            EMAIL_PORT=self.controller.port,
+            EMAIL_HOST_USER='sender@example.com',
+            EMAIL_HOST_PASSWORD='password',
+            EMAIL_USE_TLS=False,
+            EMAIL_USE_SSL=False,
+            EMAIL_POOL_SIZE=2,
+            EMAIL_POOL_IDLE_TIMEOUT=60,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def send(self, recipient='user@example.com'):
+        return send_mail('제목', '본문', 'sender@example.com', [recipient])
+
+    def disconnect_server_side(self):
+        """서버가 열려 있는 모든 연결을 끊음 (유휴 연결 종료 등)"""
+        for transport in self.handler.transports:
+            self.controller.loop.call_soon_threadsafe(transport.close)
+        # 서버 이벤트 루프가 연결을 닫을 때까지 잠시 대기
+        time.sleep(0.2)
+
+    def test_reuses_pooled_connection_across_send_mail_calls(self):
+        for index in range(5):
+            self.assertEqual(self.send(f"user{index}@example.com"), 1)
+
+        self.assertEqual(len(self.handler.messages), 5)
+        self.assertEqual(self.handler.logins, 1)
+        self.assertEqual(len(self.handler.transports), 1)
+
+    def test_drops_connection_idle_longer_than_idle_timeout(self):
+        self.send()
+        self.assertEqual(self.handler.logins, 1)
+
+        later = time.monotonic() + 120
+        with mock.patch('subscriptions.mail_backends.time.monotonic', return_value=later):
+            self.send()
+
+        self.assertEqual(len(self.handler.messages), 2)
+        self.assertEqual(self.handler.logins, 2)
+        self.assertEqual(len(self.handler.transports), 2)
+
+    def test_send_reconnects_and_resends_once_after_server_disconnect(self):
+        self.send()
+        self.disconnect_server_side()
+
+        with self.assertLogs('subscriptions.mail_backends', 'WARNING'):
+            self.assertEqual(self.send('after@example.com'), 1)
+
+        self.assertEqual(
+            [envelope.rcpt_tos for envelope in self.handler.messages],
+            [['user@example.com'], ['after@example.com']]
+        )
+        self.assertEqual(self.handler.logins, 2)
+
+    def test_send_raw_reconnects_and_resends_once_after_server_disconnect(self):
+        backend = PooledSMTPEmailBackend()
+        raw_message = b'Subject: raw\r\nTo: raw@example.com\r\n\r\nbody\r\n'
+        self.assertTrue(backend.send_raw('sender@example.com', ['raw@example.com'], raw_message))
+        self.disconnect_server_side()
+
+        with self.assertLogs('subscriptions.mail_backends', 'WARNING'):
+            self.assertTrue(backend.send_raw('sender@example.com', ['raw@example.com'], raw_message))
+
+        self.assertEqual(len(self.handler.messages), 2)
+        self.assertTrue(all(
+            envelope.original_content.startswith(b'Subject: raw') for envelope in self.handler.messages
+        ))
+        self.assertEqual(self.handler.logins, 2)
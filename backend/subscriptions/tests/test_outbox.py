@@ -0,0 +1,159 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from subscriptions import tasks
+from subscriptions.models import EmailLog, OutboxMessage, Subscription, User
+from subscriptions.outbox import (
+    claim_messages, enqueue_messages, make_idempotency_key, recover_stale_messages, stage_message
+)
+from subscriptions.youtube_mail_service import YouTubeMailService
+
+
+class OutboxTestMixin:
+    def setUp(self):
+        self.scheduled_at = timezone.now().replace(second=0, microsecond=0) - timedelta(minutes=1)
+
+    def create_subscription(self, email: str, **fields) -> Subscription:
+        return Subscription.objects.create(
+            name='테스트',
+            email=email,
+            youtube_channel_url='https://www.youtube.com/channel/UC0000000000000000000001',
+            notification_time='09:00',
+            **fields
+        )
+
+    def stage(self, email: str, subscription_ids=None) -> OutboxMessage:
+        message = stage_message(
+            make_idempotency_key(self.scheduled_at, email), self.scheduled_at,
+            email, '제목', f"<p>{email} 요약</p>"
+        )
+        message.subscription_ids = subscription_ids or []
+        return message
+
+    def enqueue(self, *emails) -> list:
+        enqueue_messages([self.stage(email) for email in emails])
+        return list(OutboxMessage.objects.order_by('id').values_list('id', flat=True))
+
+
+class OutboxQueueTests(OutboxTestMixin, TestCase):
+    def test_enqueueing_same_idempotency_key_twice_stores_one_row(self):
+        self.assertEqual(enqueue_messages([self.stage('user@example.com')]), 1)
+        self.assertEqual(enqueue_messages([self.stage('USER@example.com ')]), 0)
+
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    def test_claims_on_same_ids_split_rows_without_overlap(self):
+        message_ids = self.enqueue(*[f"user{index}@example.com" for index in range(5)])
+
+        first = claim_messages(message_ids[:3])
+        second = claim_messages(message_ids)
+
+        first_ids = {message.id for message in first}
+        second_ids = {message.id for message in second}
+        self.assertEqual(first_ids, set(message_ids[:3]))
+        self.assertEqual(second_ids, set(message_ids[3:]))
+        self.assertNotEqual(first[0].claim_token, second[0].claim_token)
+        self.assertEqual(claim_messages(message_ids), [])
+        self.assertFalse(
+            OutboxMessage.objects.exclude(status=OutboxMessage.STATUS_CLAIMED).exists()
+        )
+
+    def test_recover_stale_messages(self):
+        claimed_id, sending_id, expired_id, fresh_id = self.enqueue(
+            'claimed@example.com', 'sending@example.com',
+            'expired@example.com', 'fresh@example.com'
+        )
+        stale_at = timezone.now() - timedelta(minutes=30)
+        OutboxMessage.objects.filter(id=claimed_id).update(
+            status=OutboxMessage.STATUS_CLAIMED, claim_token='token', claimed_at=stale_at
+        )
+        OutboxMessage.objects.filter(id=sending_id).update(
+            status=OutboxMessage.STATUS_SENDING, claim_token='token', claimed_at=stale_at
+        )
+        OutboxMessage.objects.filter(id=expired_id).update(
+            scheduled_at=timezone.now() - timedelta(hours=4)
+        )
+
+        recovered = recover_stale_messages(claim_timeout=600, max_delay_minutes=180)
+
+        self.assertEqual(recovered, {'released': 1, 'in_doubt': 1, 'expired': 1})
+        statuses = dict(OutboxMessage.objects.values_list('id', 'status'))
+        self.assertEqual(statuses[claimed_id], OutboxMessage.STATUS_PENDING)
+        self.assertEqual(statuses[sending_id], OutboxMessage.STATUS_FAILED)
+        self.assertEqual(statuses[expired_id], OutboxMessage.STATUS_FAILED)
+        self.assertEqual(statuses[fresh_id], OutboxMessage.STATUS_PENDING)
+        self.assertEqual(OutboxMessage.objects.get(id=claimed_id).claim_token, '')
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class SendOutboxChunkTests(OutboxTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        with mock.patch.object(YouTubeMailService, '_initialize_services'):
+            service = YouTubeMailService()
+        patchers = [
+            mock.patch.object(tasks, 'get_outbox_mail_service', return_value=service),
+            mock.patch.object(YouTubeMailService, '_get_gmail_service', return_value=None),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_retried_chunk_does_not_resend_sent_rows(self):
+        subscriptions = [self.create_subscription(f"user{index}@example.com") for index in range(3)]
+        enqueue_messages([
+            self.stage(subscription.email, [subscription.id]) for subscription in subscriptions
+        ])
+        message_ids = list(OutboxMessage.objects.order_by('id').values_list('id', flat=True))
+        # 앞선 시도에서 이미 발송된 메일
+        OutboxMessage.objects.filter(id=message_ids[0]).update(status=OutboxMessage.STATUS_SENT)
+
+        result = tasks.send_outbox_chunk(message_ids)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['send_stats']['recipients'], 2)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ['user1@example.com', 'user2@example.com']
+        )
+
+        # 같은 작업이 다시 전달되어도 발송 완료된 메일은 다시 보내지 않음
+        result = tasks.send_outbox_chunk(message_ids)
+
+        self.assertEqual(result['recipients'], 0)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(
+            OutboxMessage.objects.filter(status=OutboxMessage.STATUS_SENT).count(), 3
+        )
+        self.assertEqual(EmailLog.objects.filter(is_successful=True).count(), 2)
+
+    def test_skips_recipients_without_an_active_subscription(self):
+        active = self.create_subscription('active@example.com')
+        deactivated = self.create_subscription('deactivated@example.com', is_active=False)
+        inactive_user = self.create_subscription(
+            'inactive-user@example.com',
+            user=User.objects.create(email='inactive-user@example.com', is_active=False)
+        )
+        deleted = self.create_subscription('deleted@example.com')
+        enqueue_messages([
+            self.stage(subscription.email, [subscription.id])
+            for subscription in [active, deactivated, inactive_user, deleted]
+        ])
+        deleted.delete()
+        message_ids = list(OutboxMessage.objects.values_list('id', flat=True))
+
+        result = tasks.send_outbox_chunk(message_ids)
+
+        self.assertEqual(result['send_stats']['recipients'], 1)
+        self.assertEqual([message.to[0] for message in mail.outbox], ['active@example.com'])
+        statuses = dict(OutboxMessage.objects.values_list('recipient_email', 'status'))
+        self.assertEqual(statuses, {
+            'active@example.com': OutboxMessage.STATUS_SENT,
+            'deactivated@example.com': OutboxMessage.STATUS_FAILED,
+            'inactive-user@example.com': OutboxMessage.STATUS_FAILED,
+            'deleted@example.com': OutboxMessage.STATUS_FAILED,
+        })
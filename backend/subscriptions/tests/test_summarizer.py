@@ -0,0 +1,189 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from subscriptions import summarizer
+from subscriptions.llm_providers import get_llm_providers
+from subscriptions.summarizer import AsyncSummarizer
+
+
+class FakeChatCompletionsServer:
+    """/chat/completions만 흉내 내는 로컬 HTTP 서버
+
+    base_url의 첫 경로(예: /primary/v1)별로 응답 목록을 지정하면 순서대로 돌려주고,
+    목록이 비면 정상 응답을 돌려줍니다. 받은 요청은 (경로, 시각) 순서로 기록합니다.
+    """
+
+    def __init__(self):
+        self.responses = {}
+        self.requests = []
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                prefix = self.path.split('/')[1]
+                with server.lock:
+                    server.requests.append((prefix, time.monotonic()))
+                    scripted = server.responses.get(prefix) or []
+                    status, headers = scripted.pop(0) if scripted else (200, {})
+
+                if status == 200:
+                    payload = {
+                        'id': 'chatcmpl-test',
+                        'object': 'chat.completion',
+                        'created': int(time.time()),
+                        'model': body['model'],
+                        'choices': [{
+                            'index': 0,
+                            'message': {'role': 'assistant', 'content': f"{prefix} 요약"},
+                            'finish_reason': 'stop',
+                        }],
+                        'usage': {'prompt_tokens': 10, 'completion_tokens': 5, 'total_tokens': 15},
+                    }
+                else:
+                    payload = {'error': {'message': f"status {status}", 'type': 'test_error'}}
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, prefix: str) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}/{prefix}/v1"
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+JOB = {
+    'messages': [{'role': 'user', 'content': '요약해 주세요'}],
+    'max_tokens': 50,
+    'purpose': 'test',
+}
+
+
+class AsyncSummarizerHTTPTests(SimpleTestCase):
+    def setUp(self):
+        self.server = FakeChatCompletionsServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        # 재시도 대기 시간의 지터를 없애 Retry-After 값만 반영되도록 고정
+        patcher = mock.patch.object(summarizer.random, 'uniform', return_value=0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_summarizer(self, **kwargs):
+        with override_settings(
+            OPENAI_API_KEY='test-key',
+            OPENAI_BASE_URL=self.server.url('primary'),
+            AZURE_OPENAI_API_KEY='',
+            LOCAL_LLM_BASE_URL=self.server.url('secondary'),
+            LOCAL_LLM_MODEL='local-model',
+            LLM_PROVIDER_ORDER=['openai', 'local'],
+        ):
+            providers = get_llm_providers()
+        self.assertEqual([provider.name for provider in providers], ['openai', 'local'])
+        options = {'base_delay': 0.01, 'max_delay': 5.0}
+        options.update(kwargs)
+        return AsyncSummarizer(providers, model='gpt-4o-mini', **options)
+
+    def test_success(self):
+        engine = self.make_summarizer()
+        saved = []
+
+        results = engine.run([JOB, JOB], on_result=lambda index, content: saved.append(index))
+
+        self.assertEqual(results, ['primary 요약', 'primary 요약'])
+        self.assertEqual(sorted(saved), [0, 1])
+        self.assertEqual(engine.last_run_stats['succeeded'], 2)
+        self.assertEqual(engine.last_run_stats['prompt_tokens'], 20)
+        self.assertEqual(engine.last_run_stats['providers']['openai']['calls'], 2)
+        self.assertEqual([prefix for prefix, _ in self.server.requests], ['primary', 'primary'])
+
+    def test_result_handler_thread_closes_its_db_connections(self):
+        engine = self.make_summarizer()
+        handler_threads = []
+        closed_threads = []
+
+        with mock.patch.object(summarizer, 'close_old_connections') as close_old, \
+                mock.patch.object(summarizer, 'connections') as connections:
+            connections.close_all.side_effect = lambda: closed_threads.append(threading.get_ident())
+            engine.run([JOB, JOB], on_result=lambda index, content: handler_threads.append(
+                threading.get_ident()))
+
+        self.assertEqual(close_old.call_count, 2)
+        self.assertEqual(len(closed_threads), 1)
+        self.assertEqual(set(handler_threads), set(closed_threads))
+
+    def test_rate_limit_waits_for_retry_after(self):
+        self.server.responses['primary'] = [(429, {'Retry-After': '0.3'})]
+        engine = self.make_summarizer()
+
+        results = engine.run([JOB])
+
+        self.assertEqual(results, ['primary 요약'])
+        self.assertEqual(engine.last_run_stats['retries'], 1)
+        self.assertEqual(engine.last_run_stats['failovers'], 0)
+        self.assertEqual(engine.last_run_calls[0]['attempts'], 2)
+        (_, first_at), (_, second_at) = self.server.requests
+        self.assertGreaterEqual(second_at - first_at, 0.3)
+
+    def test_fails_over_to_next_provider(self):
+        self.server.responses['primary'] = [(500, {}), (500, {})]
+        engine = self.make_summarizer(failover_after=2)
+
+        results = engine.run([JOB])
+
+        self.assertEqual(results, ['secondary 요약'])
+        self.assertEqual(engine.last_run_stats['failovers'], 1)
+        self.assertEqual(engine.last_run_stats['providers']['openai']['failures'], 2)
+        self.assertEqual(engine.last_run_stats['providers']['local']['calls'], 1)
+        self.assertEqual(engine.last_run_calls[0]['provider'], 'local')
+        self.assertEqual(
+            [prefix for prefix, _ in self.server.requests],
+            ['primary', 'primary', 'secondary']
+        )
+
+    def test_auth_error_fails_over_without_retrying(self):
+        self.server.responses['primary'] = [(401, {})]
+        engine = self.make_summarizer(failover_after=3)
+
+        results = engine.run([JOB])
+
+        self.assertEqual(results, ['secondary 요약'])
+        self.assertEqual(engine.last_run_stats['failovers'], 1)
+        self.assertEqual(engine.last_run_stats['retries'], 0)
+        self.assertEqual(engine.last_run_calls[0]['provider'], 'local')
+        self.assertEqual([prefix for prefix, _ in self.server.requests], ['primary', 'secondary'])
+
+    def test_stops_when_every_provider_fails(self):
+        self.server.responses['primary'] = [(401, {})]
+        self.server.responses['secondary'] = [(404, {})]
+        engine = self.make_summarizer()
+
+        results = engine.run([JOB])
+
+        self.assertEqual(results, [None])
+        self.assertEqual(engine.last_run_stats['failed'], 1)
+        self.assertEqual(engine.last_run_stats['failovers'], 1)
+        self.assertFalse(engine.last_run_calls[0]['success'])
+        self.assertEqual([prefix for prefix, _ in self.server.requests], ['primary', 'secondary'])
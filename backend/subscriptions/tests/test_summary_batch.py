@@ -0,0 +1,228 @@
+import json
+import threading
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from subscriptions.llm_metrics import estimate_cost, get_llm_usage_stats
+from subscriptions.models import LLMCall, SummaryBatch
+from subscriptions.summary_batch import poll_summary_batches, submit_summary_batch
+from subscriptions.youtube_mail_service import YouTubeMailService
+
+
+class FakeBatchServer:
+    """/files, /batches, 결과 파일 내용만 흉내 내는 로컬 Batch API 서버
+
+    제출한 배치는 처음 조회할 때 완료되며, custom_id가 'fail'로 시작하는 요청은
+    500 응답으로, 나머지는 '요약 <video_id>' 내용으로 결과 파일에 기록합니다.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.batches = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def send_json(self, payload, status=200):
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                if self.path.endswith('/files'):
+                    form = BytesParser().parsebytes(
+                        f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode('ascii') + body
+                    )
+                    part = next(
+                        part for part in form.get_payload()
+                        if part.get_param('name', header='content-disposition') == 'file'
+                    )
+                    file_id = server.add_file(part.get_payload(decode=True).decode('utf-8'))
+                    return self.send_json({
+                        'id': file_id, 'object': 'file', 'bytes': len(body), 'created_at': 0,
+                        'filename': 'summaries.jsonl', 'purpose': 'batch', 'status': 'processed',
+                    })
+                if self.path.endswith('/batches'):
+                    request = json.loads(body)
+                    batch_id = f"batch_{len(server.batches) + 1}"
+                    server.batches[batch_id] = {
+                        'id': batch_id, 'object': 'batch', 'endpoint': request['endpoint'],
+                        'input_file_id': request['input_file_id'], 'completion_window': '24h',
+                        'status': 'validating', 'created_at': 0,
+                    }
+                    return self.send_json(server.batches[batch_id])
+                self.send_json({'error': {'message': 'not found'}}, 404)
+
+            def do_GET(self):
+                parts = self.path.strip('/').split('/')
+                if parts[-2] == 'batches':
+                    return self.send_json(server.complete(parts[-1]))
+                if parts[-1] == 'content':
+                    data = server.files[parts[-2]].encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/octet-stream')
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    return self.wfile.write(data)
+                self.send_json({'error': {'message': 'not found'}}, 404)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def add_file(self, content: str) -> str:
+        file_id = f"file-{len(self.files) + 1}"
+        self.files[file_id] = content
+        return file_id
+
+    def requests(self, batch_id: str) -> list:
+        return [
+            json.loads(line)
+            for line in self.files[self.batches[batch_id]['input_file_id']].splitlines()
+        ]
+
+    def complete(self, batch_id: str) -> dict:
+        batch = self.batches[batch_id]
+        if batch['status'] != 'completed':
+            results = []
+            for request in self.requests(batch_id):
+                if request['custom_id'].startswith('fail'):
+                    response = {'status_code': 500, 'body': {'error': {'message': 'server error'}}}
+                else:
+                    response = {'status_code': 200, 'body': {
+                        'id': 'chatcmpl-batch', 'object': 'chat.completion',
+                        'model': request['body']['model'],
+                        'choices': [{
+                            'index': 0, 'finish_reason': 'stop',
+                            'message': {
+                                'role': 'assistant',
+                                'content': f"요약 {request['custom_id'].split(':')[0]}",
+                            },
+                        }],
+                        'usage': {'prompt_tokens': 1000, 'completion_tokens': 200, 'total_tokens': 1200},
+                    }}
+                results.append({'id': 'batch_req', 'custom_id': request['custom_id'],
+                                'response': response, 'error': None})
+            batch['output_file_id'] = self.add_file(
+                '\n'.join(json.dumps(result, ensure_ascii=False) for result in results)
+            )
+            batch['status'] = 'completed'
+        return batch
+
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}/v1"
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_video(video_id: str, transcript: str = '짧은 자막 내용입니다') -> dict:
+    return {
+        'video_id': video_id,
+        'title': f"영상 {video_id}",
+        'url': f"https://www.youtube.com/watch?v={video_id}",
+        'transcript': transcript,
+    }
+
+
+class SummaryBatchTests(TestCase):
+    def setUp(self):
+        self.server = FakeBatchServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        settings_override = override_settings(
+            OPENAI_API_KEY='test-key',
+            OPENAI_BASE_URL=self.server.url(),
+            TRANSCRIPT_PREPROCESS=False,
+            SUMMARY_CHUNK_THRESHOLD_TOKENS=100,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        with mock.patch.object(YouTubeMailService, '_initialize_services'):
+            self.service = YouTubeMailService()
+        self.summary_store = self.service.summary_store
+
+    def test_submit_skips_cached_pending_and_long_videos(self):
+        cached = make_video('cached00001')
+        pending = make_video('pending0001')
+        long_video = make_video('long0000001', '긴 자막 ' * 200)
+        new_video = make_video('new00000001')
+        model = self.service.select_summary_model(cached)
+        self.summary_store.set(cached, '저장된 요약', model)
+        SummaryBatch.objects.create(
+            batch_id='batch_previous', status='in_progress',
+            prompt_version=self.summary_store.prompt_version, model=self.summary_store.model,
+            requests={'pending0001:x': {
+                'video_id': 'pending0001',
+                'transcript_hash': self.summary_store.hash_transcript(pending['transcript']),
+                'model': model,
+            }},
+            request_count=1,
+        )
+
+        stats = submit_summary_batch(self.service, {
+            '채널': [cached, pending, long_video, new_video]
+        })
+
+        self.assertEqual(stats['submitted'], 1)
+        self.assertEqual(stats['skipped_cached'], 1)
+        self.assertEqual(stats['skipped_pending'], 1)
+        self.assertEqual(stats['skipped_long'], 1)
+        requests = self.server.requests(stats['batch_id'])
+        self.assertEqual(len(requests), 1)
+        self.assertTrue(requests[0]['custom_id'].startswith('new00000001:'))
+        self.assertEqual(requests[0]['url'], '/v1/chat/completions')
+        self.assertEqual(requests[0]['body']['model'], model)
+        row = SummaryBatch.objects.get(batch_id=stats['batch_id'])
+        self.assertEqual(row.request_count, 1)
+        self.assertEqual(row.status, 'validating')
+
+    def test_poll_stores_results_and_records_half_price_calls(self):
+        videos = [make_video('new00000001'), make_video('new00000002'), make_video('fail0000001')]
+        submitted = submit_summary_batch(self.service, {'채널': videos})
+        self.assertEqual(submitted['submitted'], 3)
+
+        stats = poll_summary_batches(self.summary_store)
+
+        self.assertEqual(stats['completed'], 1)
+        self.assertEqual(stats['summaries_stored'], 2)
+        model = self.service.select_summary_model(videos[0])
+        self.assertEqual(self.summary_store.get(videos[0], model), '요약 new00000001')
+        self.assertEqual(self.summary_store.get(videos[1], model), '요약 new00000002')
+        self.assertIsNone(self.summary_store.get(videos[2], model))
+
+        row = SummaryBatch.objects.get(batch_id=submitted['batch_id'])
+        self.assertEqual(row.status, 'completed')
+        self.assertEqual((row.completed_count, row.failed_count), (2, 1))
+        self.assertIsNotNone(row.completed_at)
+
+        calls = LLMCall.objects.filter(purpose='batch')
+        self.assertEqual(calls.count(), 3)
+        self.assertEqual(calls.filter(is_successful=True).count(), 2)
+        self.assertEqual(set(calls.values_list('model', flat=True)), {model})
+
+        # 배치 요청은 동기 요청의 절반 가격으로 집계
+        usage = get_llm_usage_stats()
+        batch_row = next(row for row in usage['by_purpose'] if row['purpose'] == 'batch')
+        self.assertEqual(batch_row['prompt_tokens'], 2000)
+        self.assertAlmostEqual(
+            batch_row['estimated_cost_usd'],
+            round(estimate_cost(model, 2000, 400) / 2, 4)
+        )
+
+        # 이미 완료된 배치는 다시 확인하지 않음
+        self.assertEqual(poll_summary_batches(self.summary_store)['checked'], 0)
@@ -0,0 +1,45 @@
+from django.test import TestCase
+
+from subscriptions.models import VideoSummary
+from subscriptions.summary_store import SummaryStore
+
+
+def make_video(video_id: str) -> dict:
+    return {'video_id': video_id, 'transcript': f"{video_id} 자막"}
+
+
+class SummaryStoreModelTests(TestCase):
+    """기본 모델과 짧은 영상용 모델로 저장된 요약을 함께 다루는지 확인"""
+
+    def setUp(self):
+        self.store = SummaryStore('digest', '프롬프트', 'gpt-4o')
+        self.store.set(make_video('long0000001'), '긴 영상 요약')
+        self.store.set(make_video('short000001'), '짧은 영상 요약', 'gpt-4o-mini')
+        self.store.set(make_video('short000002'), '짧은 영상 요약', 'gpt-4o-mini')
+        # 다른 프롬프트 버전의 요약은 집계/삭제 대상이 아님
+        SummaryStore('digest', '이전 프롬프트', 'gpt-4o').set(make_video('old00000001'), '이전 요약')
+
+    def test_stats_include_every_model(self):
+        self.store.get(make_video('short000001'), 'gpt-4o-mini')
+        self.store.get(make_video('missing0001'))
+
+        stats = self.store.stats()
+
+        self.assertEqual(stats['entries'], 3)
+        self.assertEqual(stats['total_reuses'], 1)
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['by_model'], {
+            'gpt-4o': {'entries': 1, 'total_reuses': 0},
+            'gpt-4o-mini': {'entries': 2, 'total_reuses': 1},
+        })
+        self.assertEqual(self.store.stats('gpt-4o-mini')['entries'], 2)
+
+    def test_invalidate_covers_every_model_unless_one_is_given(self):
+        self.assertEqual(self.store.invalidate(video_id='short000001'), 1)
+        self.assertEqual(self.store.invalidate(model='gpt-4o'), 1)
+        self.assertEqual(self.store.stats()['by_model'], {
+            'gpt-4o-mini': {'entries': 1, 'total_reuses': 0},
+        })
+
+        self.assertEqual(self.store.invalidate(), 1)
+        self.assertEqual(VideoSummary.objects.count(), 1)
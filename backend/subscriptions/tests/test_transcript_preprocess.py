@@ -0,0 +1,102 @@
+from django.test import SimpleTestCase
+
+from subscriptions.summarizer import estimate_tokens
+from subscriptions.transcript_preprocess import (
+    FILLER_WORDS, SEGMENT_WORDS, downsample, preprocess_transcript, remove_fillers, strip_non_speech
+)
+
+
+class StripNonSpeechTests(SimpleTestCase):
+    def test_removes_sound_tags_and_music_notes(self):
+        text = '[음악] 안녕하세요 [Music] 오늘은 (웃음) 요리를 ♪♪ 합니다 (박수 소리)'
+
+        self.assertEqual(strip_non_speech(text).split(), ['안녕하세요', '오늘은', '요리를', '합니다'])
+
+    def test_keeps_ordinary_parentheses(self):
+        text = '가격은 (부가세 포함) 만 원입니다'
+
+        self.assertEqual(strip_non_speech(text), text)
+
+
+class RemoveFillersTests(SimpleTestCase):
+    def test_drops_listed_fillers_only(self):
+        words = ['음', '오늘은', 'Um,', '어', '날씨가', 'hmm.', '좋네요']
+
+        self.assertEqual(remove_fillers(words), ['오늘은', '날씨가', '좋네요'])
+
+    def test_filler_list(self):
+        self.assertEqual(
+            FILLER_WORDS,
+            {'음', '으음', '어', '으', '엄', '흠', 'uh', 'um', 'umm', 'uhm', 'hmm'}
+        )
+
+    def test_keeps_repetition_that_is_real_speech(self):
+        for words in [
+            ['정말', '정말', '중요합니다'],           # 강조
+            ['하나', '둘', '하나', '둘'],             # 숫자 세기
+            ['대한민국', '대한민국', '대한민국'],      # 구호
+            ['어떤', '사람은', '어떤', '사람은'],
+        ]:
+            self.assertEqual(remove_fillers(words), words)
+
+
+class DownsampleTests(SimpleTestCase):
+    def setUp(self):
+        # 세 번째 구간에만 자주 나오는 단어(keyword)가 몰려 있음
+        self.segments = [
+            [f"intro{index}" for index in range(SEGMENT_WORDS)],
+            [f"filler{index}" for index in range(SEGMENT_WORDS)],
+            ['keyword'] * SEGMENT_WORDS,
+            [f"other{index}" for index in range(SEGMENT_WORDS)],
+        ]
+        self.words = [word for segment in self.segments for word in segment]
+        self.segment_tokens = estimate_tokens(' '.join(self.segments[0]))
+
+    def test_keeps_intro_and_highest_scoring_segments_in_order(self):
+        budget = estimate_tokens(' '.join(self.segments[0])) + estimate_tokens(' '.join(self.segments[2]))
+
+        result = downsample(self.words, budget)
+
+        self.assertEqual(result, self.segments[0] + self.segments[2])
+
+    def test_stays_within_budget(self):
+        result = downsample(self.words, self.segment_tokens * 2)
+
+        self.assertLessEqual(estimate_tokens(' '.join(result)), self.segment_tokens * 2)
+        self.assertEqual(result[:SEGMENT_WORDS], self.segments[0])
+
+
+class PreprocessTranscriptTests(SimpleTestCase):
+    def test_reports_token_reduction(self):
+        text = '[음악] 음 오늘은 어 날씨가 좋네요 ♪'
+
+        processed, stats = preprocess_transcript(text)
+
+        self.assertEqual(processed, '오늘은 날씨가 좋네요')
+        self.assertEqual(stats['original_tokens'], estimate_tokens(text))
+        self.assertEqual(stats['processed_tokens'], estimate_tokens(processed))
+        self.assertEqual(
+            stats['reduction_ratio'],
+            round(1 - stats['processed_tokens'] / stats['original_tokens'], 3)
+        )
+        self.assertGreater(stats['reduction_ratio'], 0)
+        self.assertFalse(stats['downsampled'])
+
+    def test_downsamples_only_over_budget(self):
+        text = ' '.join(f"word{index}" for index in range(SEGMENT_WORDS * 5))
+        budget = estimate_tokens(text) // 2
+
+        processed, stats = preprocess_transcript(text, token_budget=budget)
+
+        self.assertTrue(stats['downsampled'])
+        self.assertLessEqual(stats['processed_tokens'], budget)
+        self.assertEqual(processed, ' '.join(downsample(text.split(), budget)))
+
+        _, stats = preprocess_transcript(text, token_budget=estimate_tokens(text))
+        self.assertFalse(stats['downsampled'])
+
+    def test_empty_transcript(self):
+        processed, stats = preprocess_transcript('')
+
+        self.assertEqual(processed, '')
+        self.assertEqual(stats['reduction_ratio'], 0.0)
@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from subscriptions.models import Transcript
+from subscriptions.transcript_store import TranscriptStore
+
+
+class TranscriptStoreLanguageTests(TestCase):
+    def setUp(self):
+        self.store = TranscriptStore()
+        self.store.set_many([
+            {'video_id': 'video00001', 'language': 'en', 'transcript': 'english'},
+            {'video_id': 'video00001', 'language': 'ko', 'transcript': '한국어'},
+            {'video_id': 'video00002', 'language': 'en-auto', 'transcript': 'auto english'},
+        ])
+
+    def test_prefers_the_earliest_language_in_the_preference_list(self):
+        cached = self.store.get_many(['video00001'], languages=['ko', 'en'])
+        self.assertEqual(cached['video00001']['language'], 'ko')
+
+        cached = self.store.get_many(['video00001'], languages=['en', 'ko'])
+        self.assertEqual(cached['video00001']['language'], 'en')
+
+    def test_ignores_transcripts_outside_the_preference_list(self):
+        cached = self.store.get_many(['video00001', 'video00002'], languages=['ko', 'ko-auto'])
+
+        self.assertEqual(cached['video00001']['transcript'], '한국어')
+        self.assertNotIn('video00002', cached)
+
+
+class TranscriptStoreExpiryTests(TestCase):
+    def test_refetched_transcript_replaces_expired_row(self):
+        store = TranscriptStore(retention_days=14)
+        store.set_many([{'video_id': 'video00003', 'language': 'ko', 'transcript': '예전 자막'}])
+        Transcript.objects.filter(video_id='video00003').update(
+            fetched_at=timezone.now() - timedelta(days=30)
+        )
+        self.assertEqual(store.get_many(['video00003'], languages=['ko']), {})
+
+        store.set_many([{'video_id': 'video00003', 'language': 'ko', 'transcript': '새 자막'}])
+
+        cached = store.get_many(['video00003'], languages=['ko'])
+        self.assertEqual(cached['video00003']['transcript'], '새 자막')
+        self.assertEqual(Transcript.objects.filter(video_id='video00003').count(), 1)
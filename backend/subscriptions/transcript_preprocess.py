@@ -0,0 +1,89 @@
+import re
+import logging
+from collections import Counter
+from typing import Dict, List, Tuple
+from .summarizer import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# [음악], [박수], [Music] 같은 비발화 표시와 음표 기호
+NON_SPEECH_PATTERN = re.compile(r'\[[^\]]{1,20}\]|\([^)]{0,10}(?:음악|박수|웃음)[^)]{0,10}\)|[♪♫♬]+')
+
+# 자동 생성 자막에 자주 섞이는 단독 추임새 (이 목록에 있는 단어만 제거)
+FILLER_WORDS = {'음', '으음', '어', '으', '엄', '흠', 'uh', 'um', 'umm', 'uhm', 'hmm'}
+
+# 추출 요약 시 한 구간의 단어 수
+SEGMENT_WORDS = 40
+
+
+def strip_non_speech(text: str) -> str:
+    """비발화 표시([음악] 등) 제거"""
+    return NON_SPEECH_PATTERN.sub(' ', text)
+
+
+def remove_fillers(words: List[str]) -> List[str]:
+    """단독 추임새(FILLER_WORDS) 제거
+
+    강조, 숫자 세기, 구호처럼 실제 발화인 반복도 있으므로
+    다른 단어나 반복되는 구절은 그대로 둡니다.
+    """
+    return [word for word in words if word.lower().strip('.,?!') not in FILLER_WORDS]
+
+
+def downsample(words: List[str], token_budget: int, model: str = "gpt-4o") -> List[str]:
+    """토큰 예산에 맞게 중요도가 높은 구간만 원래 순서대로 남김 (추출 방식)
+
+    구간 중요도는 자막 전체에서 자주 나오는 두 글자 이상 단어가
+    구간에 얼마나 포함되어 있는지로 계산합니다.
+    """
+    segments = [
+        words[start:start + SEGMENT_WORDS]
+        for start in range(0, len(words), SEGMENT_WORDS)
+    ]
+    frequencies = Counter(word for word in words if len(word) >= 2)
+
+    def score(segment):
+        return sum(frequencies[word] for word in segment if len(word) >= 2) / len(segment)
+
+    segment_tokens = [estimate_tokens(' '.join(segment), model) for segment in segments]
+    # 첫 구간(도입부)은 항상 유지
+    selected = {0}
+    used = segment_tokens[0]
+    ranked = sorted(range(1, len(segments)), key=lambda i: score(segments[i]), reverse=True)
+    for index in ranked:
+        if used + segment_tokens[index] > token_budget:
+            continue
+        selected.add(index)
+        used += segment_tokens[index]
+
+    return [word for index in sorted(selected) for word in segments[index]]
+
+
+def preprocess_transcript(text: str, token_budget: int = 0,
+                          model: str = "gpt-4o") -> Tuple[str, Dict]:
+    """요약 전 자막 정리 (비발화 표시 제거, 추임새 제거, 선택적 추출 요약)
+
+    Args:
+        text: 원본 자막
+        token_budget: 정리 후에도 이 토큰 수를 넘으면 추출 요약 (0이면 사용 안 함)
+
+    Returns:
+        (정리된 자막, {'original_tokens', 'processed_tokens', 'reduction_ratio', 'downsampled'})
+    """
+    original_tokens = estimate_tokens(text, model)
+    words = remove_fillers(strip_non_speech(text).split())
+
+    processed = ' '.join(words)
+    processed_tokens = estimate_tokens(processed, model)
+    downsampled = False
+    if token_budget and processed_tokens > token_budget and words:
+        processed = ' '.join(downsample(words, token_budget, model))
+        processed_tokens = estimate_tokens(processed, model)
+        downsampled = True
+
+    return processed, {
+        'original_tokens': original_tokens,
+        'processed_tokens': processed_tokens,
+        'reduction_ratio': round(1 - processed_tokens / original_tokens, 3) if original_tokens else 0.0,
+        'downsampled': downsampled,
+    }
@@ -0,0 +1,97 @@
+import logging
+import zlib
+from datetime import timedelta
+from typing import Dict, List
+from django.utils import timezone
+from .models import Transcript
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptStore:
+    """자막을 압축하여 DB에 저장하는 저장소
+
+    YouTubeTranscriptDownloader가 자막을 내려받기 전에 get_many()로 먼저
+    확인하므로, 재시도/테스트 이메일/다른 시간대 발송에서 같은 영상의
+    자막을 다시 내려받지 않습니다. 워커 스레드가 아닌 호출 스레드에서만
+    사용합니다.
+    """
+
+    def __init__(self, retention_days: int = 14):
+        self.retention_days = retention_days
+
+    @staticmethod
+    def compress(text: str) -> bytes:
+        return zlib.compress(text.encode('utf-8'), 6)
+
+    @staticmethod
+    def decompress(data) -> str:
+        return zlib.decompress(bytes(data)).decode('utf-8')
+
+    def get_many(self, video_ids: List[str], languages: List[str] = None) -> Dict[str, Dict]:
+        """저장된 자막 조회 ({video_id: {'transcript', 'language'}})
+
+        languages(선호 순서)를 주면 그 언어의 자막만 사용하고, 한 영상에 여러 언어가
+        저장되어 있으면 선호 순서가 가장 앞선 자막을 고릅니다. 선호 언어가 바뀐 뒤에는
+        예전 언어의 자막을 쓰지 않고 다시 내려받습니다.
+        """
+        if not video_ids:
+            return {}
+
+        transcripts = {}
+        try:
+            rows = Transcript.objects.filter(
+                video_id__in=video_ids,
+                fetched_at__gte=timezone.now() - timedelta(days=self.retention_days)
+            ).order_by('fetched_at')
+            if languages:
+                rows = rows.filter(language__in=languages)
+                rank = {language: index for index, language in enumerate(languages)}
+                rows = sorted(rows, key=lambda row: -rank[row.language])
+            for row in rows:
+                transcripts[row.video_id] = {
+                    'transcript': self.decompress(row.compressed_text),
+                    'language': row.language,
+                }
+        except Exception as e:
+            logger.warning(f"자막 저장소 조회 실패: {str(e)}")
+        return transcripts
+
+    def set_many(self, videos: List[Dict]) -> int:
+        """수집한 자막 저장 (video_id, language, transcript 키 필요)
+
+        같은 영상/언어의 자막이 이미 있으면 새 자막과 수집 시간으로 덮어씁니다.
+        보관 기간이 지난 행이 남아 있어도 새로 받은 자막이 조회되도록 하기 위함입니다.
+        """
+        # 한 번의 INSERT ... ON CONFLICT에서 같은 행을 두 번 갱신할 수 없으므로 키별로 하나만
+        rows = {
+            (video['video_id'], video['language'] or ''): Transcript(
+                video_id=video['video_id'],
+                language=video['language'] or '',
+                compressed_text=self.compress(video['transcript']),
+                text_length=len(video['transcript']),
+            )
+            for video in videos
+            if video.get('video_id') and video.get('transcript')
+        }
+        if not rows:
+            return 0
+
+        try:
+            Transcript.objects.bulk_create(
+                list(rows.values()),
+                update_conflicts=True,
+                unique_fields=['video_id', 'language'],
+                update_fields=['compressed_text', 'text_length', 'fetched_at']
+            )
+        except Exception as e:
+            logger.warning(f"자막 저장소 저장 실패: {str(e)}")
+            return 0
+        return len(rows)
+
+    def prune(self) -> int:
+        """보관 기간이 지난 자막 삭제"""
+        deleted, _ = Transcript.objects.filter(
+            fetched_at__lt=timezone.now() - timedelta(days=self.retention_days)
+        ).delete()
+        return deleted
@@ -56,6 +56,9 @@ urlpatterns = [
     path('admin/stats/', 
          views.admin_stats_view, 
          name='admin-stats'),
+    path('admin/llm-stats/', 
+         views.admin_llm_stats_view, 
+         name='admin-llm-stats'),
     path('admin/send-test-email/', 
          views.admin_send_test_email_view, 
          name='admin-send-test-email'),
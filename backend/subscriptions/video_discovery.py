@@ -0,0 +1,171 @@
+import logging
+import pytz
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+from django.utils import timezone
+from .models import Subscription, YouTubeChannel, Video
+
+logger = logging.getLogger(__name__)
+
+# 증분 수집 시 확인하는 최대 기간
+DISCOVERY_LOOKBACK_DAYS = 7
+
+
+def get_digest_window(now: datetime = None) -> Tuple[datetime, datetime]:
+    """다이제스트 대상 기간 (전날 오전 7시 ~ 현재, KST)"""
+    kst = pytz.timezone('Asia/Seoul')
+    kst_now = (now or timezone.now()).astimezone(kst)
+    today_7am = kst_now.replace(hour=7, minute=0, second=0, microsecond=0)
+    return today_7am - timedelta(days=1), kst_now
+
+
+def discover_channel_videos(downloader, channel_ids: List[str],
+                            max_age_minutes: int = 0) -> Dict:
+    """채널들의 새 업로드 영상을 수집하여 Video 테이블에 저장
+
+    Args:
+        downloader: 인증된 YouTubeTranscriptDownloader
+        channel_ids: 수집할 채널 ID 목록
+        max_age_minutes: 이 시간 안에 수집된 채널은 건너뜀 (0이면 모두 수집)
+
+    Returns:
+        dict: 수집 통계 (invalid_channel_ids 포함)
+    """
+    stats = {
+        'channels_checked': 0,
+        'channels_skipped': 0,
+        'new_videos': 0,
+        'invalid_channel_ids': [],
+    }
+    if not channel_ids or not downloader or not downloader.youtube:
+        return stats
+
+    now = timezone.now()
+    since = now - timedelta(days=DISCOVERY_LOOKBACK_DAYS)
+    channels = {
+        channel.channel_id: channel
+        for channel in YouTubeChannel.objects.filter(channel_id__in=channel_ids)
+    }
+
+    for channel_id in channel_ids:
+        channel = channels.get(channel_id)
+        if (channel and channel.last_crawled_at and max_age_minutes and
+                now - channel.last_crawled_at < timedelta(minutes=max_age_minutes)):
+            stats['channels_skipped'] += 1
+            continue
+
+        known_video_ids = set()
+        if channel:
+            known_video_ids = set(
+                channel.videos.filter(
+                    published_at__gte=since
+                ).values_list('video_id', flat=True)
+            )
+
+        try:
+            uploads = downloader.get_channel_uploads(
+                channel_id,
+                since=since,
+                known_video_ids=known_video_ids,
+                uploads_playlist_id=channel.uploads_playlist_id if channel else None
+            )
+        except Exception as e:
+            logger.error(f"영상 수집 실패 ({channel_id}): {str(e)}")
+            continue
+
+        if uploads is None:
+            logger.error(f"채널 정보를 찾을 수 없음: {channel_id}")
+            stats['invalid_channel_ids'].append(channel_id)
+            continue
+
+        if channel is None:
+            channel = YouTubeChannel(channel_id=channel_id)
+        if uploads['channel_name']:
+            channel.title = uploads['channel_name']
+        channel.uploads_playlist_id = uploads['uploads_playlist_id']
+        channel.last_crawled_at = now
+        channel.save()
+
+        new_videos = [
+            Video(
+                channel=channel,
+                video_id=video['video_id'],
+                title=video['title'][:300],
+                published_at=datetime.fromisoformat(
+                    video['published_at'].replace('Z', '+00:00')
+                ),
+                duration=video['duration'],
+                is_shorts=video['is_shorts'],
+                is_stream=video['is_stream'],
+                is_too_long=video['is_too_long'],
+            )
+            for video in uploads['videos']
+        ]
+        Video.objects.bulk_create(new_videos, ignore_conflicts=True)
+
+        stats['channels_checked'] += 1
+        stats['new_videos'] += len(new_videos)
+
+    logger.info(
+        f"영상 수집 완료: 채널 {stats['channels_checked']}개 확인, "
+        f"{stats['channels_skipped']}개 건너뜀, 새 영상 {stats['new_videos']}개"
+    )
+    return stats
+
+
+def get_channel_videos(channel_ids: List[str], now: datetime = None) -> List[Tuple]:
+    """다이제스트 기간의 적절한 영상을 채널별로 조회 (로컬 인덱스 조회)
+
+    Returns:
+        list: [(channel_id, channel_name, [video, ...]), ...] (channel_ids 순서)
+    """
+    window_start, window_end = get_digest_window(now)
+    videos = Video.objects.filter(
+        channel__channel_id__in=channel_ids,
+        published_at__gte=window_start,
+        published_at__lt=window_end,
+        is_shorts=False,
+        is_stream=False,
+        is_too_long=False,
+    ).select_related('channel').order_by('-published_at')
+
+    grouped = {}
+    for video in videos:
+        grouped.setdefault(video.channel.channel_id, []).append(video)
+
+    channel_videos = []
+    for channel_id in channel_ids:
+        if channel_id not in grouped:
+            continue
+        channel_name = grouped[channel_id][0].channel.title or channel_id
+        channel_videos.append((channel_id, channel_name, [
+            {
+                'video_id': video.video_id,
+                'title': video.title,
+                'url': video.url,
+                'published_at': video.published_at.isoformat(),
+                'duration': video.duration,
+            }
+            for video in grouped[channel_id]
+        ]))
+    return channel_videos
+
+
+def get_active_channel_ids() -> List[str]:
+    """활성 구독의 채널 ID 목록 (중복 제거)"""
+    return list(
+        Subscription.objects.filter(
+            is_active=True,
+            youtube_channel_id__isnull=False,
+        ).exclude(
+            youtube_channel_id=''
+        ).order_by().values_list('youtube_channel_id', flat=True).distinct()
+    )
+
+
+def prune_old_videos(retention_days: int = DISCOVERY_LOOKBACK_DAYS * 2) -> int:
+    """보관 기간이 지난 영상 삭제"""
+    deleted, _ = Video.objects.filter(
+        published_at__lt=timezone.now() - timedelta(days=retention_days)
+    ).delete()
+    return deleted
@@ -20,6 +20,7 @@ from django.conf import settings
 import secrets
 import string
 from .youtube_mail_service import YouTubeMailService
+from .llm_metrics import get_llm_usage_stats
 
 
 class SubscriptionCreateView(generics.CreateAPIView):
@@ -174,13 +175,41 @@ class TestEmailView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def check_cache_health():
+    """공유 캐시 상태 확인 (쓰기/읽기/삭제 왕복)"""
+    from django.core.cache import cache
+    import time
+    
+    backend = settings.CACHES['default']['BACKEND']
+    probe_key = f"health_probe_{secrets.token_hex(4)}"
+    started = time.monotonic()
+    try:
+        cache.set(probe_key, 'ok', timeout=10)
+        healthy = cache.get(probe_key) == 'ok'
+        cache.delete(probe_key)
+        error = None if healthy else '캐시 읽기 값이 일치하지 않습니다.'
+    except Exception as e:
+        healthy = False
+        error = str(e)
+    
+    return {
+        'healthy': healthy,
+        'backend': backend,
+        'shared': 'locmem' not in backend.lower(),
+        'latency_ms': round((time.monotonic() - started) * 1000, 2),
+        'error': error
+    }
+
+
 @api_view(['GET'])
 def health_check(request):
     """헬스 체크"""
+    cache_health = check_cache_health()
     return Response(
         {
-            'status': 'healthy',
-            'message': 'YouTube Mail Service is running'
+            'status': 'healthy' if cache_health['healthy'] else 'degraded',
+            'message': 'YouTube Mail Service is running',
+            'cache': cache_health
         },
         status=status.HTTP_200_OK
     )
@@ -305,6 +334,21 @@ def admin_stats_view(request):
     })
 
 
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def admin_llm_stats_view(request):
+    """관리자용 LLM 사용량 통계 (일별, 발송 시간대별, 용도별 토큰/지연 시간/예상 비용)"""
+    try:
+        days = int(request.query_params.get('days', 7))
+    except ValueError:
+        return Response(
+            {'error': 'days는 숫자여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    return Response(get_llm_usage_stats(days=max(1, min(days, 90))))
+
+
 @api_view(['DELETE'])
 @permission_classes([AllowAny])
 def admin_delete_subscription_view(request, subscription_id):
@@ -450,6 +494,7 @@ def admin_check_cache_view(request):
         
         return Response({
             'current_time': current_time.strftime('%Y-%m-%d %H:%M:%S'),
+            'cache_health': check_cache_health(),
             'cache_status': cache_status
         }, status=status.HTTP_200_OK)
         
@@ -480,6 +525,7 @@ def admin_create_test_subscription_view(request):
                 'name': name,
                 'notification_time': notification_time,
                 'youtube_channel_url': 'https://www.youtube.com/@bbyonggeul',
+                'youtube_channel_id': None,
                 'channel_name': '뿅글이',
                 'is_active': True
             }
@@ -517,7 +563,8 @@ def admin_process_youtube_summaries(request):
             'success': result['success'],
             'message': result['message'],
             'processed_count': result['processed_count'],
-            'channels_found': result.get('channels_found', 0)
+            'channels_found': result.get('channels_found', 0),
+            'channel_dedup': result.get('channel_dedup', {})
         })
     except Exception as e:
         return Response({
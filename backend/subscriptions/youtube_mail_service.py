@@ -1,26 +1,34 @@
 import os
+import time
 import logging
 import pytz
 from datetime import datetime, timedelta
 from typing import Dict, List
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from .models import Subscription, EmailLog
-
-# OpenAI 설정
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    logging.warning("OpenAI 라이브러리가 설치되지 않았습니다.")
+from django.utils import timezone
+from django.core.mail import send_mail, get_connection
+from django.core.cache import cache
+from .models import Subscription, OutboxMessage
+from .email_log_buffer import EmailLogBuffer
+from .gmail_sender import GMAIL_SENDER_ADDRESS, GmailSender
+from .outbox import (
+    build_sender_headers, cancel_inactive_messages, enqueue_messages, extract_html, load_message,
+    make_idempotency_key, mark_sending, queued_recipients, record_results, stage_message
+)
+from .summary_store import SummaryStore
+from .email_templates import EMAIL_CSS, inline_email_css, render_no_content_email, render_summary_email
+from .summarizer import AsyncSummarizer, estimate_tokens, split_into_chunks
+from .llm_metrics import record_llm_calls
+from .llm_providers import get_llm_providers
+from .transcript_preprocess import preprocess_transcript
+from .transcript_store import TranscriptStore
+from .video_discovery import discover_channel_videos, get_channel_videos
 
 # YouTube 다운로더 import
 try:
     import sys
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-    from youtube_download import YouTubeTranscriptDownloader
+    from youtube_download import YouTubeTranscriptDownloader, ProxyPool, TokenBucket
     YOUTUBE_DOWNLOADER_AVAILABLE = True
 except ImportError:
     YOUTUBE_DOWNLOADER_AVAILABLE = False
@@ -28,13 +36,132 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_SYSTEM_PROMPT = (
+    "당신은 유튜브 영상 내용을 분석하고 요약하는 전문가입니다. "
+    "주어진 HTML 형식을 정확히 따라 작성해주세요. "
+    "단, ```html``` 태그는 사용하지 않습니다."
+)
+
+SUMMARY_PROMPT_TEMPLATE = """
+                다음 유튜브 영상의 자막을 분석하고 정리해주세요.
+                이때 영상의 제목과 자막 내용을 참고하여 영상의 내용을 요약해주세요.
+                논점 세부 내용은 각각 최소 3문장 이상으로 자세하게 작성해주세요.
+                제목: {title}
+                내용: {transcript}
+                
+                다음 HTML 형식으로 작성해주세요:
+                <div class="video-card">
+                    <h3 class="video-title">{title}</h3>
+                    <div class="video-content">
+                        <div class="content-block">
+                            <h4>영상 개요</h4>
+                            <p>[전체적인 내용 한 문장으로]</p>
+                        </div>
+                        
+                        <div class="content-block">
+                            <h4>주요 논점</h4>
+                            <ul class="key-points">
+                                <li>[핵심 논점 1]</li>
+                                <li>[핵심 논점 2]</li>
+                                <li>[핵심 논점 3]</li>
+                            </ul>
+                        </div>
+                        
+                        <div class="content-block">
+                            <h4>논점 세부사항</h4>
+                            <ul class="details">
+                                <li>[논점 세부내용 1]</li>
+                                <li>[논점 세부내용 2]</li>
+                                <li>[논점 세부내용 3]</li>
+                            </ul>
+                        </div>
+                        
+                        <div class="content-block">
+                            <h4>총평 및 시사점</h4>
+                            <p>[내용에 대한 총평 및 시사점]</p>
+                        </div>
+                    </div>
+                    <div class="video-link">
+                        <a href="{url}" target="_blank">영상 보기</a>
+                    </div>
+                </div>
+                """
+
+SUMMARY_MODEL = "gpt-4o"
+
+# 긴 자막을 조각별로 요약할 때 사용하는 프롬프트 (map 단계)
+CHUNK_SUMMARY_SYSTEM_PROMPT = (
+    "당신은 유튜브 영상 자막의 일부를 읽고 핵심 내용을 빠짐없이 정리하는 전문가입니다."
+)
+
+CHUNK_SUMMARY_PROMPT_TEMPLATE = """
+                다음은 유튜브 영상 자막의 {index}/{total} 부분입니다.
+                이 부분에서 다루는 주요 논점과 근거, 수치, 예시를 한국어 문장 목록으로 정리해주세요.
+                HTML은 사용하지 않습니다.
+                제목: {title}
+                내용: {transcript}
+                """
+
+
+def get_summary_store() -> SummaryStore:
+    """다이제스트 요약용 저장소 (프롬프트 템플릿 기준으로 버전 관리)"""
+    return SummaryStore(
+        'digest',
+        SUMMARY_SYSTEM_PROMPT + SUMMARY_PROMPT_TEMPLATE,
+        SUMMARY_MODEL
+    )
+
+
+def get_chunk_store() -> SummaryStore:
+    """긴 자막 조각 요약 저장소 (키의 자막 해시는 조각 내용 기준)"""
+    return SummaryStore(
+        'chunk',
+        CHUNK_SUMMARY_SYSTEM_PROMPT + CHUNK_SUMMARY_PROMPT_TEMPLATE,
+        SUMMARY_MODEL
+    )
+
+
+# 프록시 상태 확인 결과 캐시 키 (모든 워커 프로세스가 공유)
+PROXY_HEALTH_CACHE_KEY = 'transcript_proxy_health'
+
+_proxy_pool = None
+
+
+def get_proxy_pool():
+    """설정된 자막 프록시 풀 (프로세스 단위로 하나, 프록시가 없으면 None)
+
+    마지막 상태 확인 결과가 캐시에 있으면 정상 프록시 목록에 반영합니다.
+    """
+    global _proxy_pool
+    proxy_urls = getattr(settings, 'TRANSCRIPT_PROXIES', [])
+    if not YOUTUBE_DOWNLOADER_AVAILABLE or not proxy_urls:
+        return None
+
+    if _proxy_pool is None:
+        _proxy_pool = ProxyPool(
+            proxy_urls,
+            check_url=getattr(settings, 'TRANSCRIPT_PROXY_CHECK_URL', 'https://httpbin.org/ip')
+        )
+
+    try:
+        healthy = cache.get(PROXY_HEALTH_CACHE_KEY)
+        if healthy is not None:
+            _proxy_pool.set_healthy(healthy)
+    except Exception as e:
+        logger.warning(f"프록시 상태 캐시 조회 실패: {str(e)}")
+    return _proxy_pool
+
 
 class YouTubeMailService:
     """YouTube 채널 콘텐츠 요약 및 이메일 발송 서비스"""
     
     def __init__(self):
         self.downloader = None
-        self.openai_client = None
+        self.summary_store = get_summary_store()
+        self.chunk_store = get_chunk_store()
+        self.last_fetch_stats = {}
+        self.last_summary_stats = {}
+        self.last_send_stats = {}
         self._initialize_services()
     
     def _initialize_services(self):
@@ -42,7 +169,7 @@ class YouTubeMailService:
         # YouTube 다운로더 초기화
         if YOUTUBE_DOWNLOADER_AVAILABLE:
             try:
-                self.downloader = YouTubeTranscriptDownloader()
+                self.downloader = self._create_downloader()
                 credentials_path = os.path.join(
                     settings.BASE_DIR, 'credentials.json'
                 )
@@ -60,37 +187,137 @@ class YouTubeMailService:
             except Exception as e:
                 logger.error(f"YouTube 다운로더 초기화 실패: {str(e)}")
                 # 다운로더 객체라도 생성해서 웹 스크래핑은 가능하도록
-                self.downloader = YouTubeTranscriptDownloader()
+                self.downloader = self._create_downloader()
         
-        # OpenAI 초기화
-        if OPENAI_AVAILABLE:
-            try:
-                api_key = getattr(settings, 'OPENAI_API_KEY', '')
-                if api_key:
-                    self.openai_client = OpenAI(api_key=api_key)
-                    logger.info("OpenAI 클라이언트 초기화 완료")
-                else:
-                    logger.error("OPENAI_API_KEY가 설정되지 않았습니다.")
-            except Exception as e:
-                logger.error(f"OpenAI 초기화 실패: {str(e)}")
+        # 동시 요약 엔진 (LLM 제공자 목록, 동시 요청 수, 제공자별 분당 요청/토큰 예산)
+        self.summarizer = AsyncSummarizer(
+            get_llm_providers(),
+            SUMMARY_MODEL,
+            max_concurrency=getattr(settings, 'SUMMARY_CONCURRENCY', 8),
+            requests_per_minute=getattr(settings, 'OPENAI_REQUESTS_PER_MINUTE', 500),
+            tokens_per_minute=getattr(settings, 'OPENAI_TOKENS_PER_MINUTE', 300000)
+        )
+        # 발송 시간대 (HH:MM, LLM 호출 기록용)
+        self.slot_label = ""
+        self.summarizer.call_recorder = lambda calls: record_llm_calls(
+            calls, slot=self.slot_label
+        )
+        if self.summarizer.providers:
+            logger.info(
+                "LLM 제공자 초기화 완료: "
+                f"{', '.join(provider.name for provider in self.summarizer.providers)}"
+            )
+    
+    def _create_downloader(self):
+        """설정값(동시 작업 수, 요청 속도, 자막 언어, 프록시, 자막 저장소)을 반영한 자막 다운로더 생성"""
+        downloader = YouTubeTranscriptDownloader(
+            max_workers=getattr(settings, 'TRANSCRIPT_FETCH_CONCURRENCY', 4),
+            requests_per_second=getattr(settings, 'TRANSCRIPT_FETCH_RATE', 2.0),
+            languages=getattr(settings, 'TRANSCRIPT_LANGUAGES', None)
+        )
+        downloader.proxy_pool = get_proxy_pool()
+        downloader.transcript_store = TranscriptStore(
+            retention_days=getattr(settings, 'TRANSCRIPT_RETENTION_DAYS', 14)
+        )
+        return downloader
+    
+    def resolve_subscription_channels(self, subscriptions: List[Subscription]) -> Dict[int, str]:
+        """구독 ID별 YouTube 채널 ID 매핑 생성
+        
+        구독에 캐시된 채널 ID를 우선 사용하고, 없는 경우에만 URL을 해석하여
+        결과를 구독 행에 저장합니다. 같은 URL은 한 번만 해석합니다.
+        """
+        subscription_channels = {}
+        resolved_urls = {}
+        
+        for subscription in subscriptions:
+            if subscription.youtube_channel_id:
+                subscription_channels[subscription.id] = subscription.youtube_channel_id
+                continue
+            
+            channel_url = subscription.youtube_channel_url
+            if not channel_url or not self.downloader:
+                continue
+            
+            if channel_url not in resolved_urls:
+                resolved_urls[channel_url] = self.resolve_channel_id(subscription)
+            else:
+                self._cache_channel_id(subscription, resolved_urls[channel_url])
+            
+            if resolved_urls[channel_url]:
+                subscription_channels[subscription.id] = resolved_urls[channel_url]
+        
+        if resolved_urls:
+            logger.info(f"채널 ID 캐시 미스: {len(resolved_urls)}개 URL 해석")
+        
+        return subscription_channels
+    
+    def resolve_channel_id(self, subscription: Subscription) -> str:
+        """구독 URL을 채널 ID로 해석하여 구독 행에 캐시"""
+        if not self.downloader:
+            return None
+        
+        # URL에서 채널 ID 추출 또는 채널명으로 검색
+        channel_id = self.downloader.get_channel_id_by_name(
+            subscription.youtube_channel_url
+        )
+        self._cache_channel_id(subscription, channel_id)
+        return channel_id
+    
+    def _cache_channel_id(self, subscription: Subscription, channel_id: str):
+        """해석된 채널 ID를 구독 행에 저장"""
+        if not channel_id:
+            return
+        
+        subscription.youtube_channel_id = channel_id
+        subscription.channel_id_resolved_at = timezone.now()
+        Subscription.objects.filter(pk=subscription.pk).update(
+            youtube_channel_id=channel_id,
+            channel_id_resolved_at=subscription.channel_id_resolved_at
+        )
+    
+    def invalidate_channel_ids(self, channel_ids) -> int:
+        """조회에 실패한 채널 ID 캐시 삭제 (다음 실행 시 다시 해석)"""
+        if not channel_ids:
+            return 0
+        
+        invalidated = Subscription.objects.filter(
+            youtube_channel_id__in=list(channel_ids)
+        ).update(youtube_channel_id=None, channel_id_resolved_at=None)
+        logger.warning(
+            f"유효하지 않은 채널 ID 캐시 {invalidated}개 삭제: {', '.join(channel_ids)}"
+        )
+        return invalidated
     
-    def get_video_transcripts(self, subscriptions: List[Subscription]) -> Dict:
+    def get_video_transcripts(self, subscriptions: List[Subscription],
+                              subscription_channels: Dict[int, str] = None) -> Dict:
         """구독 정보에서 YouTube 자막 가져오기"""
         if not self.downloader:
             logger.error("YouTube 다운로더가 초기화되지 않았습니다.")
             return {}
         
         # 채널 ID 수집
-        channel_ids = []
-        for subscription in subscriptions:
-            channel_url = subscription.youtube_channel_url
-            if channel_url:
-                # URL에서 채널 ID 추출 또는 채널명으로 검색
-                channel_id = self.downloader.get_channel_id_by_name(
-                    channel_url
-                )
-                if channel_id:
-                    channel_ids.append(channel_id)
+        if subscription_channels is None:
+            subscription_channels = self.resolve_subscription_channels(
+                subscriptions
+            )
+        channel_refs = [
+            subscription_channels[subscription.id]
+            for subscription in subscriptions
+            if subscription.id in subscription_channels
+        ]
+        
+        # 여러 구독자가 같은 채널을 구독해도 채널별로 한 번만 수집 (결과는 발송 시 구독자별로 분배)
+        channel_ids = list(dict.fromkeys(channel_refs))
+        self.last_fetch_stats = {
+            'subscription_channel_refs': len(channel_refs),
+            'distinct_channels': len(channel_ids),
+            'deduplicated_fetches': len(channel_refs) - len(channel_ids),
+        }
+        logger.info(
+            f"채널 중복 제거: 구독 {len(channel_refs)}건 -> "
+            f"채널 {len(channel_ids)}개"
+        )
         
         if not channel_ids:
             logger.warning("유효한 채널 ID를 찾을 수 없습니다.")
@@ -103,7 +330,24 @@ class YouTubeMailService:
         
         # 자막 수집
         try:
-            transcripts = self.downloader.get_channel_transcripts(channel_ids)
+            # 최근에 수집되지 않은 채널만 새 영상 수집 (보통은 정기 수집 작업이 이미 채워둠)
+            discovery_stats = discover_channel_videos(
+                self.downloader,
+                channel_ids,
+                max_age_minutes=getattr(
+                    settings, 'VIDEO_DISCOVERY_MAX_AGE_MINUTES', 90
+                )
+            )
+            self.last_fetch_stats['discovery'] = discovery_stats
+            
+            # 찾을 수 없는 채널은 캐시된 ID가 잘못되었을 수 있으므로 재해석 대상으로 표시
+            self.invalidate_channel_ids(discovery_stats['invalid_channel_ids'])
+            
+            # 발송 대상 영상은 Video 테이블에서 조회 (네트워크 수집 없음)
+            channel_videos = get_channel_videos(channel_ids)
+            transcripts = self.downloader.get_transcripts_for_videos(
+                channel_videos
+            )
             logger.info(f"{len(transcripts)}개 채널의 자막을 수집했습니다.")
             return transcripts
         except Exception as e:
@@ -112,84 +356,256 @@ class YouTubeMailService:
     
     def summarize_content(self, video_transcripts: Dict) -> str:
         """OpenAI를 사용하여 자막 내용 정리"""
-        if not self.openai_client:
-            logger.error("OpenAI 클라이언트가 초기화되지 않았습니다.")
-            return self._create_simple_summary(video_transcripts)
+        return '\n'.join(self.summarize_channels(video_transcripts).values())
+    
+    def summarize_channels(self, video_transcripts: Dict) -> Dict[str, str]:
+        """채널별 요약 HTML 조각 생성 (키: 채널 ID)
         
+        채널 조각은 한 번만 만들어지고, 사용자별 다이제스트는
+        assemble_digest()로 구독 채널의 조각만 이어 붙여 만듭니다.
+        """
         if not video_transcripts:
-            return ""
+            return {}
         
-        summaries = []
+        if not self.summarizer.providers:
+            logger.error("사용할 수 있는 LLM 제공자가 없습니다.")
+            return self._create_simple_fragments(video_transcripts)
+        
+        # 0단계: 요약 전 자막 정리 (비발화 표시/추임새 제거, 선택적 추출 요약)
+        stage_started_at = time.monotonic()
+        preprocess_stats = self.preprocess_transcripts(video_transcripts)
+        self.last_summary_stats = {
+            'preprocess': preprocess_stats,
+            'preprocess_seconds': round(time.monotonic() - stage_started_at, 2),
+        }
+        
+        # 1단계: 저장소에 없는 영상만 요약 대상으로 모음
+        stage_started_at = time.monotonic()
+        channel_parts = []
+        pending_videos = []
+        job_slots = []
         for channel_name, videos in video_transcripts.items():
-            channel_summary = f"""
+            parts = []
+            for video in videos:
+                # 이미 요약된 영상이면 저장소의 결과 재사용
+                cached_summary = self.summary_store.get(video, self.select_summary_model(video))
+                if cached_summary is None:
+                    pending_videos.append(video)
+                    job_slots.append((len(channel_parts), len(parts)))
+                parts.append(cached_summary)
+            channel_parts.append((channel_name, videos, parts))
+        self.last_summary_stats['store_lookup_seconds'] = round(
+            time.monotonic() - stage_started_at, 2
+        )
+        
+        # 2단계: 요약 요청을 동시에 실행 (긴 자막은 나눠서 요약 후 합침)
+        # 완료된 요약은 즉시 저장소에 기록되므로 중간에 중단되어도 다음 실행에서 이어서 처리
+        results = self._summarize_videos(pending_videos)
+        
+        for (channel_index, video_index), summary in zip(job_slots, results):
+            _, videos, parts = channel_parts[channel_index]
+            # 실패 시 간단한 요약 카드 사용
+            parts[video_index] = summary or self._create_failed_video_card(videos[video_index])
+        
+        # 3단계: 원래 채널/영상 순서대로 조각 조립
+        return {
+            self._get_channel_key(channel_name, videos): self._build_channel_fragment(
+                channel_name, parts
+            )
+            for channel_name, videos, parts in channel_parts
+        }
+    
+    def _build_channel_fragment(self, channel_name: str, parts: List[str]) -> str:
+        """영상 카드들을 채널 섹션 하나로 합침
+        
+        채널 조각은 여러 사용자 메일에 재사용되므로 CSS 인라인도 여기서 한 번만 수행합니다.
+        """
+        return inline_email_css(''.join([
+            f"""
             <div class="channel-section">
                 <h2 class="channel-title">{channel_name}</h2>
-            """
-            
+            """,
+            *parts,
+            "</div>",
+        ]))
+    
+    def preprocess_transcripts(self, video_transcripts: Dict) -> Dict:
+        """요약 전 자막 정리 (영상 자막을 정리된 내용으로 교체)
+        
+        영상마다 transcript_stats(원본/정리 후 토큰 수, 감소율)를 기록하고
+        전체 합계를 반환합니다. 이미 정리된 영상은 다시 처리하지 않습니다.
+        """
+        stats = {'videos': 0, 'original_tokens': 0, 'processed_tokens': 0,
+                 'downsampled_videos': 0, 'reduction_ratio': 0.0}
+        if not getattr(settings, 'TRANSCRIPT_PREPROCESS', True):
+            return stats
+        
+        token_budget = getattr(settings, 'TRANSCRIPT_TOKEN_BUDGET', 0)
+        for videos in video_transcripts.values():
             for video in videos:
-                prompt = f"""
-                다음 유튜브 영상의 자막을 분석하고 정리해주세요.
-                이때 영상의 제목과 자막 내용을 참고하여 영상의 내용을 요약해주세요.
-                논점 세부 내용은 각각 최소 3문장 이상으로 자세하게 작성해주세요.
-                제목: {video['title']}
-                내용: {video['transcript']}
-                
-                다음 HTML 형식으로 작성해주세요:
-                <div class="video-card">
-                    <h3 class="video-title">{video['title']}</h3>
-                    <div class="video-content">
-                        <div class="content-block">
-                            <h4>영상 개요</h4>
-                            <p>[전체적인 내용 한 문장으로]</p>
-                        </div>
-                        
-                        <div class="content-block">
-                            <h4>주요 논점</h4>
-                            <ul class="key-points">
-                                <li>[핵심 논점 1]</li>
-                                <li>[핵심 논점 2]</li>
-                                <li>[핵심 논점 3]</li>
-                            </ul>
-                        </div>
-                        
-                        <div class="content-block">
-                            <h4>논점 세부사항</h4>
-                            <ul class="details">
-                                <li>[논점 세부내용 1]</li>
-                                <li>[논점 세부내용 2]</li>
-                                <li>[논점 세부내용 3]</li>
-                            </ul>
-                        </div>
-                        
-                        <div class="content-block">
-                            <h4>총평 및 시사점</h4>
-                            <p>[내용에 대한 총평 및 시사점]</p>
-                        </div>
-                    </div>
-                    <div class="video-link">
-                        <a href="{video['url']}" target="_blank">영상 보기</a>
-                    </div>
-                </div>
-                """
-                
-                try:
-                    response = self.openai_client.chat.completions.create(
-                        model="gpt-4o",
-                        messages=[
-                            {"role": "system", "content": "당신은 유튜브 영상 내용을 분석하고 요약하는 전문가입니다. 주어진 HTML 형식을 정확히 따라 작성해주세요. 단, ```html``` 태그는 사용하지 않습니다."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        max_tokens=4096,
-                        temperature=0.3
+                if 'transcript_stats' not in video:
+                    video['transcript'], video['transcript_stats'] = preprocess_transcript(
+                        video['transcript'], token_budget, SUMMARY_MODEL
                     )
-                    
-                    summary = response.choices[0].message.content
-                    channel_summary += summary
-                    
-                except Exception as e:
-                    logger.error(f"OpenAI API 호출 실패: {str(e)}")
-                    # 실패 시 간단한 요약 생성
-                    channel_summary += f"""
+                    logger.info(
+                        f"자막 정리: {video['title']} - "
+                        f"{video['transcript_stats']['original_tokens']} → "
+                        f"{video['transcript_stats']['processed_tokens']} 토큰 "
+                        f"({video['transcript_stats']['reduction_ratio']:.1%} 감소)"
+                    )
+                stats['videos'] += 1
+                stats['original_tokens'] += video['transcript_stats']['original_tokens']
+                stats['processed_tokens'] += video['transcript_stats']['processed_tokens']
+                stats['downsampled_videos'] += int(video['transcript_stats']['downsampled'])
+        
+        if stats['original_tokens']:
+            stats['reduction_ratio'] = round(
+                1 - stats['processed_tokens'] / stats['original_tokens'], 3
+            )
+        return stats
+    
+    def select_summary_model(self, video: Dict) -> str:
+        """영상 길이(정리된 자막 토큰 수)에 따라 요약 모델 선택
+        
+        자막이 SUMMARY_SHORT_VIDEO_TOKENS 이하인 짧은 영상은
+        SUMMARY_SHORT_MODEL(저렴한 모델)로, 나머지는 SUMMARY_MODEL로 요약합니다.
+        """
+        short_model = getattr(settings, 'SUMMARY_SHORT_MODEL', '')
+        short_tokens = getattr(settings, 'SUMMARY_SHORT_VIDEO_TOKENS', 0)
+        if not short_model or not short_tokens:
+            return SUMMARY_MODEL
+        stats = video.get('transcript_stats')
+        tokens = (stats['processed_tokens'] if stats
+                  else estimate_tokens(video['transcript'], SUMMARY_MODEL))
+        return short_model if tokens <= short_tokens else SUMMARY_MODEL
+    
+    def _summarize_videos(self, videos: List[Dict]) -> List[str]:
+        """영상 목록 요약 (영상 순서대로, 실패 시 None)
+        
+        자막이 SUMMARY_CHUNK_THRESHOLD_TOKENS보다 긴 영상은
+        조각별 요약(map)을 먼저 동시에 실행하고, 조각 요약을 합친 내용으로
+        최종 요약(reduce)을 만듭니다. 최종 요약은 짧은 영상 요약과 함께 실행됩니다.
+        조각 요약과 최종 요약은 완료되는 즉시 저장소에 기록되고,
+        이미 저장된 조각 요약은 다시 요청하지 않습니다.
+        """
+        threshold = getattr(settings, 'SUMMARY_CHUNK_THRESHOLD_TOKENS', 12000)
+        chunk_tokens = getattr(settings, 'SUMMARY_CHUNK_SIZE_TOKENS', 6000)
+        overlap_tokens = getattr(settings, 'SUMMARY_CHUNK_OVERLAP_TOKENS', 200)
+        
+        # map 단계: 긴 자막을 조각으로 나누어 조각별 요약
+        stage_started_at = time.monotonic()
+        chunk_notes = {}
+        chunk_jobs = []
+        chunk_slots = []
+        chunk_keys = []
+        stored_chunks = 0
+        for index, video in enumerate(videos):
+            if estimate_tokens(video['transcript'], SUMMARY_MODEL) <= threshold:
+                continue
+            chunks = split_into_chunks(
+                video['transcript'], chunk_tokens, overlap_tokens, SUMMARY_MODEL
+            )
+            notes = chunk_notes[index] = [None] * len(chunks)
+            for chunk_index, chunk in enumerate(chunks):
+                chunk_key = {'video_id': SummaryStore.get_video_id(video), 'transcript': chunk}
+                notes[chunk_index] = self.chunk_store.get(chunk_key)
+                if notes[chunk_index] is not None:
+                    stored_chunks += 1
+                    continue
+                chunk_jobs.append(
+                    self._build_chunk_job(video, chunk, chunk_index + 1, len(chunks))
+                )
+                chunk_slots.append((index, chunk_index))
+                chunk_keys.append(chunk_key)
+        
+        def store_chunk_note(job_index: int, note: str):
+            self.chunk_store.set(chunk_keys[job_index], note)
+        
+        chunk_results = self.summarizer.run(chunk_jobs, on_result=store_chunk_note)
+        for (index, chunk_index), note in zip(chunk_slots, chunk_results):
+            chunk_notes[index][chunk_index] = note
+        for index in chunk_notes:
+            chunk_notes[index] = [note for note in chunk_notes[index] if note]
+        self.last_summary_stats.update({
+            'chunked_videos': len(chunk_notes),
+            'chunks': len(chunk_jobs) + stored_chunks,
+            'stored_chunks': stored_chunks,
+            'map': dict(self.summarizer.last_run_stats) if chunk_jobs else {},
+            'map_seconds': round(time.monotonic() - stage_started_at, 2),
+        })
+        
+        # reduce 단계: 조각 요약을 합쳐 (또는 짧은 자막 그대로) 최종 요약
+        stage_started_at = time.monotonic()
+        jobs = []
+        job_indexes = []
+        for index, video in enumerate(videos):
+            if index in chunk_notes:
+                if not chunk_notes[index]:
+                    logger.error(f"조각 요약이 모두 실패했습니다: {video['title']}")
+                    continue
+                jobs.append(self._build_summary_job(video, '\n\n'.join(chunk_notes[index])))
+            else:
+                jobs.append(self._build_summary_job(video))
+            job_indexes.append(index)
+        
+        def store_summary(job_index: int, summary: str):
+            video = videos[job_indexes[job_index]]
+            self.summary_store.set(video, summary, self.select_summary_model(video))
+        
+        summaries = [None] * len(videos)
+        for index, summary in zip(job_indexes, self.summarizer.run(jobs, on_result=store_summary)):
+            summaries[index] = summary
+        self.last_summary_stats.update({
+            'reduce': dict(self.summarizer.last_run_stats) if jobs else {},
+            'reduce_seconds': round(time.monotonic() - stage_started_at, 2),
+        })
+        logger.info(
+            f"요약 단계별 소요 시간: 조회 {self.last_summary_stats['store_lookup_seconds']}초, "
+            f"조각 요약 {self.last_summary_stats['map_seconds']}초 "
+            f"({len(chunk_jobs)}개 조각), 최종 요약 {self.last_summary_stats['reduce_seconds']}초"
+        )
+        return summaries
+    
+    def _build_chunk_job(self, video: Dict, chunk: str, chunk_index: int,
+                         total_chunks: int) -> Dict:
+        """긴 자막 조각 하나의 요약 요청"""
+        prompt = CHUNK_SUMMARY_PROMPT_TEMPLATE.format(
+            title=video['title'],
+            index=chunk_index,
+            total=total_chunks,
+            transcript=chunk
+        )
+        return {
+            'messages': [
+                {"role": "system", "content": CHUNK_SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': getattr(settings, 'SUMMARY_CHUNK_MAX_TOKENS', 1024),
+            'purpose': 'chunk',
+            'video_id': SummaryStore.get_video_id(video),
+        }
+    
+    def _build_summary_job(self, video: Dict, transcript: str = None) -> Dict:
+        """영상 하나의 요약 요청 (transcript를 주면 자막 대신 사용)"""
+        prompt = SUMMARY_PROMPT_TEMPLATE.format(
+            title=video['title'],
+            transcript=transcript or video['transcript'],
+            url=video['url']
+        )
+        return {
+            'messages': [
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': 4096,
+            'model': self.select_summary_model(video),
+            'purpose': 'digest',
+            'video_id': SummaryStore.get_video_id(video),
+        }
+    
+    def _create_failed_video_card(self, video: Dict) -> str:
+        """요약에 실패한 영상 카드"""
+        return f"""
                     <div class="video-card">
                         <h3 class="video-title">{video['title']}</h3>
                         <div class="video-content">
@@ -200,31 +616,34 @@ class YouTubeMailService:
                         </div>
                     </div>
                     """
-            
-            channel_summary += "</div>"
-            summaries.append(channel_summary)
-        
-        return '\n'.join(summaries)
     
-    def _create_simple_summary(self, video_transcripts: Dict) -> str:
-        """OpenAI 없이 간단한 요약 생성"""
-        if not video_transcripts:
-            return ""
-        
-        summaries = []
+    def _get_channel_key(self, channel_name: str, videos: List[Dict]) -> str:
+        """채널 조각 키 (채널 ID, 없으면 채널 이름)"""
+        if videos and videos[0].get('channel_id'):
+            return videos[0]['channel_id']
+        return channel_name
+    
+    def assemble_digest(self, channel_fragments: Dict[str, str],
+                        channel_ids: List[str]) -> str:
+        """구독 채널의 요약 조각만 이어 붙여 사용자별 다이제스트 생성"""
+        return '\n'.join(
+            channel_fragments[channel_id]
+            for channel_id in dict.fromkeys(channel_ids)
+            if channel_id in channel_fragments
+        )
+    
+    def _create_simple_fragments(self, video_transcripts: Dict) -> Dict[str, str]:
+        """OpenAI 없이 채널별 간단한 요약 조각 생성"""
+        fragments = {}
         for channel_name, videos in video_transcripts.items():
-            channel_summary = f"""
-            <div class="channel-section">
-                <h2 class="channel-title">{channel_name}</h2>
-            """
-            
+            parts = []
             for video in videos:
                 # 자막의 첫 200자만 미리보기로 사용
                 preview = video['transcript'][:200] + "..." if len(
                     video['transcript']
                 ) > 200 else video['transcript']
                 
-                channel_summary += f"""
+                parts.append(f"""
                 <div class="video-card">
                     <h3 class="video-title">{video['title']}</h3>
                     <div class="video-content">
@@ -237,121 +656,297 @@ class YouTubeMailService:
                         <a href="{video['url']}" target="_blank">영상 보기</a>
                     </div>
                 </div>
-                """
+                """)
             
-            channel_summary += "</div>"
-            summaries.append(channel_summary)
+            fragments[self._get_channel_key(channel_name, videos)] = self._build_channel_fragment(
+                channel_name, parts
+            )
         
-        css_styles = self._get_email_css()
-        return css_styles + "\n".join(summaries)
+        return fragments
     
     def _get_email_css(self) -> str:
         """이메일용 CSS 스타일 반환"""
-        return """
-        <style>
-            .channel-section {
-                margin: 20px 0;
-                padding: 20px;
-                background-color: #f8f9fa;
-                border-radius: 8px;
-            }
-            
-            .channel-title {
-                color: #d04a02;
-                border-bottom: 2px solid #d04a02;
-                padding-bottom: 10px;
-                margin-bottom: 20px;
-            }
-            
-            .video-card {
-                margin: 15px 0;
-                padding: 15px;
-                background-color: white;
-                border-left: 4px solid #d04a02;
-                border-radius: 4px;
-            }
-            
-            .video-title {
-                color: #2d2d2d;
-                margin-bottom: 15px;
-            }
-            
-            .video-content {
-                margin: 10px 0;
-            }
-            
-            .content-block {
-                margin: 15px 0;
-            }
-            
-            .content-block h4 {
-                color: #d04a02;
-                margin-bottom: 10px;
-            }
-            
-            .content-block p,
-            .content-block ul {
-                color: #2d2d2d;
-                margin: 8px 0;
-            }
-            
-            .content-block ul {
-                padding-left: 20px;
-            }
-            
-            .content-block li {
-                margin: 5px 0;
-            }
-            
-            .video-link {
-                margin-top: 15px;
-            }
-            
-            .video-link a {
-                color: #d04a02;
-                text-decoration: none;
-                padding: 8px 0;
-                display: inline-block;
-            }
-            
-            @media screen and (max-width: 600px) {
-                .channel-section {
-                    padding: 15px;
-                    margin: 15px 0;
-                }
-                
-                .video-card {
-                    padding: 12px;
-                    margin: 12px 0;
-                }
-                
-                .video-title {
-                    font-size: 1.2em;
-                }
-                
-                .content-block h4 {
-                    font-size: 1.1em;
-                }
-                
-                .content-block ul {
-                    padding-left: 15px;
-                }
-                
-                .content-block p,
-                .content-block li {
-                    font-size: 0.95em;
-                }
-            }
-        </style>
-        """
+        return EMAIL_CSS
     
     def send_summary_emails(self, subscriptions: List[Subscription], 
-                           summarized_content: str) -> bool:
-        """요약된 콘텐츠를 이메일로 발송 (사용자별로 그룹핑)"""
+                           summarized_content: str = "",
+                           channel_fragments: Dict[str, str] = None,
+                           subscription_channels: Dict[int, str] = None) -> bool:
+        """요약된 콘텐츠를 이메일로 발송 (사용자별로 그룹핑)
+        
+        channel_fragments가 주어지면 각 사용자에게 본인이 구독한 채널의
+        요약 조각만 모아 보내고, 없으면 summarized_content를 그대로 보냅니다.
+        """
+        started_at = time.monotonic()
         kst = pytz.timezone('Asia/Seoul')
         current_date = datetime.now(kst).strftime('%Y-%m-%d')
         
         # 사용자별로 구독 그룹핑
+        user_subscriptions = self._group_by_recipient(subscriptions)
+        
+        success_count = 0
+        total_count = len(user_subscriptions)
+        
+        # Gmail API 서비스 초기화
+        gmail_service = self._get_gmail_service()
+        
+        # Gmail API 메일은 모아서 동시에 발송 (메모리를 위해 일정 개수씩 나눠 발송)
+        gmail_sender = self._create_gmail_sender(gmail_service) if gmail_service else None
+        gmail_outbox = []
+        gmail_chunk_size = max(1, getattr(settings, 'GMAIL_SEND_CHUNK_SIZE', 200))
+        
+        def send_gmail_outbox():
+            nonlocal success_count
+            results = gmail_sender.send_many([
+                {'to': recipient, 'subject': mail_subject, 'html': html}
+                for recipient, mail_subject, html, _ in gmail_outbox
+            ])
+            for (recipient, mail_subject, html, recipient_subscriptions), result in zip(
+                gmail_outbox, results
+            ):
+                if result['success']:
+                    success_count += 1
+                    logger.info(f"Gmail API로 이메일 발송 성공: {recipient} ({result['message_id']})")
+                else:
+                    logger.error(f"Gmail API로 이메일 발송 실패: {recipient}")
+                for subscription in recipient_subscriptions:
+                    email_logs.add(
+                        subscription=subscription,
+                        subject=mail_subject,
+                        content=html[:1000] if result['success'] else "",
+                        is_successful=result['success'],
+                        error_message=result['error'] or None
+                    )
+            gmail_outbox.clear()
+        
+        # Gmail API를 쓸 수 없을 때는 SMTP 연결을 미리 열어 모든 메일에 재사용
+        mail_connection = None
+        if not gmail_sender:
+            mail_connection = get_connection()
+            try:
+                mail_connection.open()
+            except Exception as e:
+                # 여기서 실패하면 메일마다 다시 연결을 시도
+                logger.error(f"SMTP 연결 실패: {str(e)}")
+        
+        # 사용자별로 이메일 발송 (발송 로그는 모아서 저장, 예외가 나도 남은 로그는 저장)
+        email_logs = EmailLogBuffer(getattr(settings, 'EMAIL_LOG_BATCH_SIZE', 500))
+        with email_logs:
+            for recipient_email, user_data in user_subscriptions.items():
+                try:
+                    user_name = user_data['user_name']
+                    user_subscriptions_list = user_data['subscriptions']
+                    
+                    # 이메일 제목
+                    subject = self._get_email_subject(current_date)
+                    html_content = self._render_user_email(
+                        user_name, current_date, user_subscriptions_list,
+                        summarized_content, channel_fragments, subscription_channels
+                    )
+                    
+                    # Gmail API 사용 시 발송 대기열에 추가 (결과는 발송 후 로그에 반영)
+                    if gmail_sender:
+                        gmail_outbox.append(
+                            (recipient_email, subject, html_content, user_subscriptions_list)
+                        )
+                        if len(gmail_outbox) >= gmail_chunk_size:
+                            send_gmail_outbox()
+                        continue
+                    
+                    # Django 기본 이메일 백엔드 사용
+                    send_mail(
+                        subject=subject,
+                        message='',
+                        from_email=settings.DEFAULT_FROM_EMAIL,
+                        recipient_list=[recipient_email],
+                        html_message=html_content,
+                        fail_silently=False,
+                        connection=mail_connection,
+                    )
+                    success_count += 1
+                    logger.info(f"Django 이메일로 발송 성공: {recipient_email}")
+                    
+                    # 각 구독에 대해 이메일 로그 저장
+                    for subscription in user_subscriptions_list:
+                        email_logs.add(
+                            subscription=subscription,
+                            subject=subject,
+                            content=html_content[:1000],
+                            is_successful=True
+                        )
+                    
+                except Exception as e:
+                    logger.error(f"이메일 발송 실패 ({recipient_email}): {str(e)}")
+                    
+                    # 실패 로그 저장
+                    for subscription in user_subscriptions_list:
+                        email_logs.add(
+                            subscription=subscription,
+                            subject=subject if 'subject' in locals() else '',
+                            content="",
+                            is_successful=False,
+                            error_message=str(e)
+                        )
+            
+            if gmail_outbox:
+                send_gmail_outbox()
+            if mail_connection is not None:
+                mail_connection.close()
+        
+        self.last_send_stats = {
+            'recipients': total_count,
+            'succeeded': success_count,
+            'send_seconds': round(time.monotonic() - started_at, 2),
+            **email_logs.stats(),
+        }
+        logger.info(
+            f"이메일 발송 완료: {success_count}/{total_count} "
+            f"({self.last_send_stats['send_seconds']}초, 로그 {email_logs.written}건 "
+            f"{email_logs.flushes}회 저장 {self.last_send_stats['log_write_seconds']}초)"
+        )
+        return success_count == total_count
+    
+    def enqueue_summary_emails(self, subscriptions: List[Subscription],
+                               scheduled_at: datetime,
+                               channel_fragments: Dict[str, str] = None,
+                               subscription_channels: Dict[int, str] = None) -> int:
+        """사용자별 다이제스트를 렌더링하고 MIME 인코딩까지 마쳐 발송 대기열에 추가
+        
+        발송 시점에는 저장된 메시지를 압축 해제해 전송만 하면 됩니다.
+        같은 발송 시각에 이미 대기열에 들어간 수신자는 건너뛰므로
+        여러 번 호출해도 수신자당 한 통만 발송됩니다.
+        
+        Returns:
+            int: 새로 대기열에 추가한 메일 수
+        """
+        started_at = time.monotonic()
+        slot = scheduled_at.strftime('%H:%M')
+        current_date = scheduled_at.strftime('%Y-%m-%d')
+        subject = self._get_email_subject(current_date)
+        already_queued = queued_recipients(scheduled_at)
+        
+        messages = []
+        for recipient_email, user_data in self._group_by_recipient(subscriptions).items():
+            if recipient_email in already_queued:
+                continue
+            try:
+                html_content = self._render_user_email(
+                    user_data['user_name'], current_date, user_data['subscriptions'],
+                    "", channel_fragments or {}, subscription_channels
+                )
+                message = stage_message(
+                    make_idempotency_key(scheduled_at, recipient_email),
+                    scheduled_at, recipient_email, subject, html_content
+                )
+            except Exception as e:
+                logger.error(f"이메일 렌더링 실패 ({recipient_email}): {str(e)}")
+                continue
+            message.subscription_ids = [
+                subscription.id for subscription in user_data['subscriptions']
+            ]
+            messages.append(message)
+        
+        enqueued = enqueue_messages(messages)
+        raw_bytes = sum(message.message_size for message in messages)
+        stored_bytes = sum(len(message.compressed_message) for message in messages)
+        logger.info(
+            f"{slot} 발송 대기열 추가: {enqueued}개 "
+            f"(이미 추가된 수신자 {len(already_queued)}명, "
+            f"메시지 {raw_bytes:,}B -> 압축 {stored_bytes:,}B, "
+            f"{time.monotonic() - started_at:.2f}초)"
+        )
+        return enqueued
+    
+    def send_outbox_messages(self, messages: List[OutboxMessage]) -> Dict:
+        """선점한 대기열 메일 발송 후 결과와 발송 로그 저장
+        
+        준비 작업에서 인코딩해 둔 메시지에 From, Date 헤더만 붙여 보냅니다.
+        Gmail API를 쓸 수 있으면 동시에 발송하고, 없으면 SMTP 연결 하나로 순서대로 보냅니다.
+        대기열에 넣은 뒤 구독이 모두 해지된 수신자의 메일은 보내지 않고 실패 처리합니다.
+        """
+        started_at = time.monotonic()
+        messages = cancel_inactive_messages(messages)
+        if not messages:
+            return {'recipients': 0, 'succeeded': 0, 'send_seconds': 0.0}
+        
+        gmail_service = self._get_gmail_service()
+        mark_sending(messages)
+        
+        if gmail_service:
+            sender_headers = build_sender_headers(GMAIL_SENDER_ADDRESS)
+            results = self._create_gmail_sender(gmail_service).send_many([
+                {'to': message.recipient_email, 'raw': load_message(message, sender_headers)}
+                for message in messages
+            ])
+        else:
+            results = []
+            sender_headers = build_sender_headers(settings.DEFAULT_FROM_EMAIL)
+            mail_connection = get_connection()
+            try:
+                mail_connection.open()
+            except Exception as e:
+                logger.error(f"SMTP 연결 실패: {str(e)}")
+            for message in messages:
+                try:
+                    raw_message = load_message(message, sender_headers)
+                    if hasattr(mail_connection, 'send_raw'):
+                        mail_connection.send_raw(
+                            settings.DEFAULT_FROM_EMAIL, [message.recipient_email], raw_message
+                        )
+                    else:
+                        # 원문 전송을 지원하지 않는 백엔드(콘솔 등)는 HTML을 꺼내 다시 구성
+                        send_mail(
+                            subject=message.subject,
+                            message='',
+                            from_email=settings.DEFAULT_FROM_EMAIL,
+                            recipient_list=[message.recipient_email],
+                            html_message=extract_html(raw_message),
+                            fail_silently=False,
+                            connection=mail_connection,
+                        )
+                    results.append({'success': True, 'message_id': '', 'error': ''})
+                except Exception as e:
+                    logger.error(f"이메일 발송 실패 ({message.recipient_email}): {str(e)}")
+                    results.append({'success': False, 'message_id': '', 'error': str(e)})
+            mail_connection.close()
+        
+        record_results(messages, results)
+        
+        # 대기열에 넣은 뒤 삭제된 구독은 로그를 남기지 않음
+        existing_ids = set(Subscription.objects.filter(
+            id__in=[sid for message in messages for sid in message.subscription_ids]
+        ).values_list('id', flat=True))
+        email_logs = EmailLogBuffer(getattr(settings, 'EMAIL_LOG_BATCH_SIZE', 500))
+        with email_logs:
+            for message, result in zip(messages, results):
+                for subscription_id in message.subscription_ids:
+                    if subscription_id not in existing_ids:
+                        continue
+                    email_logs.add(
+                        subscription_id=subscription_id,
+                        subject=message.subject,
+                        content=message.content_preview if result['success'] else "",
+                        is_successful=result['success'],
+                        error_message=result['error'] or None
+                    )
+        
+        succeeded = sum(1 for result in results if result['success'])
+        # send_summary_emails와 같은 항목으로 기록 (발송 작업 결과에도 그대로 포함)
+        self.last_send_stats = {
+            'recipients': len(messages),
+            'succeeded': succeeded,
+            'send_seconds': round(time.monotonic() - started_at, 2),
+            **email_logs.stats(),
+        }
+        logger.info(
+            f"대기열 메일 발송 완료: {succeeded}/{len(messages)} "
+            f"({self.last_send_stats['send_seconds']}초, 로그 {email_logs.written}건 "
+            f"{email_logs.flushes}회 저장 {self.last_send_stats['log_write_seconds']}초)"
+        )
+        return self.last_send_stats
+    
+    def _group_by_recipient(self, subscriptions: List[Subscription]) -> Dict[str, Dict]:
+        """수신자 이메일별 구독 묶음 {이메일: {'user_name': str, 'subscriptions': [...]}}"""
         user_subscriptions = {}
         for subscription in subscriptions:
             # 이메일 주소 가져오기 (user 모델에서 우선, 없으면 기존 email 필드)
@@ -374,12 +969,40 @@ class YouTubeMailService:
                     'subscriptions': []
                 }
             user_subscriptions[recipient_email]['subscriptions'].append(subscription)
+        return user_subscriptions
+    
+    def _get_email_subject(self, current_date: str) -> str:
+        """다이제스트 메일 제목"""
+        return f'YouTube 채널 요약 - {current_date}'
+    
+    def _render_user_email(self, user_name: str, current_date: str,
+                           subscriptions: List[Subscription], summarized_content: str,
+                           channel_fragments: Dict[str, str] = None,
+                           subscription_channels: Dict[int, str] = None) -> str:
+        """사용자가 구독한 채널의 요약 조각만 조립해 메일 HTML 생성"""
+        if channel_fragments is not None:
+            user_content = self.assemble_digest(
+                channel_fragments,
+                [
+                    subscription_channels[subscription.id]
+                    for subscription in subscriptions
+                    if subscription.id in (subscription_channels or {})
+                ]
+            )
+        else:
+            user_content = summarized_content
         
-        success_count = 0
-        total_count = len(user_subscriptions)
-        
-        # Gmail API 서비스 초기화
-        gmail_service = None
+        # 콘텐츠가 없는 경우
+        if not user_content.strip():
+            return self._create_no_content_email_for_user(
+                user_name, current_date, subscriptions
+            )
+        return self._create_summary_email_for_user(
+            user_name, current_date, user_content, subscriptions
+        )
+    
+    def _get_gmail_service(self):
+        """Gmail API 서비스 (초기화 실패 시 None)"""
         try:
             from auth_manager import GoogleAuthManager
             gmail_service = GoogleAuthManager.get_service(
@@ -391,203 +1014,44 @@ class YouTubeMailService:
                 api_version='v1'
             )
             logger.info("Gmail API 서비스 초기화 성공")
+            return gmail_service
         except Exception as e:
             logger.error(f"Gmail API 초기화 실패: {str(e)}")
-            gmail_service = None
-        
-        # 사용자별로 이메일 발송
-        for recipient_email, user_data in user_subscriptions.items():
-            try:
-                user_name = user_data['user_name']
-                user_subscriptions_list = user_data['subscriptions']
-                
-                # 이메일 제목
-                subject = f'YouTube 채널 요약 - {current_date}'
-                
-                # 콘텐츠가 없는 경우
-                if not summarized_content.strip():
-                    html_content = self._create_no_content_email_for_user(
-                        user_name, current_date, user_subscriptions_list
-                    )
-                else:
-                    html_content = self._create_summary_email_for_user(
-                        user_name, current_date, summarized_content, user_subscriptions_list
-                    )
-                
-                # Gmail API 사용 시도
-                if gmail_service:
-                    success = self._send_email_via_gmail_api(
-                        gmail_service, recipient_email, subject, html_content
-                    )
-                    if success:
-                        success_count += 1
-                        logger.info(f"Gmail API로 이메일 발송 성공: {recipient_email}")
-                    else:
-                        logger.error(f"Gmail API로 이메일 발송 실패: {recipient_email}")
-                else:
-                    # Django 기본 이메일 백엔드 사용
-                    send_mail(
-                        subject=subject,
-                        message='',
-                        from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=[recipient_email],
-                        html_message=html_content,
-                        fail_silently=False,
-                    )
-                    success_count += 1
-                    logger.info(f"Django 이메일로 발송 성공: {recipient_email}")
-                
-                # 각 구독에 대해 이메일 로그 저장
-                for subscription in user_subscriptions_list:
-                    EmailLog.objects.create(
-                        subscription=subscription,
-                        subject=subject,
-                        content=html_content[:1000],
-                        is_successful=True
-                    )
-                
-            except Exception as e:
-                logger.error(f"이메일 발송 실패 ({recipient_email}): {str(e)}")
-                
-                # 실패 로그 저장
-                for subscription in user_subscriptions_list:
-                    EmailLog.objects.create(
-                        subscription=subscription,
-                        subject=subject if 'subject' in locals() else '',
-                        content="",
-                        is_successful=False,
-                        error_message=str(e)
-                    )
-        
-        logger.info(f"이메일 발송 완료: {success_count}/{total_count}")
-        return success_count == total_count
+            return None
     
-    def _send_email_via_gmail_api(self, gmail_service, to_email, subject, html_content):
-        """Gmail API를 사용하여 이메일 발송"""
-        try:
-            import base64
-            from email.mime.text import MIMEText
-            from email.mime.multipart import MIMEMultipart
-            
-            # 이메일 메시지 생성
-            message = MIMEMultipart('alternative')
-            message['from'] = 'admin@pwc-edge.com'  # 발신자 주소 추가
-            message['to'] = to_email
-            message['subject'] = subject
-            
-            # HTML 파트 추가
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            message.attach(html_part)
-            
-            # 메시지를 base64로 인코딩
-            raw_message = base64.urlsafe_b64encode(
-                message.as_bytes()
-            ).decode('utf-8')
-            
-            # Gmail API로 전송
-            send_result = gmail_service.users().messages().send(
-                userId='me',
-                body={'raw': raw_message}
-            ).execute()
-            
-            logger.info(f"Gmail API 전송 결과: {send_result.get('id', 'Unknown')}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Gmail API 이메일 발송 실패: {str(e)}")
-            return False
+    def _create_gmail_sender(self, gmail_service) -> GmailSender:
+        """설정값(동시 발송 수, 재시도 횟수, 초당 발송 수)을 반영한 Gmail 발송기 생성"""
+        send_rate = getattr(settings, 'GMAIL_SEND_RATE', 0)
+        return GmailSender(
+            gmail_service,
+            max_workers=getattr(settings, 'GMAIL_SEND_CONCURRENCY', 8),
+            max_retries=getattr(settings, 'GMAIL_SEND_MAX_RETRIES', 5),
+            rate_limiter=TokenBucket(send_rate) if send_rate > 0 and YOUTUBE_DOWNLOADER_AVAILABLE else None
+        )
     
-    def _create_summary_email_for_user(self, user_name: str, current_date: str, 
-                                      content: str, subscriptions: List[Subscription]) -> str:
-        """사용자별 요약 콘텐츠 이메일 생성"""
-        # 구독 채널 목록 생성
+    def _get_channels_text(self, subscriptions: List[Subscription]) -> str:
+        """이메일 헤더에 들어갈 구독 채널 목록"""
         channel_list = []
         for subscription in subscriptions:
             channel_name = subscription.channel_name or subscription.youtube_channel_url
             channel_list.append(f"• {channel_name}")
-        
-        channels_text = "<br>".join(channel_list)
-        
-        return f"""
-        <html>
-            <head>
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                {self._get_email_css()}
-            </head>
-            <body>
-                <div class="date-info" style="color: #666666; text-align: right; margin-bottom: 20px;">
-                    발송일: {current_date}
-                </div>
-                
-                <div class="email-header" style="background-color: white; padding: 30px; border-bottom: 3px solid #d04a02; margin-bottom: 30px; text-align: center;">
-                    <h1 style="margin: 0; color: #2d2d2d;">{user_name}님을 위한 오늘의 YouTube 콘텐츠 요약</h1>
-                    <p style="margin: 10px 0 0 0; color: #666666;">구독하신 채널의 최신 콘텐츠를 AI가 요약했습니다</p>
-                    <div style="margin-top: 15px; padding: 10px; background-color: #f8f9fa; border-radius: 5px;">
-                        <p style="margin: 0; color: #666666; font-size: 14px;"><strong>구독 채널 ({len(subscriptions)}개):</strong></p>
-                        <div style="margin-top: 5px; color: #888888; font-size: 13px;">{channels_text}</div>
-                    </div>
-                </div>
-
-                <div class="content-section" style="margin: 20px 0;">
-                    {content}
-                </div>
-                
-                <div class="email-footer" style="margin-top: 30px; padding: 20px; background-color: #f8f9fa; border-top: 3px solid #d04a02; text-align: center;">
-                    <p style="color: #2d2d2d; margin: 5px 0;">이 메일은 자동으로 생성된 유튜브 콘텐츠 요약 서비스입니다.</p>
-                    <p style="color: #2d2d2d; margin: 5px 0;">문의사항이 있으시면 답장해 주시기 바랍니다.</p>
-                    <p style="color: #2d2d2d; margin: 5px 0;">감사합니다.</p>
-                </div>
-            </body>
-        </html>
-        """
+        return "<br>".join(channel_list)
+    
+    def _create_summary_email_for_user(self, user_name: str, current_date: str, 
+                                      content: str, subscriptions: List[Subscription]) -> str:
+        """사용자별 요약 콘텐츠 이메일 생성 (미리 만들어 둔 틀에 사용자별 값만 치환)"""
+        return render_summary_email(
+            user_name, current_date, len(subscriptions),
+            self._get_channels_text(subscriptions), content
+        )
     
     def _create_no_content_email_for_user(self, user_name: str, current_date: str, 
                                          subscriptions: List[Subscription]) -> str:
-        """사용자별 콘텐츠 없음 이메일 생성"""
-        # 구독 채널 목록 생성
-        channel_list = []
-        for subscription in subscriptions:
-            channel_name = subscription.channel_name or subscription.youtube_channel_url
-            channel_list.append(f"• {channel_name}")
-        
-        channels_text = "<br>".join(channel_list)
-        
-        return f"""
-        <html>
-            <head>
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                {self._get_email_css()}
-            </head>
-            <body>
-                <div class="date-info" style="color: #666666; text-align: right; margin-bottom: 20px;">
-                    발송일: {current_date}
-                </div>
-                
-                <div class="email-header" style="background-color: white; padding: 30px; border-bottom: 3px solid #d04a02; margin-bottom: 30px; text-align: center;">
-                    <h1 style="margin: 0; color: #2d2d2d;">{user_name}님을 위한 오늘의 YouTube 콘텐츠 요약</h1>
-                    <p style="margin: 10px 0 0 0; color: #666666;">구독하신 채널의 최신 콘텐츠를 확인했습니다</p>
-                    <div style="margin-top: 15px; padding: 10px; background-color: #f8f9fa; border-radius: 5px;">
-                        <p style="margin: 0; color: #666666; font-size: 14px;"><strong>구독 채널 ({len(subscriptions)}개):</strong></p>
-                        <div style="margin-top: 5px; color: #888888; font-size: 13px;">{channels_text}</div>
-                    </div>
-                </div>
-
-                <div class="content-section" style="margin: 20px 0;">
-                    <div class="no-content-message" style="text-align: center; padding: 30px; background-color: #f8f9fa; border-radius: 8px;">
-                        <h2 style="color: #666666;">새로운 업데이트가 없습니다</h2>
-                        <p style="color: #888888;">구독하신 채널에 어제 오전 7시 이후 업로드된 새로운 콘텐츠가 없습니다.</p>
-                        <p style="color: #888888;">다음 업데이트를 기다려주세요!</p>
-                    </div>
-                </div>
-                
-                <div class="email-footer" style="margin-top: 30px; padding: 20px; background-color: #f8f9fa; border-top: 3px solid #d04a02; text-align: center;">
-                    <p style="color: #2d2d2d; margin: 5px 0;">이 메일은 자동으로 생성된 유튜브 콘텐츠 요약 서비스입니다.</p>
-                    <p style="color: #2d2d2d; margin: 5px 0;">문의사항이 있으시면 답장해 주시기 바랍니다.</p>
-                    <p style="color: #2d2d2d; margin: 5px 0;">감사합니다.</p>
-                </div>
-            </body>
-        </html>
-        """
+        """사용자별 콘텐츠 없음 이메일 생성 (미리 만들어 둔 틀에 사용자별 값만 치환)"""
+        return render_no_content_email(
+            user_name, current_date, len(subscriptions),
+            self._get_channels_text(subscriptions)
+        )
     
     def process_daily_summaries(self) -> Dict:
         """일일 요약 처리 메인 함수"""
@@ -607,26 +1071,31 @@ class YouTubeMailService:
         try:
             # 1. 자막 수집
             logger.info("YouTube 자막 수집 시작")
-            video_transcripts = self.get_video_transcripts(
+            subscription_channels = self.resolve_subscription_channels(
                 list(active_subscriptions)
             )
+            video_transcripts = self.get_video_transcripts(
+                list(active_subscriptions), subscription_channels
+            )
             
-            # 2. 콘텐츠 요약
+            # 2. 채널별 콘텐츠 요약
             logger.info("콘텐츠 요약 시작")
-            summarized_content = self.summarize_content(video_transcripts)
+            channel_fragments = self.summarize_channels(video_transcripts)
             
-            # 3. 이메일 발송
+            # 3. 사용자별 다이제스트 조립 후 이메일 발송
             logger.info("이메일 발송 시작")
             success = self.send_summary_emails(
-                list(active_subscriptions), 
-                summarized_content
+                list(active_subscriptions),
+                channel_fragments=channel_fragments,
+                subscription_channels=subscription_channels
             )
             
             return {
                 'success': success,
                 'message': '일일 요약 처리 완료',
                 'processed_count': len(active_subscriptions),
-                'channels_found': len(video_transcripts)
+                'channels_found': len(video_transcripts),
+                'channel_dedup': self.last_fetch_stats
             }
             
         except Exception as e:
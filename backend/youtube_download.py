@@ -8,11 +8,13 @@ import re
 import os
 import pickle
 import logging
-import pytz
-from datetime import datetime, timedelta
+from datetime import datetime
 import sys
 import time
 import random
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, YouTubeRequestFailed
 
 # 로거가 이미 설정되었는지 확인
@@ -27,10 +29,117 @@ if not logger.handlers:
 # 상위 로거로 메시지 전파 방지
 logger.propagate = False
 
+# 기본 자막 선호 순서: 한국어, 영어, 한국어 자동 생성, 영어 자동 생성
+DEFAULT_TRANSCRIPT_LANGUAGES = ['ko', 'en', 'ko-auto', 'en-auto']
+
+
+class TokenBucket:
+    """여러 워커 스레드가 공유하는 토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다. (제한이 없으면 TokenBucket을 사용하지 않음)")
+        self.rate = rate  # 초당 충전되는 토큰 수
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """토큰이 생길 때까지 대기한 후 소비"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait_time = (tokens - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+
+class ProxyPool:
+    """자막 요청용 프록시 목록 (요청마다 정상 프록시를 번갈아 사용)
+
+    상태 확인(check_health)은 요청 경로가 아닌 주기 작업에서 실행하고,
+    요청 중 연결 오류가 난 프록시는 다음 상태 확인 전까지 제외합니다.
+    정상 프록시가 없으면 직접 연결을 사용합니다.
+    """
+
+    def __init__(self, proxy_urls: List[str], check_url: str = "https://httpbin.org/ip",
+                 timeout: float = 5.0):
+        self.proxy_urls = [url for url in proxy_urls if url]
+        self.check_url = check_url
+        self.timeout = timeout
+        self.healthy = list(self.proxy_urls)
+        self.index = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def to_proxies(proxy_url: str) -> Dict:
+        return {"https": proxy_url, "http": proxy_url}
+
+    def next(self):
+        """다음 프록시 설정 반환 (정상 프록시가 없으면 None = 직접 연결)"""
+        with self.lock:
+            if not self.healthy:
+                return None
+            proxy_url = self.healthy[self.index % len(self.healthy)]
+            self.index += 1
+        return self.to_proxies(proxy_url)
+
+    def mark_failed(self, proxies: Dict):
+        """연결에 실패한 프록시를 정상 목록에서 제외"""
+        proxy_url = (proxies or {}).get("https")
+        with self.lock:
+            if proxy_url in self.healthy:
+                self.healthy.remove(proxy_url)
+                logger.warning(f"프록시 제외: {proxy_url} (남은 프록시 {len(self.healthy)}개)")
+
+    def set_healthy(self, proxy_urls: List[str]):
+        """상태 확인 결과 반영 (설정에 없는 프록시는 무시)"""
+        with self.lock:
+            self.healthy = [url for url in self.proxy_urls if url in proxy_urls]
+
+    def check_health(self) -> List[str]:
+        """설정된 프록시마다 연결을 확인하고 정상 목록 갱신"""
+        healthy = []
+        for proxy_url in self.proxy_urls:
+            try:
+                response = requests.get(self.check_url,
+                                        proxies=self.to_proxies(proxy_url),
+                                        timeout=self.timeout)
+                if response.status_code == 200:
+                    healthy.append(proxy_url)
+                else:
+                    logger.warning(f"프록시 상태 확인 실패: {proxy_url} (HTTP {response.status_code})")
+            except Exception as e:
+                logger.warning(f"프록시 상태 확인 실패: {proxy_url} ({str(e)})")
+        self.set_healthy(healthy)
+        logger.info(f"프록시 상태 확인 완료: {len(healthy)}/{len(self.proxy_urls)}개 정상")
+        return healthy
+
 
 class YouTubeTranscriptDownloader:
-    def __init__(self):
+    def __init__(self, max_workers: int = 4, requests_per_second: float = 2.0,
+                 languages: List[str] = None):
         self.youtube = None
+        # 자막 선호 순서 ('-auto'는 자동 생성 자막)
+        self.languages = list(languages or DEFAULT_TRANSCRIPT_LANGUAGES)
+        # 자막 수집 동시 작업 수와 모든 워커가 공유하는 요청 속도 제한 (0 이하면 제한 없음)
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = (
+            TokenBucket(requests_per_second) if requests_per_second and requests_per_second > 0
+            else None
+        )
+        # 자막 저장소 (get_many/set_many 제공, 호출 스레드에서만 사용)
+        self.transcript_store = None
+        # 자막 요청용 프록시 풀 (없으면 직접 연결)
+        self.proxy_pool = None
         
     def authenticate(self, client_secrets_file: str):
         """OAuth 2.0 인증 수행"""
@@ -172,7 +281,7 @@ class YouTubeTranscriptDownloader:
             }
             
             # 채널 페이지 요청
-            response = requests.get(channel_url, headers=headers)
+            response = requests.get(channel_url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"채널 페이지 요청 실패: HTTP {response.status_code}")
@@ -207,11 +316,38 @@ class YouTubeTranscriptDownloader:
             logger.error(f"웹 스크래핑 실패: {str(e)}")
             return None
 
-    def get_latest_videos(self, channel_id):
-        """채널의 전날 업로드된 모든 일반 영상 가져오기"""
-        try:
-            # 1. 채널 정보와 업로드 플레이리스트 ID 가져오기 (Playlists:list)
-            # 필요한 필드만 지정하여 데이터 전송량 최소화
+    def classify_video(self, title: str, duration_seconds: int) -> Dict:
+        """영상 필터링 조건 판정 (쇼츠, 스트리밍, 1시간 초과)"""
+        title_lower = title.lower()
+        return {
+            'is_shorts': '#shorts' in title_lower or 'shorts' in title_lower or duration_seconds <= 60,
+            'is_stream': any(keyword in title_lower for keyword in ['stream', '스트리밍', '생방송', 'live']),
+            'is_too_long': duration_seconds > 3600,  # 1시간 초과
+        }
+
+    def get_channel_uploads(self, channel_id, since, known_video_ids=None,
+                            uploads_playlist_id=None, max_pages=3):
+        """
+        채널의 since 이후 업로드 영상을 증분 수집
+        
+        업로드 플레이리스트를 최신순으로 훑다가 이미 알고 있는 영상이나
+        since 이전 영상을 만나면 중단하고, 새 영상만 세부 정보를 조회합니다.
+        
+        Args:
+            channel_id (str): 채널 ID
+            since (datetime): 이 시각 이후 업로드된 영상만 수집 (timezone-aware)
+            known_video_ids (set): 이미 수집된 영상 ID
+            uploads_playlist_id (str): 캐시된 업로드 플레이리스트 ID (없으면 조회)
+            max_pages (int): 최대 페이지 수 (페이지당 50개)
+        
+        Returns:
+            dict: {'channel_name', 'uploads_playlist_id', 'videos'} 또는 None (채널 없음)
+        """
+        known_video_ids = known_video_ids or set()
+        channel_name = None
+        
+        # 1. 채널 정보와 업로드 플레이리스트 ID 가져오기 (캐시가 없을 때만)
+        if not uploads_playlist_id:
             channel_response = self.youtube.channels().list(
                 part="contentDetails,snippet",
                 id=channel_id,
@@ -219,392 +355,260 @@ class YouTubeTranscriptDownloader:
             ).execute()
             
             if not channel_response.get('items'):
-                return None, None
+                return None
             
             channel_name = channel_response['items'][0]['snippet']['title']
             uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            videos = []
-            
-            # 현재 시간(KST) 기준으로 체크
-            kst = pytz.timezone('Asia/Seoul')
-            kst_now = datetime.now(kst)
-            
-            # 전날 오전 7시부터 오늘 오전 7시까지의 기간 설정
-            today_7am = kst_now.replace(hour=7, minute=0, second=0, microsecond=0)
-            yesterday_7am = today_7am - timedelta(days=1)
-            # 더 넓은 범위로 검색 (최근 7일)
-            seven_days_ago = today_7am - timedelta(days=7)
-            
-            logger.info(f"검색 기간: {yesterday_7am.strftime('%Y-%m-%d %H:%M')} ~ {today_7am.strftime('%Y-%m-%d %H:%M')} (KST)")
+        
+        # 2. 새로 업로드된 영상 ID 수집 (PlaylistItems:list)
+        new_items = []
+        next_page_token = None
+        for _ in range(max_pages):
+            playlist_items_params = {
+                "part": "snippet,contentDetails",
+                "playlistId": uploads_playlist_id,
+                "maxResults": 50,
+                "fields": "nextPageToken,items(contentDetails/videoId,snippet/publishedAt,snippet/title)"
+            }
+            if next_page_token:
+                playlist_items_params["pageToken"] = next_page_token
             
-            # 2. 업로드된 모든 비디오의 ID 가져오기 (PlaylistItems:list)
-            # 최대 50개씩, 3번 페이징하여 최대 150개 영상 확인 (더 오래된 영상은 필요 없음)
-            next_page_token = None
-            all_video_ids = []
-            max_pages = 3
-            current_page = 0
-            total_videos_checked = 0
-            videos_in_date_range = 0
+            playlist_items_response = self.youtube.playlistItems().list(**playlist_items_params).execute()
             
-            while current_page < max_pages:
-                # 필요한 필드만 요청하여 불필요한 데이터 전송 줄이기
-                playlist_items_params = {
-                    "part": "snippet,contentDetails",
-                    "playlistId": uploads_playlist_id,
-                    "maxResults": 50,
-                    "fields": "nextPageToken,items(contentDetails/videoId,snippet/publishedAt,snippet/title)"
-                }
-                
-                if next_page_token:
-                    playlist_items_params["pageToken"] = next_page_token
-                
-                playlist_items_response = self.youtube.playlistItems().list(**playlist_items_params).execute()
-                
-                # 페이지별로 동영상 정보 수집
-                video_ids_in_date_range = []
-                all_too_old = True
-                
-                for item in playlist_items_response.get('items', []):
-                    video_id = item['contentDetails']['videoId']
-                    video_title = item['snippet']['title']
-                    published_at = datetime.fromisoformat(item['snippet']['publishedAt'].replace('Z', '+00:00'))
-                    published_at_kst = published_at.astimezone(kst)
-                    total_videos_checked += 1
-                    
-                    logger.info(f"영상 확인: '{video_title}' (업로드: {published_at_kst.strftime('%Y-%m-%d %H:%M')})")
-                    
-                    # 전날 오전 7시부터 현재 시간 사이에 업로드된 영상만 필터링
-                    if yesterday_7am <= published_at_kst < kst_now:
-                        video_ids_in_date_range.append(video_id)
-                        videos_in_date_range += 1
-                        all_too_old = False
-                        logger.info(f"✅ 날짜 범위 내 영상: '{video_title}'")
-                    elif published_at_kst >= today_7am:
-                        # 너무 최근 영상은 무시하고 계속 확인
-                        all_too_old = False
-                        
-                    elif published_at_kst < seven_days_ago:
-                        # 너무 오래된 영상이 나오기 시작하면, 이후 영상도 모두 오래된 것일 가능성 높음                        
-                        pass
-                    else:
-                        all_too_old = False
-                
-                all_video_ids.extend(video_ids_in_date_range)
-                
-                # 다음 페이지 확인 또는 종료 조건
-                next_page_token = playlist_items_response.get('nextPageToken')
-                current_page += 1
+            reached_known = False
+            for item in playlist_items_response.get('items', []):
+                video_id = item['contentDetails']['videoId']
+                published_at = datetime.fromisoformat(item['snippet']['publishedAt'].replace('Z', '+00:00'))
                 
-                # 모든 영상이 너무 오래됐거나, 다음 페이지가 없으면 종료
-                if all_too_old or not next_page_token:
+                if video_id in known_video_ids or published_at < since:
+                    # 이후 영상은 모두 이미 수집했거나 너무 오래된 영상
+                    reached_known = True
                     break
+                new_items.append(video_id)
             
-            logger.info(f"총 {total_videos_checked}개 영상 확인, 날짜 범위 내 영상: {videos_in_date_range}개")
-            
-            # 해당 날짜 범위의 영상이 없으면 종료
-            if not all_video_ids:
-                logger.warning(f"날짜 범위 내 영상이 없습니다: {yesterday_7am.strftime('%Y-%m-%d %H:%M')} ~ {today_7am.strftime('%Y-%m-%d %H:%M')}")
-                return None, channel_name
-            
-            # 3. 영상 ID로 세부 정보 요청 (Videos:list)
-            # 50개씩 나누어 영상 정보 요청 (YouTube API 제한)
-            suitable_videos = 0
-            excluded_videos = 0
-            
-            for i in range(0, len(all_video_ids), 50):
-                batch_video_ids = all_video_ids[i:i+50]
-                
-                # 필요한 필드만 요청하여 데이터 전송량 줄이기
-                video_details_response = self.youtube.videos().list(
-                    part="contentDetails,snippet,statistics",
-                    id=','.join(batch_video_ids),
-                    fields="items(id,snippet(title,publishedAt),contentDetails/duration,statistics)"
-                ).execute()
-                
-                for item in video_details_response.get('items', []):
-                    video_id = item['id']
-                    duration = item['contentDetails']['duration']
-                    duration_seconds = self.parse_duration(duration)
-                    title = item['snippet']['title']
-                    title_lower = title.lower()
-                    
-                    logger.info(f"\n영상 세부 분석: '{title}'")
-                    logger.info(f"  - 길이: {duration_seconds}초 ({duration})")
-                    
-                    # 영상 필터링 조건
-                    is_shorts = '#shorts' in title_lower or 'shorts' in title_lower or duration_seconds <= 60
-                    is_stream = any(keyword in title_lower for keyword in ['stream', '스트리밍', '생방송', 'live'])
-                    is_too_long = duration_seconds > 3600  # 1시간 초과
-                    
-                    # 필터링 이유 로그
-                    exclusion_reasons = []
-                    if is_shorts:
-                        if duration_seconds <= 60:
-                            exclusion_reasons.append(f"쇼츠 영상 (길이: {duration_seconds}초)")
-                        else:
-                            exclusion_reasons.append("제목에 'shorts' 포함")
-                    if is_stream:
-                        exclusion_reasons.append("스트리밍/생방송 영상")
-                    if is_too_long:
-                        exclusion_reasons.append(f"너무 긴 영상 ({duration_seconds}초 > 3600초)")
-                    
-                    # 적절한 영상 조건
-                    if not any([is_shorts, is_stream, is_too_long]):
-                        logger.info(f"✅ 적절한 영상: '{title}' ({duration_seconds}초)")
-                        videos.append({
-                            'video_id': video_id,
-                            'title': item['snippet']['title'],
-                            'url': f"https://www.youtube.com/watch?v={video_id}",
-                            'published_at': item['snippet']['publishedAt'],
-                            'duration': duration_seconds
-                        })
-                        suitable_videos += 1
-                    else:
-                        logger.info(f"❌ 영상 제외: {', '.join(exclusion_reasons)}")
-                        excluded_videos += 1
-            
-            logger.info(f"\n필터링 결과:")
-            logger.info(f"  - 적절한 영상: {suitable_videos}개")
-            logger.info(f"  - 제외된 영상: {excluded_videos}개")
-            
-            return videos, channel_name
+            next_page_token = playlist_items_response.get('nextPageToken')
+            if reached_known or not next_page_token:
+                break
+        
+        # 3. 새 영상의 세부 정보 요청 (Videos:list, 50개씩)
+        videos = []
+        for i in range(0, len(new_items), 50):
+            batch_video_ids = new_items[i:i+50]
+            video_details_response = self.youtube.videos().list(
+                part="contentDetails,snippet",
+                id=','.join(batch_video_ids),
+                fields="items(id,snippet(title,publishedAt),contentDetails/duration)"
+            ).execute()
             
-        except Exception as e:
-            logger.error(f"최신 일반 영상 검색 실패: {str(e)}")
-            return None, None
+            for item in video_details_response.get('items', []):
+                video_id = item['id']
+                duration_seconds = self.parse_duration(item['contentDetails']['duration'])
+                title = item['snippet']['title']
+                videos.append({
+                    'video_id': video_id,
+                    'title': title,
+                    'url': f"https://www.youtube.com/watch?v={video_id}",
+                    'published_at': item['snippet']['publishedAt'],
+                    'duration': duration_seconds,
+                    **self.classify_video(title, duration_seconds)
+                })
+        
+        logger.info(f"채널 {channel_id}: 새 영상 {len(videos)}개 발견")
+        return {
+            'channel_name': channel_name,
+            'uploads_playlist_id': uploads_playlist_id,
+            'videos': videos
+        }
 
-    def get_channel_transcripts(self, channel_ids):
-        """각 채널의 전날 업로드된 모든 일반 영상 가져오기"""
+    def get_transcripts_for_videos(self, channel_videos):
+        """
+        영상 목록의 자막을 동시에 수집
+        
+        Args:
+            channel_videos (list): [(channel_id, channel_name, [video, ...]), ...]
+        
+        Returns:
+            dict: {channel_name: [video_with_transcript, ...]}
+        """
         transcripts = {}
         processed_channels = 0
         
-        # YouTube API가 인증되지 않은 경우 조기 반환
-        if not self.youtube:
-            logger.error("YouTube API가 인증되지 않았습니다. 자막 수집을 건너뜁니다.")
-            return {}
+        jobs = [
+            (channel_id, channel_name, video)
+            for channel_id, channel_name, videos in channel_videos
+            for video in videos
+        ]
         
-        # SOCKS 프록시 설정 (선택적)
-        proxies = None
-        try:
-            # Tor 프록시 연결 테스트
-            import requests
-            test_proxies = {
-                "https": "socks5://127.0.0.1:9050",
-                "http": "socks5://127.0.0.1:9050",
-            }
-            # 간단한 연결 테스트
-            response = requests.get("https://httpbin.org/ip", 
-                                  proxies=test_proxies, timeout=5)
-            if response.status_code == 200:
-                proxies = test_proxies
-                logger.info("Tor 프록시 연결 성공, SOCKS 프록시를 사용합니다.")
-            else:
-                logger.info("Tor 프록시 테스트 실패, 직접 연결을 사용합니다.")
-        except Exception as e:
-            logger.info(f"Tor 프록시를 사용할 수 없습니다: {str(e)}")
+        # 저장된 자막이 있으면 다시 내려받지 않음
+        cached = {}
+        if self.transcript_store is not None:
+            cached = self.transcript_store.get_many(
+                [video['video_id'] for _, _, video in jobs],
+                languages=self.languages
+            )
+        pending_jobs = [job for job in jobs if job[2]['video_id'] not in cached]
+        logger.info(f"자막 저장소 히트: {len(cached)}개, 새로 수집: {len(pending_jobs)}개")
+        
+        if self.proxy_pool is not None and self.proxy_pool.healthy:
+            logger.info(f"프록시 {len(self.proxy_pool.healthy)}개를 번갈아 사용합니다.")
+        else:
             logger.info("직접 연결을 사용합니다.")
         
+        # 모든 영상의 자막을 워커 풀에서 동시에 수집 (공유 토큰 버킷으로 요청 속도 제한)
+        logger.info(
+            f"자막 수집 시작: {len(pending_jobs)}개 영상, 동시 작업 {self.max_workers}개, "
+            f"초당 {self.rate_limiter.rate if self.rate_limiter else '무제한'}회 요청 제한"
+        )
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            fetched = list(executor.map(
+                lambda job: self._fetch_video_transcript(*job),
+                pending_jobs
+            ))
+        
+        fetched_results = {
+            job[2]['video_id']: result
+            for job, result in zip(pending_jobs, fetched)
+            if result
+        }
+        if self.transcript_store is not None:
+            self.transcript_store.set_many(list(fetched_results.values()))
+        
+        # 기존 순서대로 {채널 이름: [영상]} 형태로 재조립
+        for channel_id, channel_name, video in jobs:
+            if video['video_id'] in cached:
+                result = self._build_transcript_result(
+                    channel_id, video,
+                    cached[video['video_id']]['transcript'],
+                    cached[video['video_id']]['language']
+                )
+            else:
+                result = fetched_results.get(video['video_id'])
+            if result:
+                transcripts.setdefault(channel_name, []).append(result)
+        
+        for channel_name in transcripts:
+            processed_channels += 1
+            logger.info(f"✅ {channel_name}: 자막 처리 완료")
+                
+        logger.info(f"\n총 {processed_channels}개 채널의 영상을 처리했습니다.")
+        return transcripts
+
+    def _select_transcript(self, transcript_list):
+        """자막 목록에서 선호 순서에 맞는 자막 선택
+
+        선호 항목은 'ko', 'en' (직접 작성한 자막) 또는 'ko-auto', 'en-auto'
+        (자동 생성 자막) 형식이며, 'ko'는 'ko-KR' 같은 지역 코드도 포함합니다.
+
+        Returns:
+            (선호 항목, Transcript) 또는 (None, None)
+        """
+        tracks = list(transcript_list)
+        for preference in self.languages:
+            is_generated = preference.endswith('-auto')
+            code = preference[:-len('-auto')] if is_generated else preference
+            for track in tracks:
+                if track.is_generated != is_generated:
+                    continue
+                if track.language_code == code or track.language_code.startswith(f"{code}-"):
+                    return preference, track
+        return None, None
+
+    def _fetch_video_transcript(self, channel_id, channel_name, video):
+        """영상 하나의 자막 가져오기 (워커 스레드에서 실행)
+
+        자막 목록을 한 번 조회한 뒤 선호 순서에 맞는 자막 하나만 내려받습니다.
+        프록시 풀이 있으면 시도마다 다음 프록시를 사용합니다.
+        """
         # IP 차단 방지를 위한 재시도 설정
         max_retries = 5  # 재시도 횟수 줄임
         base_delay = 1.0  # 기본 대기 시간을 1초로 줄임
         max_delay = 8.0   # 최대 대기 시간 제한
         
-        # 채널 ID 목록을 한 번에 요청하여 채널 정보 가져오기 (배치 처리로 최적화)
-        channel_info_map = {}
-        if len(channel_ids) > 0:
-            for i in range(0, len(channel_ids), 50):  # 최대 50개씩 처리
-                batch_channel_ids = channel_ids[i:i+50]
+        logger.info(f"영상 정보:")
+        logger.info(f"제목: {video['title']}")
+        logger.info(f"URL: {video['url']}")
+        logger.info(f"게시일: {video['published_at']}")
+        
+        try:
+            transcript_list = None
+            language = None
+            
+            # 재시도 로직 적용
+            for attempt in range(max_retries):
+                proxies = self.proxy_pool.next() if self.proxy_pool else None
                 try:
-                    channels_response = self.youtube.channels().list(
-                        part="snippet",
-                        id=','.join(batch_channel_ids),
-                        fields="items(id,snippet/title)"  # 필요한 필드만 요청
-                    ).execute()
+                    logger.info("자막 목록 조회...")
+                    if self.rate_limiter:
+                        self.rate_limiter.acquire()
+                    available = YouTubeTranscriptApi.list_transcripts(
+                        video['video_id'],
+                        proxies=proxies
+                    )
                     
-                    for item in channels_response.get('items', []):
-                        channel_info_map[item['id']] = item['snippet']['title']
-                except Exception as e:
-                    logger.error(f"채널 정보 일괄 요청 중 오류: {str(e)}")
-        
-        for channel_id in channel_ids:
-            try:
-                # 미리 가져온 채널 정보 사용
-                if channel_id in channel_info_map:
-                    channel_name = channel_info_map[channel_id]
-                else:
-                    # 개별 요청으로 폴백
-                    try:
-                        channel_response = self.youtube.channels().list(
-                            part="snippet",
-                            id=channel_id,
-                            fields="items(snippet/title)"  # 필요한 필드만 요청
-                        ).execute()
-                        
-                        if not channel_response.get('items'):
-                            logger.error(f"채널 정보를 찾을 수 없음: {channel_id}")
-                            continue
-                            
-                        channel_name = channel_response['items'][0]['snippet']['title']
-                    except Exception as e:
-                        logger.error(f"채널 정보 요청 실패 ({channel_id}): {str(e)}")
+                    language, track = self._select_transcript(available)
+                    if track is None:
+                        logger.info(f"선호 언어({', '.join(self.languages)})의 자막을 찾을 수 없습니다.")
+                        break
+                    
+                    if self.rate_limiter:
+                        self.rate_limiter.acquire()
+                    transcript_list = track.fetch()
+                    logger.info(
+                        f"자막 선택: {language} ({track.language_code}, "
+                        f"{'자동 생성' if track.is_generated else '직접 작성'})"
+                    )
+                    break
+                    
+                except (TranscriptsDisabled, NoTranscriptFound):
+                    logger.info("어떤 자막도 찾을 수 없습니다.")
+                    break
+                except requests.exceptions.ConnectionError as e:
+                    if proxies and attempt < max_retries - 1:
+                        # 프록시 연결 오류는 해당 프록시를 제외하고 바로 재시도
+                        self.proxy_pool.mark_failed(proxies)
                         continue
-                
-                logger.info(f"\n=== {channel_name} 채널 처리 시작 ===")
-                
-                # 전날 업로드된 모든 영상 가져오기
-                videos, _ = self.get_latest_videos(channel_id)
-                if not videos:
-                    logger.error(f"{channel_name}: 적절한 일반 영상을 찾을 수 없음")
-                    continue
+                    logger.error(f"자막 가져오기 실패: {str(e)}")
+                    break
+                except Exception as e:
+                    if "Too Many Requests" in str(e) and attempt < max_retries - 1:
+                        # 지수 백오프 전략 적용 - 실패할 때마다 대기 시간 증가
+                        wait_time = base_delay * (2 ** attempt) + random.uniform(0, 1)
+                        wait_time = min(wait_time, max_delay)
+                        logger.warning(f"YouTube 요청 제한에 도달했습니다. {wait_time:.1f}초 후 재시도합니다. ({attempt+1}/{max_retries})")
+                        time.sleep(wait_time)
+                    else:
+                        # 다른 종류의 오류이거나 최대 재시도 횟수를 초과한 경우
+                        logger.error(f"자막 가져오기 실패: {str(e)}")
+                        break
+
+            if not transcript_list:
+                logger.warning(f"{channel_name}: 자막을 가져오지 못했습니다. ({video['video_id']})")
+                return None
 
-                channel_transcripts = []
-                for video in videos:
-                    logger.info(f"영상 정보:")
-                    logger.info(f"제목: {video['title']}")
-                    logger.info(f"URL: {video['url']}")
-                    logger.info(f"게시일: {video['published_at']}")
+            full_transcript = ' '.join([item['text'] for item in transcript_list])
+            logger.info(f"추출된 자막 길이: {len(full_transcript)} 글자")
 
-                    # 영상 정보를 가져온 후 요청 과부하 방지를 위해 약간의 지연 추가
-                    time.sleep(random.uniform(0.5, 1.0))  # 대기 시간 단축
-                    
-                    try:
-                        transcript_list = None
-                        language = None
-                        
-                        # 재시도 로직 적용
-                        for attempt in range(max_retries):
-                            try:
-                                # 자막을 개별적으로 시도하는 방식으로 변경
-                                logger.info("자막 가져오기 시도...")
-                                
-                                # 먼저 한국어 자막 시도
-                                try:
-                                    transcript_list = YouTubeTranscriptApi.get_transcript(
-                                        video['video_id'], 
-                                        languages=['ko'],
-                                        proxies=proxies
-                                    )
-                                    language = 'ko'
-                                    logger.info("한국어 자막을 찾았습니다.")
-                                    break
-                                except (TranscriptsDisabled, NoTranscriptFound):
-                                    logger.info("한국어 자막이 없습니다. 영어 자막을 시도합니다.")
-                                except YouTubeRequestFailed as e:
-                                    if "Too Many Requests" in str(e):
-                                        logger.warning(f"YouTube 요청 제한에 도달했습니다. 재시도 중... ({attempt+1}/{max_retries})")
-                                        # 지수 백오프 전략 적용 - 실패할 때마다 대기 시간 증가
-                                        wait_time = base_delay * (2 ** attempt) + random.uniform(0, 1)
-                                        wait_time = min(wait_time, max_delay)
-                                        logger.info(f"{wait_time:.1f}초 대기 후 재시도합니다.")
-                                        time.sleep(wait_time)
-                                        continue
-                                    else:
-                                        raise
-                                    
-                                # 영어 자막 시도
-                                try:
-                                    transcript_list = YouTubeTranscriptApi.get_transcript(
-                                        video['video_id'], 
-                                        languages=['en'],
-                                        proxies=proxies
-                                    )
-                                    language = 'en'
-                                    logger.info("영어 자막을 찾았습니다.")
-                                    break
-                                except (TranscriptsDisabled, NoTranscriptFound):
-                                    logger.info("영어 자막이 없습니다. 자동 생성 자막을 시도합니다.")
-                                except YouTubeRequestFailed as e:
-                                    if "Too Many Requests" in str(e):
-                                        # 이미 위에서 처리되었으므로 다시 루프
-                                        continue
-                                    else:
-                                        raise
-                                
-                                # 한국어 자동 생성 자막 시도
-                                try:
-                                    transcript_list = YouTubeTranscriptApi.get_transcript(
-                                        video['video_id'], 
-                                        languages=['ko-KR', 'ko'],
-                                        proxies=proxies
-                                    )
-                                    language = 'ko-auto'
-                                    logger.info("한국어 자동 생성 자막을 찾았습니다.")
-                                    break
-                                except (TranscriptsDisabled, NoTranscriptFound):
-                                    logger.info("한국어 자동 생성 자막이 없습니다. 영어 자동 생성 자막을 시도합니다.")
-                                except YouTubeRequestFailed as e:
-                                    if "Too Many Requests" in str(e):
-                                        # 이미 위에서 처리되었으므로 다시 루프
-                                        continue
-                                    else:
-                                        raise
-                                
-                                # 영어 자동 생성 자막 시도
-                                try:
-                                    transcript_list = YouTubeTranscriptApi.get_transcript(
-                                        video['video_id'], 
-                                        languages=['en-US', 'en'],
-                                        proxies=proxies
-                                    )
-                                    language = 'en-auto'
-                                    logger.info("영어 자동 생성 자막을 찾았습니다.")
-                                    break
-                                except (TranscriptsDisabled, NoTranscriptFound):
-                                    logger.info("어떤 자막도 찾을 수 없습니다.")
-                                except YouTubeRequestFailed as e:
-                                    if "Too Many Requests" in str(e):
-                                        # 이미 위에서 처리되었으므로 다시 루프
-                                        continue
-                                    else:
-                                        raise
-                                
-                            except Exception as e:
-                                if "Too Many Requests" in str(e) and attempt < max_retries - 1:
-                                    # 지수 백오프 전략 적용 - 실패할 때마다 대기 시간 증가
-                                    wait_time = base_delay * (2 ** attempt) + random.uniform(0, 1)
-                                    wait_time = min(wait_time, max_delay)
-                                    logger.warning(f"YouTube 요청 제한에 도달했습니다. {wait_time:.1f}초 후 재시도합니다. ({attempt+1}/{max_retries})")
-                                    time.sleep(wait_time)
-                                else:
-                                    # 다른 종류의 오류이거나 최대 재시도 횟수를 초과한 경우
-                                    logger.error(f"자막 가져오기 실패: {str(e)}")
-                                    break
-
-                        if not transcript_list:
-                            logger.warning(f"최대 시도 횟수({max_retries}회) 후에도 자막을 가져오지 못했습니다.")
-                            continue
-
-                        if transcript_list:
-                            full_transcript = ' '.join([item['text'] for item in transcript_list])
-                            logger.info(f"추출된 자막 길이: {len(full_transcript)} 글자")
-
-                            if len(full_transcript) < 100:
-                                logger.warning(f"{channel_name}: 자막이 너무 짧음 ({len(full_transcript)} 글자)")
-                                continue
-
-                            channel_transcripts.append({
-                                'title': video['title'],
-                                'transcript': full_transcript,
-                                'url': video['url'],
-                                'published_at': video['published_at'],
-                                'language': language
-                            })
-                            
-                            # 성공적으로 자막을 가져온 후 다음 비디오 처리 전 잠시 대기
-                            time.sleep(random.uniform(1.0, 1.5))  # 대기 시간 단축
-
-                    except Exception as e:
-                        logger.error(f"{channel_name} 자막 처리 중 오류: {str(e)}", exc_info=True)
-                        continue
-                
-                if channel_transcripts:
-                    transcripts[channel_name] = channel_transcripts
-                    processed_channels += 1
-                    logger.info(f"✅ {channel_name}: 자막 처리 완료")
-                
-            except Exception as e:
-                logger.error(f"채널 처리 중 오류 ({channel_id}): {str(e)}", exc_info=True)
-                continue
-                
-        logger.info(f"\n총 {processed_channels}개 채널의 영상을 처리했습니다.")
-        return transcripts
\ No newline at end of file
+            if len(full_transcript) < 100:
+                logger.warning(f"{channel_name}: 자막이 너무 짧음 ({len(full_transcript)} 글자)")
+                return None
+
+            return self._build_transcript_result(
+                channel_id, video, full_transcript, language
+            )
+
+        except Exception as e:
+            logger.error(f"{channel_name} 자막 처리 중 오류: {str(e)}", exc_info=True)
+            return None
+
+    def _build_transcript_result(self, channel_id, video, transcript, language):
+        """자막 수집 결과 형식"""
+        return {
+            'video_id': video['video_id'],
+            'channel_id': channel_id,
+            'title': video['title'],
+            'transcript': transcript,
+            'url': video['url'],
+            'published_at': video['published_at'],
+            'language': language
+        }
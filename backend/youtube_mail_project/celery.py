@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 from celery import Celery
 from celery.schedules import crontab
 
@@ -16,8 +17,22 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Django 앱에서 태스크 자동 발견
 app.autodiscover_tasks()
 
+# 자막 프록시 상태 확인 주기 (결과 캐시 유지 시간도 이 값을 기준으로 계산)
+from django.conf import settings  # noqa: E402
+
+PROXY_CHECK_INTERVAL_MINUTES = max(
+    1, getattr(settings, 'TRANSCRIPT_PROXY_CHECK_INTERVAL_MINUTES', 10)
+)
+
 # 스케줄 설정
 app.conf.beat_schedule = {
+    # 새 업로드 영상 수집 (매시 10분, 발송 준비 작업 전에 Video 테이블 갱신)
+    'discover-new-videos': {
+        'task': 'subscriptions.tasks.discover_new_videos',
+        'schedule': crontab(minute=10, hour='*'),
+        'options': {'timezone': 'Asia/Seoul'}
+    },
+    
     # 이메일 준비 작업 (정확한 시간에 실행)
     'prepare-emails-for-00-30': {
         'task': 'subscriptions.tasks.prepare_scheduled_emails',
@@ -42,6 +57,13 @@ app.conf.beat_schedule = {
         'options': {'timezone': 'Asia/Seoul'}
     },
     
+    # 발송 대기열 점검 작업 (5분마다, 중단된 발송 작업이 남긴 메일 재등록)
+    'drain-email-outbox': {
+        'task': 'subscriptions.tasks.drain_outbox',
+        'schedule': crontab(minute='2-59/5'),
+        'options': {'timezone': 'Asia/Seoul'}
+    },
+    
     # 캐시 정리 작업 (매일 새벽 2시)
     'cleanup-cache': {
         'task': 'subscriptions.tasks.cleanup_old_cache',
@@ -49,6 +71,27 @@ app.conf.beat_schedule = {
         'options': {'timezone': 'Asia/Seoul'}
     },
     
+    # 요약 배치 결과 확인 작업 (10분마다, 배치 모드에서만 처리할 배치가 생김)
+    'check-summary-batches': {
+        'task': 'subscriptions.tasks.check_summary_batches',
+        'schedule': crontab(minute='5-59/10'),
+        'options': {'timezone': 'Asia/Seoul'}
+    },
+    
+    # 자막 프록시 상태 확인 작업 (TRANSCRIPT_PROXY_CHECK_INTERVAL_MINUTES마다, 기본 10분)
+    'check-transcript-proxies': {
+        'task': 'subscriptions.tasks.check_transcript_proxies',
+        'schedule': timedelta(minutes=PROXY_CHECK_INTERVAL_MINUTES),
+        'options': {'timezone': 'Asia/Seoul'}
+    },
+    
+    # 자막 보관 기간 정리 작업 (매일 새벽 2시 30분)
+    'cleanup-transcripts': {
+        'task': 'subscriptions.tasks.cleanup_old_transcripts',
+        'schedule': crontab(minute=30, hour=2),
+        'options': {'timezone': 'Asia/Seoul'}
+    },
+    
     # 토큰 자동 갱신 작업 (매일 새벽 1시)
     'refresh-google-token': {
         'task': 'subscriptions.tasks.refresh_google_token',
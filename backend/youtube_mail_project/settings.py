@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 from pathlib import Path
 import os
-from decouple import config
+from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -180,44 +180,144 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
-# 캐시 설정 (로컬 메모리 캐시 사용)
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
-        'TIMEOUT': 3600,  # 기본 1시간
-    }
-}
+# 캐시 설정
+# 준비 작업(prepare)과 발송 작업(send)이 서로 다른 Celery 워커 프로세스에서
+# 실행되므로 모든 프로세스가 공유하는 Redis 캐시를 사용합니다.
+# REDIS_URL을 빈 값으로 설정하면 로컬 메모리 캐시(프로세스별)를 사용합니다.
+REDIS_URL = config('REDIS_URL', default='redis://redis:6379/1')
 
-# Redis 캐시 설정 (Docker 문제 해결 후 사용)
-# CACHES = {
-#     'default': {
-#         'BACKEND': 'django_redis.cache.RedisCache',
-#         'LOCATION': config('REDIS_URL', default='redis://redis:6379/1'),
-#         'OPTIONS': {
-#             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-#         },
-#         'KEY_PREFIX': 'youtube_mail',
-#         'TIMEOUT': 3600,  # 기본 1시간
-#     }
-# }
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+                # 준비된 HTML 콘텐츠가 크므로 zlib 압축 후 저장
+                'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+                'SOCKET_CONNECT_TIMEOUT': 5,
+                'SOCKET_TIMEOUT': 5,
+            },
+            'KEY_PREFIX': config('CACHE_KEY_PREFIX', default='youtube_mail'),
+            'TIMEOUT': 3600,  # 기본 1시간
+        }
+    }
+    # 테스트에서 fakeredis 사용 시: REDIS_CONNECTION_CLASS=fakeredis.FakeConnection
+    # (로컬 redis-server 사용 시에는 REDIS_URL만 지정)
+    REDIS_CONNECTION_CLASS = config('REDIS_CONNECTION_CLASS', default='')
+    if REDIS_CONNECTION_CLASS:
+        from django.utils.module_loading import import_string
+        CACHES['default']['OPTIONS']['CONNECTION_POOL_KWARGS'] = {
+            'connection_class': import_string(REDIS_CONNECTION_CLASS),
+        }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+            'TIMEOUT': 3600,  # 기본 1시간
+        }
+    }
 
 # YouTube API 설정
 YOUTUBE_API_CREDENTIALS_PATH = os.path.join(BASE_DIR, 'credentials.json')
 YOUTUBE_API_TOKEN_PATH = os.path.join(BASE_DIR, 'token.json')
 YOUTUBE_API_KEY = config('YOUTUBE_API_KEY', default='')
 
+# 자막 수집 설정 (동시 작업 수, 모든 워커가 공유하는 초당 요청 수)
+TRANSCRIPT_FETCH_CONCURRENCY = config(
+    'TRANSCRIPT_FETCH_CONCURRENCY', default=4, cast=int
+)
+TRANSCRIPT_FETCH_RATE = config('TRANSCRIPT_FETCH_RATE', default=2.0, cast=float)
+# 자막 선호 순서 ('-auto'는 자동 생성 자막)
+TRANSCRIPT_LANGUAGES = config(
+    'TRANSCRIPT_LANGUAGES', default='ko,en,ko-auto,en-auto', cast=Csv()
+)
+# 자막 요청용 프록시 목록 (예: socks5://127.0.0.1:9050, 비우면 직접 연결)
+TRANSCRIPT_PROXIES = config('TRANSCRIPT_PROXIES', default='', cast=Csv())
+TRANSCRIPT_PROXY_CHECK_URL = config(
+    'TRANSCRIPT_PROXY_CHECK_URL', default='https://httpbin.org/ip'
+)
+TRANSCRIPT_PROXY_CHECK_INTERVAL_MINUTES = config(
+    'TRANSCRIPT_PROXY_CHECK_INTERVAL_MINUTES', default=10, cast=int
+)
+# 저장된 자막 보관 기간 (일)
+TRANSCRIPT_RETENTION_DAYS = config('TRANSCRIPT_RETENTION_DAYS', default=14, cast=int)
+
+# 영상 수집 설정 (이 시간 안에 수집된 채널은 발송 준비 시 다시 수집하지 않음)
+VIDEO_DISCOVERY_MAX_AGE_MINUTES = config(
+    'VIDEO_DISCOVERY_MAX_AGE_MINUTES', default=90, cast=int
+)
+
 # OpenAI 설정
 OPENAI_API_KEY = config('OPENAI_API_KEY', default='')
+# OpenAI 호환 API 주소 (비우면 기본 주소, 테스트용 대체 서버 지정 가능)
+OPENAI_BASE_URL = config('OPENAI_BASE_URL', default='')
+# 배치 모드: 정기 영상 수집 시 새 영상 요약을 Batch API로 미리 제출 (약 절반 비용)
+SUMMARY_BATCH_MODE = config('SUMMARY_BATCH_MODE', default=False, cast=bool)
+# 요약 동시 요청 수 및 분당 요청/토큰 예산 (0이면 제한 없음)
+SUMMARY_CONCURRENCY = config('SUMMARY_CONCURRENCY', default=8, cast=int)
+OPENAI_REQUESTS_PER_MINUTE = config('OPENAI_REQUESTS_PER_MINUTE', default=500, cast=int)
+OPENAI_TOKENS_PER_MINUTE = config('OPENAI_TOKENS_PER_MINUTE', default=300000, cast=int)
+# 요약 전 자막 정리 (비발화 표시/추임새 제거) 및 추출 요약 토큰 예산 (0이면 추출 요약 안 함)
+TRANSCRIPT_PREPROCESS = config('TRANSCRIPT_PREPROCESS', default=True, cast=bool)
+TRANSCRIPT_TOKEN_BUDGET = config('TRANSCRIPT_TOKEN_BUDGET', default=0, cast=int)
+# 긴 자막 분할 요약 기준 (토큰 수): 기준보다 긴 자막은 조각별 요약 후 합침
+SUMMARY_CHUNK_THRESHOLD_TOKENS = config(
+    'SUMMARY_CHUNK_THRESHOLD_TOKENS', default=12000, cast=int
+)
+SUMMARY_CHUNK_SIZE_TOKENS = config('SUMMARY_CHUNK_SIZE_TOKENS', default=6000, cast=int)
+SUMMARY_CHUNK_OVERLAP_TOKENS = config(
+    'SUMMARY_CHUNK_OVERLAP_TOKENS', default=200, cast=int
+)
+SUMMARY_CHUNK_MAX_TOKENS = config('SUMMARY_CHUNK_MAX_TOKENS', default=1024, cast=int)
+# 짧은 영상(정리된 자막 토큰 수 이하)은 저렴한 모델로 요약 (0이면 사용 안 함)
+SUMMARY_SHORT_MODEL = config('SUMMARY_SHORT_MODEL', default='gpt-4o-mini')
+SUMMARY_SHORT_VIDEO_TOKENS = config('SUMMARY_SHORT_VIDEO_TOKENS', default=3000, cast=int)
+
+# LLM 제공자 설정 (LLM_PROVIDER_ORDER 순서대로 사용, 느리거나 실패하면 다음 제공자로 전환)
+LLM_PROVIDER_ORDER = config('LLM_PROVIDER_ORDER', default='openai,azure,local', cast=Csv())
+# 요청 제한 시간 (초, 넘기면 다음 제공자로 전환)
+LLM_REQUEST_TIMEOUT = config('LLM_REQUEST_TIMEOUT', default=60.0, cast=float)
+# Azure OpenAI (배포 이름은 모델별로 지정)
+AZURE_OPENAI_API_KEY = config('AZURE_OPENAI_API_KEY', default='')
+AZURE_OPENAI_ENDPOINT = config('AZURE_OPENAI_ENDPOINT', default='')
+AZURE_OPENAI_DEPLOYMENT = config('AZURE_OPENAI_DEPLOYMENT', default='gpt-4o')
+AZURE_OPENAI_MINI_DEPLOYMENT = config('AZURE_OPENAI_MINI_DEPLOYMENT', default='')
+AZURE_OPENAI_API_VERSION = config('AZURE_OPENAI_API_VERSION', default='2024-08-01-preview')
+# 로컬 OpenAI 호환 서버 (vLLM, Ollama 등)
+LOCAL_LLM_BASE_URL = config('LOCAL_LLM_BASE_URL', default='')
+LOCAL_LLM_API_KEY = config('LOCAL_LLM_API_KEY', default='')
+LOCAL_LLM_MODEL = config('LOCAL_LLM_MODEL', default='')
 
 # 이메일 설정
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# SMTP 연결을 재사용하는 백엔드 (기본 SMTP 백엔드로 되돌리려면 EMAIL_BACKEND 지정)
+EMAIL_BACKEND = config(
+    'EMAIL_BACKEND', default='subscriptions.mail_backends.PooledSMTPEmailBackend'
+)
+# 프로세스당 유지할 SMTP 연결 수, 이 시간(초)보다 오래 쉰 연결은 새로 연결
+EMAIL_POOL_SIZE = config('EMAIL_POOL_SIZE', default=4, cast=int)
+EMAIL_POOL_IDLE_TIMEOUT = config('EMAIL_POOL_IDLE_TIMEOUT', default=60, cast=int)
 EMAIL_HOST = config('EMAIL_HOST', default='smtp.gmail.com')
 EMAIL_PORT = config('EMAIL_PORT', default=587, cast=int)
 EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=True, cast=bool)
 EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='')
+# 발송 로그를 모아서 저장하는 단위 (bulk_create 한 번에 저장할 건수)
+EMAIL_LOG_BATCH_SIZE = config('EMAIL_LOG_BATCH_SIZE', default=500, cast=int)
+# Gmail API 동시 발송 수, 메일별 재시도 횟수(요청 제한 429/403 응답), 초당 발송 수 제한(0이면 제한 없음),
+# 한 번에 렌더링해 발송하는 메일 수
+GMAIL_SEND_CONCURRENCY = config('GMAIL_SEND_CONCURRENCY', default=8, cast=int)
+GMAIL_SEND_MAX_RETRIES = config('GMAIL_SEND_MAX_RETRIES', default=5, cast=int)
+GMAIL_SEND_RATE = config('GMAIL_SEND_RATE', default=0.0, cast=float)
+GMAIL_SEND_CHUNK_SIZE = config('GMAIL_SEND_CHUNK_SIZE', default=200, cast=int)
+# 발송 대기열: 발송 작업 하나가 처리하는 메일 수, 선점 후 응답이 없으면 중단으로 보는 시간(초),
+# 발송 예정 시각 이후 발송을 포기하는 시간(분), 발송 완료/실패 메일 보관 기간(일)
+OUTBOX_CHUNK_SIZE = config('OUTBOX_CHUNK_SIZE', default=20, cast=int)
+OUTBOX_CLAIM_TIMEOUT = config('OUTBOX_CLAIM_TIMEOUT', default=600, cast=int)
+OUTBOX_MAX_DELAY_MINUTES = config('OUTBOX_MAX_DELAY_MINUTES', default=180, cast=int)
+OUTBOX_RETENTION_DAYS = config('OUTBOX_RETENTION_DAYS', default=7, cast=int)
 
 # Gmail API 설정 (OAuth 방식)
 GMAIL_API_CREDENTIALS_PATH = os.path.join(BASE_DIR, 'credentials.json')